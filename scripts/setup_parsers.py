@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Install tree-sitter language grammars for supported languages."""
 
-import os
+import importlib.util
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -12,6 +14,59 @@ except ImportError:
     sys.exit(1)
 
 
+def install_prebuilt_languages():
+    """Install pre-built tree-sitter-languages bindings if not already present."""
+    if importlib.util.find_spec("tree_sitter_languages") is not None:
+        print("tree-sitter-languages already installed")
+        return
+    subprocess.run(
+        [sys.executable, "-m", "pip", "install", "--prefer-binary", "tree-sitter-languages"],
+        check=False,
+    )
+    print("Installed tree-sitter-languages package")
+
+
+def clone_grammar(lang_name, repo_url, lang_dir):
+    """Shallow-clone a single grammar repository if it is not present."""
+    if lang_dir.exists():
+        print(f"[{lang_name}] grammar already exists")
+        return True
+
+    print(f"[{lang_name}] cloning grammar...")
+    result = subprocess.run(
+        [
+            "git",
+            "clone",
+            "--depth=1",
+            "--filter=blob:none",
+            "--single-branch",
+            "--no-tags",
+            repo_url,
+            str(lang_dir),
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        print(f"[{lang_name}] clone failed: {result.stderr.strip()}")
+        return False
+    print(f"[{lang_name}] cloned")
+    return True
+
+
+def needs_rebuild(lib_path, grammar_dirs):
+    """Check whether the shared library is missing or older than any grammar."""
+    if not lib_path.exists():
+        return True
+    lib_mtime = lib_path.stat().st_mtime
+    for grammar_dir in grammar_dirs:
+        parser_c = grammar_dir / "src" / "parser.c"
+        if parser_c.exists() and parser_c.stat().st_mtime > lib_mtime:
+            return True
+    return False
+
+
 def download_and_build_grammars():
     """Download and build tree-sitter language grammars."""
 
@@ -33,15 +88,16 @@ def download_and_build_grammars():
     print("Installing tree-sitter language grammars...")
     print(f"Build directory: {build_dir}")
 
-    # Clone repositories if they don't exist
-    for lang_name, repo_url in languages.items():
-        lang_dir = languages_dir / f"tree-sitter-{lang_name}"
-
-        if not lang_dir.exists():
-            print(f"Cloning {lang_name} grammar...")
-            os.system(f"git clone --depth=1 {repo_url} {lang_dir}")
-        else:
-            print(f"{lang_name} grammar already exists")
+    # Clone missing repositories in parallel
+    with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+        futures = [
+            executor.submit(
+                clone_grammar, lang_name, repo_url, languages_dir / f"tree-sitter-{lang_name}"
+            )
+            for lang_name, repo_url in languages.items()
+        ]
+        for future in futures:
+            future.result()
 
     # Build shared library
     print("\nBuilding shared library...")
@@ -64,20 +120,20 @@ def download_and_build_grammars():
         if ts_path.exists():
             language_paths.append(ts_path)
 
-    try:
-        Language.build_library(
-            str(lib_path),
-            [str(p) for p in language_paths if p.exists()]
-        )
-        print(f"Successfully built language library at: {lib_path}")
-    except Exception as e:
-        print(f"Error building language library: {e}")
-        print("\nTrying alternative method...")
-
-        # Try installing via pip packages
-        print("Installing pre-built language bindings...")
-        os.system("pip install tree-sitter-languages")
-        print("Installed tree-sitter-languages package")
+    existing_paths = [p for p in language_paths if p.exists()]
+    if not needs_rebuild(lib_path, existing_paths):
+        print(f"Language library is up to date: {lib_path}")
+    else:
+        try:
+            Language.build_library(str(lib_path), [str(p) for p in existing_paths])
+            print(f"Successfully built language library at: {lib_path}")
+        except Exception as e:
+            print(f"Error building language library: {e}")
+            print("\nTrying alternative method...")
+
+            # Try installing via pip packages
+            print("Installing pre-built language bindings...")
+            install_prebuilt_languages()
 
     print("\nLanguage grammar setup complete!")
     return True
@@ -89,5 +145,4 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\nSetup failed: {e}")
         print("\nFalling back to pip package installation...")
-        os.system("pip install tree-sitter-languages")
-        print("Installed tree-sitter-languages as fallback")
+        install_prebuilt_languages()
@@ -7,6 +7,16 @@ from pathlib import Path
 readme_file = Path(__file__).parent / "README.md"
 long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
 
+# Optional compiled speedups; pure-Python fallbacks are used without Cython
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["src/analysis/_fastwalk.pyx", "src/graph/_fastextract.pyx"], language_level=3
+    )
+except ImportError:
+    ext_modules = []
+
 # Read requirements
 requirements_file = Path(__file__).parent / "requirements.txt"
 requirements = []
@@ -44,7 +54,9 @@ setup(
     install_requires=requirements,
     extras_require={
         "dev": dev_requirements,
+        "fast": ["Cython>=3.0", "numba>=0.57", "hyperscan>=0.4", "orjson>=3.9"],
     },
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "code-review=src.main:main",
@@ -1,5 +1,6 @@
 """Static analysis: control flow, data flow, symbol tables, taint analysis."""
 
+from src.analysis.cache import AnalysisCache
 from src.analysis.cfg import BasicBlock, ControlFlowGraph
 from src.analysis.cfg_builder import CFGBuilder
 from src.analysis.symbol_table import Symbol, Scope, SymbolTable
@@ -18,6 +19,7 @@ from src.analysis.taint import (
 )
 
 __all__ = [
+    "AnalysisCache",
     "BasicBlock",
     "ControlFlowGraph",
     "CFGBuilder",
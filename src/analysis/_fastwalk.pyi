@@ -0,0 +1,5 @@
+from typing import List, Tuple
+
+from src.parsing.ast_nodes import ASTNode
+
+def find_names(node: ASTNode) -> Tuple[List[str], List[str]]: ...
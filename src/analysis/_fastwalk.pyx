@@ -0,0 +1,44 @@
+# cython: language_level=3
+"""Compiled version of DataFlowAnalyzer._find_names.
+
+Built only when Cython is available at install time; data_flow.py
+falls back to the pure-Python implementation otherwise. Semantics must
+match DataFlowAnalyzer._find_names exactly.
+"""
+
+import sys
+
+from src.parsing.ast_nodes import NodeType
+
+cdef object IDENTIFIER = NodeType.IDENTIFIER
+cdef object ASSIGNMENT = NodeType.ASSIGNMENT
+
+
+def find_names(node):
+    """Return (defined, used) variable names for a statement node."""
+    cdef list defined = []
+    cdef list used = []
+    cdef list stack
+    cdef list children
+    cdef object target = None
+    cdef object child
+    cdef Py_ssize_t i, n
+    intern = sys.intern
+
+    if node.node_type == ASSIGNMENT:
+        for child in node.children:
+            if child.node_type == IDENTIFIER and child.name:
+                target = child
+                defined.append(intern(child.name))
+                break  # Only first identifier is the target
+
+    stack = list(node.children)
+    while stack:
+        child = stack.pop()
+        if child is not target and child.node_type == IDENTIFIER and child.name:
+            used.append(intern(child.name))
+        children = child.children
+        n = len(children)
+        for i in range(n):
+            stack.append(children[i])
+    return defined, used
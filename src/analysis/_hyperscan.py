@@ -0,0 +1,51 @@
+"""Optional Hyperscan multi-pattern scanner for taint patterns.
+
+Hyperscan compiles a whole pattern set into one automaton and reports
+every pattern that matches in a single pass over the text. It is only
+used when the package is installed and accepts every pattern; callers
+fall back to the re module otherwise.
+"""
+
+from typing import Callable, List, Optional, Set
+
+try:
+    import hyperscan
+except ImportError:  # Hyperscan not installed
+    hyperscan = None
+
+
+def compile_scanner(patterns: List[str]) -> Optional[Callable[[str], Set[int]]]:
+    """Compile patterns into a scanner returning the indices that match.
+
+    Args:
+        patterns: Regex patterns; index i in the result refers to patterns[i].
+
+    Returns:
+        A scan function, or None when Hyperscan is unavailable or rejects
+        a pattern (e.g. backreferences, which it does not support).
+    """
+    if hyperscan is None or not patterns:
+        return None
+
+    flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_ALLOWEMPTY
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[p.encode("utf-8") for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except hyperscan.error:
+        return None
+
+    def scan(text: str) -> Set[int]:
+        found: Set[int] = set()
+
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+            found.add(pattern_id)
+
+        db.scan(text.encode("utf-8", "replace"), match_event_handler=on_match)
+        return found
+
+    return scan
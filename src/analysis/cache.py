@@ -0,0 +1,84 @@
+"""Persistent cache for per-file analysis artifacts.
+
+Artifacts (CFGs, data flow results, symbol tables) are pickled and
+stored in SQLite keyed by file path, content digest, and artifact kind.
+A changed file gets a new digest, so stale entries are never returned.
+"""
+
+import hashlib
+import pickle
+import sqlite3
+from typing import Any, Callable, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ast (
+    path TEXT NOT NULL,
+    sha BLOB NOT NULL,
+    kind TEXT NOT NULL,
+    blob BLOB NOT NULL,
+    PRIMARY KEY (path, sha, kind)
+)
+"""
+
+
+def file_digest(data: bytes) -> bytes:
+    """Compute the content digest used as a cache key."""
+    return hashlib.sha256(data).digest()
+
+
+class AnalysisCache:
+    """SQLite-backed cache of pickled analysis artifacts.
+
+    Args:
+        db_path: Path to the SQLite database (":memory:" for tests).
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, path: str, sha: bytes, kind: str) -> Optional[bytes]:
+        """Get the raw cached blob, or None on a miss."""
+        row = self._conn.execute(
+            "SELECT blob FROM ast WHERE path = ? AND sha = ? AND kind = ?",
+            (path, sha, kind),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def put(self, path: str, sha: bytes, kind: str, blob: bytes) -> None:
+        """Store a raw blob, dropping entries for older versions of the file."""
+        self._conn.execute("DELETE FROM ast WHERE path = ? AND sha != ?", (path, sha))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO ast (path, sha, kind, blob) VALUES (?, ?, ?, ?)",
+            (path, sha, kind, blob),
+        )
+        self._conn.commit()
+
+    def load(self, path: str, sha: bytes, kind: str) -> Optional[Any]:
+        """Get the unpickled artifact, or None on a miss."""
+        blob = self.get(path, sha, kind)
+        return pickle.loads(blob) if blob is not None else None
+
+    def store(self, path: str, sha: bytes, kind: str, value: Any) -> None:
+        """Pickle and store an artifact."""
+        self.put(path, sha, kind, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def get_or_compute(
+        self,
+        path: str,
+        sha: bytes,
+        kind: str,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Return the cached artifact, computing and storing it on a miss."""
+        blob = self.get(path, sha, kind)
+        if blob is not None:
+            return pickle.loads(blob)
+        value = compute()
+        self.store(path, sha, kind, value)
+        return value
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
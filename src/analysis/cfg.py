@@ -1,12 +1,14 @@
 """Control flow graph representation."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-
-import networkx as nx
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from src.parsing.ast_nodes import ASTNode
 
+if TYPE_CHECKING:
+    import networkx as nx
+
 
 @dataclass
 class BasicBlock:
@@ -33,24 +35,55 @@ class ControlFlowGraph:
     """Control flow graph for a single function/method.
 
     Nodes are BasicBlocks. Edges represent control flow with labels
-    like 'next', 'true', 'false', 'exception'.
+    like 'next', 'true', 'false', 'exception'. Adjacency is kept in
+    plain dicts; a NetworkX view is only built on request.
     """
 
     def __init__(self, function_name: str) -> None:
         self.function_name = function_name
-        self._graph: nx.DiGraph = nx.DiGraph()
         self._blocks: Dict[str, BasicBlock] = {}
+        self._blocks_view: Mapping[str, BasicBlock] = MappingProxyType(self._blocks)
+        self._succ: Dict[str, List[str]] = {}
+        self._pred: Dict[str, List[str]] = {}
+        self._labels: Dict[Tuple[str, str], str] = {}
         self.entry_block: Optional[BasicBlock] = None
         self.exit_block: Optional[BasicBlock] = None
+        # Lazily built by _build_sccs; reset whenever the graph changes
+        self._scc_of: Optional[Dict[str, int]] = None
+        self._scc_reach: List[int] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Mapping proxies cannot be pickled; the view is rebuilt on load
+        state = self.__dict__.copy()
+        del state["_blocks_view"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._blocks_view = MappingProxyType(self._blocks)
 
     def add_block(self, block: BasicBlock) -> None:
         """Add a basic block to the CFG."""
+        self._scc_of = None
         self._blocks[block.id] = block
-        self._graph.add_node(block.id)
+        self._succ.setdefault(block.id, [])
+        self._pred.setdefault(block.id, [])
 
     def add_edge(self, from_id: str, to_id: str, label: str = "next") -> None:
-        """Add a control flow edge between blocks."""
-        self._graph.add_edge(from_id, to_id, label=label)
+        """Add a control flow edge between blocks.
+
+        Adding an existing edge again only replaces its label.
+        """
+        key = (from_id, to_id)
+        if key not in self._labels:
+            self._scc_of = None
+            self._succ.setdefault(from_id, []).append(to_id)
+            self._pred.setdefault(to_id, []).append(from_id)
+        self._labels[key] = label
+
+    def has_edge(self, from_id: str, to_id: str) -> bool:
+        """Check whether an edge exists between two blocks."""
+        return (from_id, to_id) in self._labels
 
     def get_block(self, block_id: str) -> Optional[BasicBlock]:
         """Get a block by ID."""
@@ -58,22 +91,114 @@ class ControlFlowGraph:
 
     def get_successors(self, block_id: str) -> List[BasicBlock]:
         """Get successor blocks."""
-        return [
-            self._blocks[nid] for nid in self._graph.successors(block_id) if nid in self._blocks
-        ]
+        return [self._blocks[nid] for nid in self._succ.get(block_id, ()) if nid in self._blocks]
 
     def get_predecessors(self, block_id: str) -> List[BasicBlock]:
         """Get predecessor blocks."""
-        return [
-            self._blocks[nid] for nid in self._graph.predecessors(block_id) if nid in self._blocks
-        ]
+        return [self._blocks[nid] for nid in self._pred.get(block_id, ()) if nid in self._blocks]
+
+    def successor_ids(self, block_id: str) -> List[str]:
+        """Get successor block IDs (may include IDs without a block)."""
+        return self._succ.get(block_id, [])
+
+    def predecessor_ids(self, block_id: str) -> List[str]:
+        """Get predecessor block IDs (may include IDs without a block)."""
+        return self._pred.get(block_id, [])
+
+    def can_reach(self, from_id: str, to_id: str) -> bool:
+        """Check whether a path of blocks leads from from_id to to_id.
+
+        A block always reaches itself. Answered from the strongly
+        connected components, which are computed once per graph shape.
+        """
+        if from_id == to_id:
+            return True
+        if self._scc_of is None:
+            self._build_sccs()
+        assert self._scc_of is not None
+        src = self._scc_of.get(from_id)
+        dst = self._scc_of.get(to_id)
+        if src is None or dst is None:
+            return False
+        return bool(self._scc_reach[src] >> dst & 1)
+
+    def scc_ids(self) -> Mapping[str, int]:
+        """Map each block ID to its strongly connected component index.
+
+        Components are numbered in reverse topological order: an edge
+        between two components always goes to the lower index.
+        """
+        if self._scc_of is None:
+            self._build_sccs()
+        assert self._scc_of is not None
+        return MappingProxyType(self._scc_of)
+
+    def _build_sccs(self) -> None:
+        """Find strongly connected components with an iterative Tarjan walk."""
+        blocks = self._blocks
+        succ = self._succ
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        scc_of: Dict[str, int] = {}
+        members: List[List[str]] = []
+
+        for root in blocks:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(succ.get(root, ())))]
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in blocks:
+                        continue
+                    if child not in index:
+                        index[child] = low[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(succ.get(child, ()))))
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component: List[str] = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            scc_of[member] = len(members)
+                            component.append(member)
+                            if member == node:
+                                break
+                        members.append(component)
+
+        self._scc_of = scc_of
+        self._scc_reach = self._fold_reach(members, scc_of)
+
+    def _fold_reach(self, members: List[List[str]], scc_of: Dict[str, int]) -> List[int]:
+        """Compute, per component, the bitmask of components it can reach."""
+        # Successor components always have lower indices, so one pass suffices
+        reach = [0] * len(members)
+        for comp, component in enumerate(members):
+            mask = 1 << comp
+            for member in component:
+                for child in self._succ.get(member, ()):
+                    if child in scc_of:
+                        mask |= reach[scc_of[child]]
+            reach[comp] = mask
+        return reach
 
     def get_edge_label(self, from_id: str, to_id: str) -> Optional[str]:
         """Get the label on an edge."""
-        if self._graph.has_edge(from_id, to_id):
-            label = self._graph.edges[from_id, to_id].get("label")
-            return str(label) if label is not None else None
-        return None
+        return self._labels.get((from_id, to_id))
 
     @property
     def block_count(self) -> int:
@@ -83,14 +208,24 @@ class ControlFlowGraph:
     @property
     def edge_count(self) -> int:
         """Number of control flow edges."""
-        return int(self._graph.number_of_edges())
+        return len(self._labels)
 
     @property
-    def blocks(self) -> Dict[str, BasicBlock]:
-        """All blocks by ID."""
-        return dict(self._blocks)
+    def blocks(self) -> Mapping[str, BasicBlock]:
+        """All blocks by ID, as a read-only view (no copy)."""
+        return self._blocks_view
 
     @property
-    def networkx_graph(self) -> nx.DiGraph:
-        """Access underlying graph."""
-        return self._graph
+    def networkx_graph(self) -> "nx.DiGraph":
+        """Build a NetworkX DiGraph view of the CFG.
+
+        The graph is rebuilt on every access; mutating it does not
+        affect the CFG.
+        """
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self._succ)
+        for (from_id, to_id), label in self._labels.items():
+            graph.add_edge(from_id, to_id, label=label)
+        return graph
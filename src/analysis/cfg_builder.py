@@ -1,10 +1,20 @@
 """Builds control flow graphs from function ASTNodes."""
 
-from typing import List
+import sys
+from typing import Callable, Dict, List
 
 from src.parsing.ast_nodes import ASTNode, NodeType
 from src.analysis.cfg import BasicBlock, ControlFlowGraph
 
+# Child NodeTypes that are part of a construct's header, not its body
+_NON_BODY_TYPES = frozenset(
+    {
+        NodeType.IDENTIFIER,
+        NodeType.PARAMETER,
+        NodeType.UNKNOWN,
+    }
+)
+
 
 class CFGBuilder:
     """Builds a ControlFlowGraph from a function/method ASTNode.
@@ -15,6 +25,15 @@ class CFGBuilder:
 
     def __init__(self) -> None:
         self._counter = 0
+        # Statement handlers keyed by NodeType; anything else is a regular
+        # statement appended to the current block.
+        self._handlers: Dict[NodeType, Callable[[ASTNode, str, str, ControlFlowGraph], str]] = {
+            NodeType.IF: self._process_if,
+            NodeType.FOR: self._process_for,
+            NodeType.WHILE: self._process_while,
+            NodeType.TRY: self._process_try,
+            NodeType.RETURN: self._process_return,
+        }
 
     def build(self, function_node: ASTNode) -> ControlFlowGraph:
         """Build a CFG from a function AST node.
@@ -40,12 +59,18 @@ class CFGBuilder:
         # Find the body (BLOCK child or direct children)
         body = self._get_body_children(function_node)
 
+        # Fast path: straight-line code fits in the entry block
+        if not any(stmt.node_type in self._handlers for stmt in body):
+            entry.statements.extend(body)
+            cfg.add_edge(entry.id, exit_block.id)
+            return cfg
+
         # Process the body statements
         last_block_id = self._process_statements(body, entry.id, exit_block.id, cfg)
 
         # Connect last block to exit if not already connected
         if last_block_id and last_block_id != exit_block.id:
-            if not cfg.networkx_graph.has_edge(last_block_id, exit_block.id):
+            if not cfg.has_edge(last_block_id, exit_block.id):
                 cfg.add_edge(last_block_id, exit_block.id)
 
         return cfg
@@ -59,26 +84,19 @@ class CFGBuilder:
     ) -> str:
         """Process a list of statements, building blocks and edges.
 
-        Returns the ID of the last block created.
+        Returns the ID of the last block created, or exit_id if the
+        statements end in a return.
         """
+        handlers = self._handlers
         for stmt in statements:
-            if stmt.node_type == NodeType.IF:
-                current_id = self._process_if(stmt, current_id, exit_id, cfg)
-            elif stmt.node_type == NodeType.FOR:
-                current_id = self._process_loop(stmt, current_id, exit_id, cfg, "for")
-            elif stmt.node_type == NodeType.WHILE:
-                current_id = self._process_loop(stmt, current_id, exit_id, cfg, "while")
-            elif stmt.node_type == NodeType.TRY:
-                current_id = self._process_try(stmt, current_id, exit_id, cfg)
-            elif stmt.node_type == NodeType.RETURN:
-                block = cfg.get_block(current_id)
-                if block:
-                    block.statements.append(stmt)
-                cfg.add_edge(current_id, exit_id, label="return")
-                # After return, create a new unreachable block
-                new = self._new_block()
-                cfg.add_block(new)
-                current_id = new.id
+            if current_id == exit_id:
+                # Code after a return is unreachable; give it its own block
+                unreachable = self._new_block()
+                cfg.add_block(unreachable)
+                current_id = unreachable.id
+            handler = handlers.get(stmt.node_type)
+            if handler is not None:
+                current_id = handler(stmt, current_id, exit_id, cfg)
             else:
                 # Regular statement: add to current block
                 block = cfg.get_block(current_id)
@@ -86,6 +104,20 @@ class CFGBuilder:
                     block.statements.append(stmt)
         return current_id
 
+    def _process_return(
+        self,
+        node: ASTNode,
+        current_id: str,
+        exit_id: str,
+        cfg: ControlFlowGraph,
+    ) -> str:
+        """Process a RETURN node, jumping to the exit block."""
+        block = cfg.get_block(current_id)
+        if block:
+            block.statements.append(node)
+        cfg.add_edge(current_id, exit_id, label="return")
+        return exit_id
+
     def _process_if(
         self,
         node: ASTNode,
@@ -145,6 +177,26 @@ class CFGBuilder:
 
         return after.id
 
+    def _process_for(
+        self,
+        node: ASTNode,
+        current_id: str,
+        exit_id: str,
+        cfg: ControlFlowGraph,
+    ) -> str:
+        """Process a FOR loop."""
+        return self._process_loop(node, current_id, exit_id, cfg, "for")
+
+    def _process_while(
+        self,
+        node: ASTNode,
+        current_id: str,
+        exit_id: str,
+        cfg: ControlFlowGraph,
+    ) -> str:
+        """Process a WHILE loop."""
+        return self._process_loop(node, current_id, exit_id, cfg, "while")
+
     def _process_try(
         self,
         node: ASTNode,
@@ -169,23 +221,15 @@ class CFGBuilder:
 
     def _get_body_children(self, node: ASTNode) -> List[ASTNode]:
         """Get the body statements from a function/if/loop node."""
+        block_type = NodeType.BLOCK
         for child in node.children:
-            if child.node_type == NodeType.BLOCK:
+            if child.node_type == block_type:
                 return child.children
         # If no BLOCK child, return direct children that aren't
         # identifiers/params (i.e., skip the name/params)
-        return [
-            c
-            for c in node.children
-            if c.node_type
-            not in (
-                NodeType.IDENTIFIER,
-                NodeType.PARAMETER,
-                NodeType.UNKNOWN,
-            )
-        ]
+        return [c for c in node.children if c.node_type not in _NON_BODY_TYPES]
 
     def _new_block(self) -> BasicBlock:
         """Create a new uniquely-identified block."""
         self._counter += 1
-        return BasicBlock(id=f"block_{self._counter}")
+        return BasicBlock(id=sys.intern(f"block_{self._counter}"))
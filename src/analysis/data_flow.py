@@ -1,32 +1,71 @@
 """Basic data flow analysis on control flow graphs."""
 
+import sys
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.parsing.ast_nodes import ASTNode, NodeType
 from src.analysis.cfg import ControlFlowGraph
 
+try:
+    from src.analysis._fastwalk import find_names as _compiled_find_names
+except ImportError:  # Cython extension not built
+    _compiled_find_names = None  # type: ignore[assignment]
 
-@dataclass(frozen=True)
-class Definition:
-    """A variable definition (assignment) at a specific location."""
+
+class _VariableRef:
+    """Immutable (variable, block_id) pair with a precomputed hash.
+
+    Uses __slots__ instead of a frozen dataclass to avoid a per-instance
+    __dict__; large analyses hold many thousands of these in sets.
+    """
+
+    __slots__ = ("variable", "block_id", "_hash")
 
     variable: str
     block_id: str
+    _hash: int
+
+    def __init__(self, variable: str, block_id: str) -> None:
+        variable = sys.intern(variable)
+        block_id = sys.intern(block_id)
+        object.__setattr__(self, "variable", variable)
+        object.__setattr__(self, "block_id", block_id)
+        object.__setattr__(self, "_hash", hash((variable, block_id)))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def __hash__(self) -> int:
-        return hash((self.variable, self.block_id))
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _VariableRef) or type(other) is not type(self):
+            return NotImplemented
+        return (
+            self._hash == other._hash
+            and self.variable == other.variable
+            and self.block_id == other.block_id
+        )
 
+    def __reduce__(self) -> Tuple[type, Tuple[str, str]]:
+        return (type(self), (self.variable, self.block_id))
 
-@dataclass(frozen=True)
-class Use:
-    """A variable use (read) at a specific location."""
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(variable={self.variable!r}, block_id={self.block_id!r})"
 
-    variable: str
-    block_id: str
 
-    def __hash__(self) -> int:
-        return hash((self.variable, self.block_id))
+class Definition(_VariableRef):
+    """A variable definition (assignment) at a specific location."""
+
+    __slots__ = ()
+
+
+class Use(_VariableRef):
+    """A variable use (read) at a specific location."""
+
+    __slots__ = ()
 
 
 @dataclass
@@ -64,90 +103,176 @@ class DataFlowAnalyzer:
             DataFlowResult with reaching definitions and chains.
         """
         # Extract definitions and uses from each block
-        block_defs = self._extract_definitions(cfg)
-        block_uses = self._extract_uses(cfg)
+        block_defs, block_uses = self._extract_defs_and_uses(cfg)
 
-        # Compute reaching definitions
-        reaching = self._compute_reaching_definitions(cfg, block_defs)
+        # Compute reaching definitions as bitmasks over all_defs
+        all_defs: List[Definition] = [d for defs in block_defs.values() for d in defs]
+        reaching = self._compute_reaching_masks(cfg, block_defs, all_defs)
+
+        # Bitmask of all definitions of each variable
+        var_masks: Dict[str, int] = {}
+        for i, d in enumerate(all_defs):
+            var_masks[d.variable] = var_masks.get(d.variable, 0) | (1 << i)
 
         # Build use-def and def-use chains
         ud_chains: Dict[Use, Set[Definition]] = {}
         du_chains: Dict[Definition, Set[Use]] = {}
 
         for block_id, uses in block_uses.items():
-            reaching_at_block = reaching.get(block_id, set())
+            reaching_at_block = reaching.get(block_id, 0)
             for use in uses:
-                matching_defs = {d for d in reaching_at_block if d.variable == use.variable}
+                matching = reaching_at_block & var_masks.get(use.variable, 0)
+                matching_defs = self._mask_to_defs(matching, all_defs)
                 ud_chains[use] = matching_defs
                 for d in matching_defs:
                     du_chains.setdefault(d, set()).add(use)
 
         return DataFlowResult(
-            reaching_definitions=reaching,
+            reaching_definitions={
+                bid: self._mask_to_defs(mask, all_defs) for bid, mask in reaching.items()
+            },
             use_def_chains=ud_chains,
             def_use_chains=du_chains,
         )
 
-    def _extract_definitions(self, cfg: ControlFlowGraph) -> Dict[str, Set[Definition]]:
-        """Extract variable definitions from each block."""
-        defs: Dict[str, Set[Definition]] = {}
-        for block_id, block in cfg.blocks.items():
-            block_defs: Set[Definition] = set()
-            for stmt in block.statements:
-                for name in self._find_defined_names(stmt):
-                    block_defs.add(Definition(name, block_id))
-            defs[block_id] = block_defs
-        return defs
+    def _extract_defs_and_uses(
+        self, cfg: ControlFlowGraph
+    ) -> Tuple[Dict[str, Set[Definition]], Dict[str, Set[Use]]]:
+        """Extract variable definitions and uses from each block in one pass.
 
-    def _extract_uses(self, cfg: ControlFlowGraph) -> Dict[str, Set[Use]]:
-        """Extract variable uses from each block."""
+        Each (variable, block) pair is instantiated once per analysis, so
+        repeated occurrences share a single Definition/Use object.
+        """
+        find_names = self._find_names if _compiled_find_names is None else _compiled_find_names
+        defs: Dict[str, Set[Definition]] = {}
         uses: Dict[str, Set[Use]] = {}
         for block_id, block in cfg.blocks.items():
-            block_uses: Set[Use] = set()
+            def_pool: Dict[str, Definition] = {}
+            use_pool: Dict[str, Use] = {}
             for stmt in block.statements:
-                for name in self._find_used_names(stmt):
-                    block_uses.add(Use(name, block_id))
-            uses[block_id] = block_uses
-        return uses
-
-    def _compute_reaching_definitions(
+                defined, used = find_names(stmt)
+                for name in defined:
+                    if name not in def_pool:
+                        def_pool[name] = Definition(name, block_id)
+                for name in used:
+                    if name not in use_pool:
+                        use_pool[name] = Use(name, block_id)
+            defs[block_id] = set(def_pool.values())
+            uses[block_id] = set(use_pool.values())
+        return defs, uses
+
+    def _compute_reaching_masks(
         self,
         cfg: ControlFlowGraph,
         block_defs: Dict[str, Set[Definition]],
-    ) -> Dict[str, Set[Definition]]:
-        """Iterative worklist algorithm for reaching definitions."""
-        reaching: Dict[str, Set[Definition]] = {bid: set() for bid in cfg.blocks}
-
-        changed = True
-        while changed:
-            changed = False
-            for block_id in cfg.blocks:
-                # IN[B] = union of OUT[P] for all predecessors P
-                new_in: Set[Definition] = set()
-                for pred in cfg.get_predecessors(block_id):
-                    pred_out = reaching.get(pred.id, set()) | block_defs.get(pred.id, set())
-                    new_in |= pred_out
-
-                if new_in != reaching[block_id]:
-                    reaching[block_id] = new_in
-                    changed = True
+        all_defs: List[Definition],
+    ) -> Dict[str, int]:
+        """Iterative worklist algorithm for reaching definitions.
+
+        Definition sets are int bitmasks where bit i stands for
+        all_defs[i], so union and comparison are single int operations.
+        """
+        def_bit: Dict[Definition, int] = {d: 1 << i for i, d in enumerate(all_defs)}
+
+        gen: Dict[str, int] = {}
+        for block_id, defs in block_defs.items():
+            mask = 0
+            for d in defs:
+                mask |= def_bit[d]
+            gen[block_id] = mask
+
+        reaching: Dict[str, int] = {bid: 0 for bid in cfg.blocks}
+
+        # Visit blocks in reverse postorder; only re-enqueue the successors
+        # of blocks whose IN set actually changed.
+        worklist = deque(self._reverse_postorder(cfg))
+        queued = set(worklist)
+        while worklist:
+            block_id = worklist.popleft()
+            queued.discard(block_id)
+
+            # IN[B] = union of OUT[P] for all predecessors P
+            new_in = 0
+            for pred_id in cfg.predecessor_ids(block_id):
+                new_in |= reaching.get(pred_id, 0) | gen.get(pred_id, 0)
+
+            if new_in != reaching[block_id]:
+                reaching[block_id] = new_in
+                for succ_id in cfg.successor_ids(block_id):
+                    if succ_id in reaching and succ_id not in queued:
+                        worklist.append(succ_id)
+                        queued.add(succ_id)
 
         return reaching
 
-    def _find_defined_names(self, node: ASTNode) -> List[str]:
-        """Find variable names defined (assigned) in a statement."""
-        names: List[str] = []
+    @staticmethod
+    def _reverse_postorder(cfg: ControlFlowGraph) -> List[str]:
+        """Order block IDs in reverse postorder from the entry block.
+
+        Blocks unreachable from the entry are included too, so every
+        block is visited at least once.
+        """
+        blocks = cfg.blocks
+        roots = [cfg.entry_block.id] if cfg.entry_block is not None else []
+        roots.extend(blocks)
+
+        postorder: List[str] = []
+        visited: Set[str] = set()
+        for root in roots:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(cfg.successor_ids(root)))]
+            while stack:
+                block_id, succs = stack[-1]
+                for succ_id in succs:
+                    if succ_id not in visited and succ_id in blocks:
+                        visited.add(succ_id)
+                        stack.append((succ_id, iter(cfg.successor_ids(succ_id))))
+                        break
+                else:
+                    stack.pop()
+                    postorder.append(block_id)
+
+        postorder.reverse()
+        return postorder
+
+    @staticmethod
+    def _mask_to_defs(mask: int, all_defs: List[Definition]) -> Set[Definition]:
+        """Convert a definition bitmask back to a set of Definitions."""
+        result: Set[Definition] = set()
+        while mask:
+            low = mask & -mask
+            result.add(all_defs[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+    def _find_names(self, node: ASTNode) -> Tuple[List[str], List[str]]:
+        """Find variable names defined and used in a statement.
+
+        The first identifier of an ASSIGNMENT is its target and counts
+        as a definition, not a use. Every other identifier below the
+        statement counts as a use. src/analysis/_fastwalk.pyx mirrors
+        this method and is used instead when compiled.
+        """
+        identifier_type = NodeType.IDENTIFIER
+        intern = sys.intern
+
+        defined: List[str] = []
+        target: Optional[ASTNode] = None
         if node.node_type == NodeType.ASSIGNMENT:
             for child in node.children:
-                if child.node_type == NodeType.IDENTIFIER and child.name:
-                    names.append(child.name)
+                if child.node_type == identifier_type and child.name:
+                    target = child
+                    defined.append(intern(child.name))
                     break  # Only first identifier is the target
-        return names
-
-    def _find_used_names(self, node: ASTNode) -> List[str]:
-        """Find variable names used (read) in a statement."""
-        names: List[str] = []
-        for desc in node.get_descendants(NodeType.IDENTIFIER):
-            if desc.name:
-                names.append(desc.name)
-        return names
+
+        used: List[str] = []
+        pending = deque(node.children)
+        popleft, extend = pending.popleft, pending.extend
+        while pending:
+            desc = popleft()
+            if desc.node_type == identifier_type and desc.name and desc is not target:
+                used.append(intern(desc.name))
+            extend(desc.children)
+        return defined, used
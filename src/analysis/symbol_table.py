@@ -1,7 +1,8 @@
 """Symbol table and scope analysis."""
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from src.parsing.ast_nodes import ASTNode, NodeType
 
@@ -29,7 +30,9 @@ class Scope:
     """A lexical scope containing symbol definitions.
 
     Scopes form a chain: each scope has an optional parent. Symbol
-    lookup walks up the chain until the symbol is found.
+    lookup walks up the chain until the symbol is found. Results of
+    chain walks are memoized per scope; a define() anywhere in the tree
+    bumps a shared generation, and stale memos are dropped on next lookup.
     """
 
     def __init__(self, scope_id: str, parent: Optional["Scope"] = None) -> None:
@@ -37,18 +40,36 @@ class Scope:
         self.parent = parent
         self.symbols: Dict[str, Symbol] = {}
         self.children: List["Scope"] = []
+        # Memoized results of parent-chain lookups (including misses)
+        self._cache: Dict[str, Optional[Symbol]] = {}
+        # Define counter shared by the whole scope tree, and its value
+        # when _cache was last valid
+        self._generation: List[int] = parent._generation if parent is not None else [0]
+        self._cache_generation = self._generation[0]
+        # Called after each define(); set by the owning SymbolTable
+        self._on_define: Optional[Callable[["Scope", Symbol], None]] = None
 
     def define(self, symbol: Symbol) -> None:
         """Define a symbol in this scope."""
         self.symbols[symbol.name] = symbol
+        self._generation[0] += 1
+        if self._on_define is not None:
+            self._on_define(self, symbol)
 
     def lookup(self, name: str) -> Optional[Symbol]:
         """Look up a symbol, searching up the scope chain."""
-        if name in self.symbols:
-            return self.symbols[name]
-        if self.parent is not None:
-            return self.parent.lookup(name)
-        return None
+        sym = self.symbols.get(name)
+        if sym is not None:
+            return sym
+        generation = self._generation[0]
+        if self._cache_generation != generation:
+            self._cache.clear()
+            self._cache_generation = generation
+        elif name in self._cache:
+            return self._cache[name]
+        sym = self.parent.lookup(name) if self.parent is not None else None
+        self._cache[name] = sym
+        return sym
 
     def lookup_local(self, name: str) -> Optional[Symbol]:
         """Look up a symbol only in this scope (no parent search)."""
@@ -68,6 +89,16 @@ _NODE_TO_SYMBOL_TYPE: Dict[NodeType, str] = {
     NodeType.ASSIGNMENT: "variable",
 }
 
+# NodeTypes that open a new lexical scope
+_SCOPE_CREATORS = frozenset(
+    {
+        NodeType.CLASS,
+        NodeType.FUNCTION,
+        NodeType.METHOD,
+        NodeType.CONSTRUCTOR,
+    }
+)
+
 
 class SymbolTable:
     """Manages scoped symbol resolution for a file.
@@ -79,6 +110,10 @@ class SymbolTable:
     def __init__(self) -> None:
         self._scopes: Dict[str, Scope] = {}
         self._global_scope: Optional[Scope] = None
+        # (parent scope ID, name) -> interned child scope ID
+        self._scope_ids: Dict[Tuple[str, str], str] = {}
+        # name -> {scope ID: symbol} for cross-scope definition queries
+        self._defs_by_name: Dict[str, Dict[str, Symbol]] = {}
 
     def build_from_ast(self, ast_root: ASTNode) -> None:
         """Build the symbol table from an AST root.
@@ -86,8 +121,8 @@ class SymbolTable:
         Args:
             ast_root: Root ASTNode (typically MODULE).
         """
-        self._global_scope = Scope("global")
-        self._scopes["global"] = self._global_scope
+        self._global_scope = Scope(sys.intern("global"))
+        self._register_scope(self._global_scope)
         self._walk(ast_root, self._global_scope)
 
     def resolve(self, name: str, scope_id: str) -> Optional[Symbol]:
@@ -99,12 +134,7 @@ class SymbolTable:
 
     def get_definitions(self, name: str) -> List[Symbol]:
         """Find all definitions of a name across all scopes."""
-        results: List[Symbol] = []
-        for scope in self._scopes.values():
-            sym = scope.lookup_local(name)
-            if sym is not None:
-                results.append(sym)
-        return results
+        return list(self._defs_by_name.get(name, {}).values())
 
     def get_scope(self, scope_id: str) -> Optional[Scope]:
         """Get a scope by ID."""
@@ -120,47 +150,77 @@ class SymbolTable:
         """Number of scopes."""
         return len(self._scopes)
 
-    def _walk(self, node: ASTNode, current_scope: Scope) -> None:
-        """Recursively walk the AST, building scopes and symbols."""
-        symbol_type = _NODE_TO_SYMBOL_TYPE.get(node.node_type)
-
-        # Define symbol if this node produces one
-        if symbol_type and node.name:
-            sym = Symbol(
-                name=node.name,
-                symbol_type=symbol_type,
-                scope_id=current_scope.scope_id,
-                definition_node=node,
-            )
-            current_scope.define(sym)
-
-        # Create a new scope for scope-creating constructs
-        scope_creators = {
-            NodeType.CLASS,
-            NodeType.FUNCTION,
-            NodeType.METHOD,
-            NodeType.CONSTRUCTOR,
-        }
-        new_scope = current_scope
-        if node.node_type in scope_creators:
-            scope_id = f"{current_scope.scope_id}.{node.name or 'anon'}"
-            new_scope = Scope(scope_id, parent=current_scope)
-            current_scope.children.append(new_scope)
-            self._scopes[scope_id] = new_scope
-
-        # Also handle ASSIGNMENT nodes that define variables
-        if node.node_type == NodeType.ASSIGNMENT and not node.name:
-            # Try to extract the target name from first IDENTIFIER child
-            for child in node.children:
-                if child.node_type == NodeType.IDENTIFIER and child.name:
-                    sym = Symbol(
-                        name=child.name,
-                        symbol_type="variable",
-                        scope_id=current_scope.scope_id,
-                        definition_node=node,
-                    )
-                    current_scope.define(sym)
-                    break
-
-        for child in node.children:
-            self._walk(child, new_scope)
+    def _register_scope(self, scope: Scope) -> None:
+        """Register a scope, replacing (and unindexing) any scope with its ID.
+
+        Also links the scope into its parent's children.
+        """
+        old = self._scopes.get(scope.scope_id)
+        if old is not None:
+            for name in old.symbols:
+                self._defs_by_name.get(name, {}).pop(old.scope_id, None)
+        self._scopes[scope.scope_id] = scope
+        if scope.parent is not None:
+            scope.parent.children.append(scope)
+        scope._on_define = self._index_symbol
+        for symbol in scope.symbols.values():
+            self._index_symbol(scope, symbol)
+
+    def _index_symbol(self, scope: Scope, symbol: Symbol) -> None:
+        """Record a symbol in the name index."""
+        self._defs_by_name.setdefault(symbol.name, {})[scope.scope_id] = symbol
+
+    def _scope_id(self, parent_id: str, name: str) -> str:
+        """Build (or reuse) the interned ID of a child scope."""
+        key = (parent_id, name)
+        scope_id = self._scope_ids.get(key)
+        if scope_id is None:
+            scope_id = sys.intern(parent_id + "." + name)
+            self._scope_ids[key] = scope_id
+        return scope_id
+
+    def _walk(self, root: ASTNode, root_scope: Scope) -> None:
+        """Walk the AST iteratively, building scopes and symbols."""
+        assignment_type = NodeType.ASSIGNMENT
+        identifier_type = NodeType.IDENTIFIER
+        symbol_types = _NODE_TO_SYMBOL_TYPE
+
+        stack: List[Tuple[ASTNode, Scope]] = [(root, root_scope)]
+        while stack:
+            node, current_scope = stack.pop()
+            node_type = node.node_type
+            symbol_type = symbol_types.get(node_type)
+
+            # Define symbol if this node produces one
+            if symbol_type and node.name:
+                sym = Symbol(
+                    name=sys.intern(node.name),
+                    symbol_type=symbol_type,
+                    scope_id=current_scope.scope_id,
+                    definition_node=node,
+                )
+                current_scope.define(sym)
+
+            # Create a new scope for scope-creating constructs
+            new_scope = current_scope
+            if node_type in _SCOPE_CREATORS:
+                scope_id = self._scope_id(current_scope.scope_id, node.name or "anon")
+                new_scope = Scope(scope_id, parent=current_scope)
+                self._register_scope(new_scope)
+
+            # Also handle ASSIGNMENT nodes that define variables
+            if node_type == assignment_type and not node.name:
+                # Try to extract the target name from first IDENTIFIER child
+                for child in node.children:
+                    if child.node_type == identifier_type and child.name:
+                        sym = Symbol(
+                            name=sys.intern(child.name),
+                            symbol_type="variable",
+                            scope_id=current_scope.scope_id,
+                            definition_node=node,
+                        )
+                        current_scope.define(sym)
+                        break
+
+            # Push in reverse so children are visited in source order
+            stack.extend((child, new_scope) for child in reversed(node.children))
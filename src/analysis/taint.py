@@ -6,9 +6,20 @@ source/sink/sanitizer definitions for Phase 2 Security Agent.
 """
 
 import re
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Tuple
+from src.analysis._hyperscan import compile_scanner
 from src.analysis.cfg import ControlFlowGraph
+from src.parsing.ast_nodes import ASTNode
+
+# Statement source text -> bitmask of matching patterns (bit i = pattern i);
+# identical statements share one scan
+_HitCache = Dict[str, int]
+
+# Most statement texts kept in each hit cache; an analyzer lives as long as
+# its pipeline, so the caches must not grow with the size of the codebase
+_HIT_CACHE_SIZE = 65536
 
 
 @dataclass
@@ -94,6 +105,59 @@ DEFAULT_SANITIZERS = [
 ]
 
 
+def _fuse(patterns: List[str]) -> Optional[Pattern[str]]:
+    """Combine patterns into one alternation used as a per-statement prefilter.
+
+    Returns None when the patterns cannot be combined (e.g. clashing
+    named groups), in which case every statement is checked in full.
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+    except re.error:
+        return None
+
+
+def _make_matcher(patterns: List[str]) -> Callable[[str], int]:
+    """Build a function returning the bitmask of patterns matching a text.
+
+    Uses a Hyperscan database when available; otherwise each pattern is
+    compiled with re behind a fused prefilter. Invalid patterns always
+    raise re.error here, whichever backend is used.
+    """
+    # Patterns stay str: ASCII str is already stored one byte per char,
+    # and bytes patterns measured no faster while breaking non-ASCII text
+    compiled = [(1 << i, re.compile(p)) for i, p in enumerate(patterns)]
+
+    scan = compile_scanner(patterns)
+    if scan is not None:
+        return lambda text: sum(1 << i for i in scan(text))
+
+    # The alternation rejects non-matching text in a single scan. It can't
+    # name every match (overlapping patterns), so hits are rechecked.
+    prefilter = _fuse(patterns)
+
+    def match(text: str) -> int:
+        if prefilter is not None and not prefilter.search(text):
+            return 0
+        bits = 0
+        for bit, regex in compiled:
+            if regex.search(text):
+                bits |= bit
+        return bits
+
+    return match
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """Yield the indices of set bits, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
 class TaintAnalyzer:
     """Basic forward taint analysis through a CFG.
 
@@ -110,6 +174,18 @@ class TaintAnalyzer:
         self._sources = sources or list(DEFAULT_SOURCES)
         self._sinks = sinks or list(DEFAULT_SINKS)
         self._sanitizers = sanitizers or list(DEFAULT_SANITIZERS)
+        self._match_source = _make_matcher([s.pattern for s in self._sources])
+        self._match_sink = _make_matcher([s.pattern for s in self._sinks])
+        self._match_sanitizer = _make_matcher([s.pattern for s in self._sanitizers])
+        # Vulnerability -> bitmask of the sanitizers covering it
+        self._vuln_masks: Dict[str, int] = {}
+        for i, sanitizer in enumerate(self._sanitizers):
+            for vuln in sanitizer.sanitizes:
+                self._vuln_masks[vuln] = self._vuln_masks.get(vuln, 0) | 1 << i
+        # Match bitmasks per distinct statement text, shared across blocks and CFGs
+        self._source_hits: _HitCache = {}
+        self._sink_hits: _HitCache = {}
+        self._sanitizer_hits: _HitCache = {}
 
     def analyze(self, cfg: ControlFlowGraph) -> List[TaintFlow]:
         """Run taint analysis on a CFG.
@@ -129,32 +205,54 @@ class TaintAnalyzer:
         if not source_blocks or not sink_blocks:
             return flows
 
-        # For each source-sink pair, check if a path exists
+        sinks_by_block: Dict[str, List[TaintSink]] = {}
+        for sink, t_block_id in sink_blocks:
+            sinks_by_block.setdefault(t_block_id, []).append(sink)
+
+        # Per distinct source block: the sink blocks it can reach, found with
+        # SCC lookups, and their paths from a single BFS. Pairs in different
+        # components never reach the pair loop below.
+        targets: Dict[str, List[Tuple[str, List[str]]]] = {}
+        for _, s_block_id in source_blocks:
+            if s_block_id not in targets:
+                targets[s_block_id] = self._reachable_sinks(cfg, s_block_id, sinks_by_block)
+
         for source, s_block_id in source_blocks:
-            for sink, t_block_id in sink_blocks:
-                path = self._find_path(cfg, s_block_id, t_block_id)
-                if path:
+            for t_block_id, path in targets[s_block_id]:
+                for sink in sinks_by_block[t_block_id]:
                     sanitized = self._is_sanitized(cfg, path, sink.vulnerability)
                     flows.append(
                         TaintFlow(
                             source=source,
                             sink=sink,
-                            path=path,
+                            path=list(path),
                             sanitized=sanitized,
                         )
                     )
 
         return flows
 
+    def _reachable_sinks(
+        self,
+        cfg: ControlFlowGraph,
+        s_block_id: str,
+        sinks_by_block: Dict[str, List[TaintSink]],
+    ) -> List[Tuple[str, List[str]]]:
+        """Return (sink block, path) for every sink block reachable from s_block_id."""
+        reachable = [t for t in sinks_by_block if cfg.can_reach(s_block_id, t)]
+        parent: Dict[str, Optional[str]] = {}
+        if any(t != s_block_id for t in reachable):
+            parent = self._bfs_parents(cfg, s_block_id)
+        return [(t, [t] if t == s_block_id else self._rebuild_path(parent, t)) for t in reachable]
+
     def _find_source_blocks(self, cfg: ControlFlowGraph) -> List[tuple]:
         """Find (source, block_id) pairs in the CFG."""
         results = []
         for block_id, block in cfg.blocks.items():
             for stmt in block.statements:
-                text = stmt.source_text
-                for source in self._sources:
-                    if re.search(source.pattern, text):
-                        results.append((source, block_id))
+                bits = self._bits(stmt, self._source_hits, self._match_source)
+                for i in _iter_bits(bits):
+                    results.append((self._sources[i], block_id))
         return results
 
     def _find_sink_blocks(self, cfg: ControlFlowGraph) -> List[tuple]:
@@ -162,40 +260,34 @@ class TaintAnalyzer:
         results = []
         for block_id, block in cfg.blocks.items():
             for stmt in block.statements:
-                text = stmt.source_text
-                for sink in self._sinks:
-                    if re.search(sink.pattern, text):
-                        results.append((sink, block_id))
+                bits = self._bits(stmt, self._sink_hits, self._match_sink)
+                for i in _iter_bits(bits):
+                    results.append((self._sinks[i], block_id))
         return results
 
-    def _find_path(
-        self,
-        cfg: ControlFlowGraph,
-        from_id: str,
-        to_id: str,
-    ) -> List[str]:
-        """Find a path from source block to sink block (BFS)."""
-        if from_id == to_id:
-            return [from_id]
-
-        visited: Set[str] = set()
-        queue: List[List[str]] = [[from_id]]
-
+    @staticmethod
+    def _bfs_parents(cfg: ControlFlowGraph, from_id: str) -> Dict[str, Optional[str]]:
+        """BFS from from_id, returning a parent pointer for every reached block."""
+        parent: Dict[str, Optional[str]] = {from_id: None}
+        queue = deque([from_id])
         while queue:
-            path = queue.pop(0)
-            current = path[-1]
-
-            if current in visited:
-                continue
-            visited.add(current)
-
+            current = queue.popleft()
             for succ in cfg.get_successors(current):
-                new_path = path + [succ.id]
-                if succ.id == to_id:
-                    return new_path
-                queue.append(new_path)
-
-        return []
+                if succ.id not in parent:
+                    parent[succ.id] = current
+                    queue.append(succ.id)
+        return parent
+
+    @staticmethod
+    def _rebuild_path(parent: Dict[str, Optional[str]], to_id: str) -> List[str]:
+        """Walk parent pointers back from to_id to the BFS root."""
+        path = []
+        node: Optional[str] = to_id
+        while node is not None:
+            path.append(node)
+            node = parent[node]
+        path.reverse()
+        return path
 
     def _is_sanitized(
         self,
@@ -203,15 +295,27 @@ class TaintAnalyzer:
         path: List[str],
         vulnerability: str,
     ) -> bool:
-        """Check if any block in the path contains a sanitizer."""
+        """Check if any block in the path contains a sanitizer for vulnerability."""
+        vuln_mask = self._vuln_masks.get(vulnerability, 0)
+        if not vuln_mask:
+            return False
         for block_id in path:
             block = cfg.get_block(block_id)
             if block is None:
                 continue
             for stmt in block.statements:
-                text = stmt.source_text
-                for sanitizer in self._sanitizers:
-                    if vulnerability in sanitizer.sanitizes:
-                        if re.search(sanitizer.pattern, text):
-                            return True
+                if self._bits(stmt, self._sanitizer_hits, self._match_sanitizer) & vuln_mask:
+                    return True
         return False
+
+    @staticmethod
+    def _bits(stmt: ASTNode, cache: _HitCache, matcher: Callable[[str], int]) -> int:
+        """Return the bitmask of patterns matching stmt, memoized per source text."""
+        text = stmt.source_text
+        bits = cache.get(text)
+        if bits is None:
+            if len(cache) >= _HIT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del cache[next(iter(cache))]
+            bits = cache[text] = matcher(text)
+        return bits
@@ -1,7 +1,8 @@
 """Configuration for code parsers."""
 
-from typing import Dict, List
-from pydantic import BaseModel
+import re
+from typing import Any, Dict, List, Optional, Pattern
+from pydantic import BaseModel, PrivateAttr
 
 
 class ParserConfig(BaseModel):
@@ -12,7 +13,10 @@ class ParserConfig(BaseModel):
         language_extensions: Mapping of language to file extensions
         max_file_size_mb: Maximum file size to parse (in MB)
         timeout_seconds: Parse timeout in seconds
-        skip_patterns: File patterns to skip
+        skip_patterns: File patterns to skip ("*" matches any characters)
+
+    Lookup tables for the extension and skip checks are built once at
+    construction; treat the fields as read-only afterwards.
     """
 
     supported_languages: List[str] = [
@@ -44,6 +48,24 @@ class ParserConfig(BaseModel):
         "*.bundle.js",
     ]
 
+    _ext_to_lang: Optional[Dict[str, str]] = PrivateAttr(default=None)
+    _skip_re: Optional[Pattern[str]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the extension index and the combined skip regex."""
+        exts = [ext for exts in self.language_extensions.values() for ext in exts]
+        # Only single-suffix extensions (".py") can be found by a dict lookup
+        if all(ext.startswith(".") and ext.count(".") == 1 for ext in exts):
+            ext_to_lang: Dict[str, str] = {}
+            for language, extensions in self.language_extensions.items():
+                for ext in extensions:
+                    ext_to_lang.setdefault(ext, language)
+            self._ext_to_lang = ext_to_lang
+        if self.skip_patterns:
+            self._skip_re = re.compile(
+                "|".join(re.escape(p).replace(r"\*", ".*") for p in self.skip_patterns)
+            )
+
     def get_language_for_file(self, file_path: str) -> str:
         """Detect language from file extension.
 
@@ -53,6 +75,11 @@ class ParserConfig(BaseModel):
         Returns:
             Language name or "unknown"
         """
+        if self._ext_to_lang is not None:
+            dot = file_path.rfind(".")
+            if dot < 0:
+                return "unknown"
+            return self._ext_to_lang.get(file_path[dot:], "unknown")
         for language, extensions in self.language_extensions.items():
             if any(file_path.endswith(ext) for ext in extensions):
                 return language
@@ -67,4 +94,4 @@ class ParserConfig(BaseModel):
         Returns:
             True if file should be skipped
         """
-        return any(pattern in file_path for pattern in self.skip_patterns)
+        return self._skip_re is not None and self._skip_re.search(file_path) is not None
@@ -2,7 +2,7 @@
 
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 
 class Settings(BaseSettings):
@@ -27,12 +27,15 @@ class Settings(BaseSettings):
         redis_port: Redis port
 
         model_cache_dir: Directory for cached models
+
+    Settings are frozen, so derived URLs are computed once per instance.
     """
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     # Environment
@@ -59,7 +62,7 @@ class Settings(BaseSettings):
     # Models
     model_cache_dir: str = "models/checkpoints"
 
-    @property
+    @cached_property
     def postgres_url(self) -> str:
         """Get PostgreSQL connection URL.
 
@@ -71,7 +74,7 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
-    @property
+    @cached_property
     def redis_url(self) -> str:
         """Get Redis connection URL.
 
@@ -0,0 +1,36 @@
+"""Normalization kernels, JIT-compiled with Numba when it is installed.
+
+Without Numba the same kernel runs as a NumPy expression, so results
+do not depend on which backend is active.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Numba not installed
+    numba = None
+
+
+def _normalize_pack_py(
+    raws: np.ndarray, lo: np.ndarray, scale: np.ndarray, out: np.ndarray
+) -> None:
+    """Write clip((raws - lo) * scale, 0, 1) into out (NumPy fallback).
+
+    raws and out are (rows, fields); lo and scale are per field.
+    """
+    np.clip((raws - lo) * scale, 0.0, 1.0, out=out)
+
+
+def _normalize_pack_loop(raws, lo, scale, out):
+    """Loop form of the same kernel, compiled by Numba."""
+    for r in range(raws.shape[0]):
+        for i in range(raws.shape[1]):
+            v = (raws[r, i] - lo[i]) * scale[i]
+            out[r, i] = 0.0 if v < 0.0 else (1.0 if v > 1.0 else v)
+
+
+if numba is not None:
+    normalize_pack = numba.njit(cache=True)(_normalize_pack_loop)
+else:
+    normalize_pack = _normalize_pack_py
@@ -1,6 +1,6 @@
 """Generates 128-dim feature vectors from computed metrics."""
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -10,6 +10,7 @@ from src.features.feature_vector import (
     STRUCTURAL_SLICE,
     FeatureVector,
 )
+from src.features._kernels import normalize_pack
 from src.features.normalizer import FeatureNormalizer
 from src.metrics.entity_metrics import EntityMetrics
 from src.metrics.structural_metrics import StructuralMetrics
@@ -57,6 +58,7 @@ class FeatureExtractor:
         entity_id: str,
         entity_metrics: EntityMetrics,
         structural_metrics: Optional[StructuralMetrics] = None,
+        out: Optional[np.ndarray] = None,
     ) -> FeatureVector:
         """Generate a feature vector for one entity.
 
@@ -64,11 +66,16 @@ class FeatureExtractor:
             entity_id: The entity's ID.
             entity_metrics: AST-based metrics.
             structural_metrics: Graph-based metrics (optional).
+            out: Optional (128,) float32 buffer to write into, e.g. a row
+                of a shared or memory-mapped matrix.
 
         Returns:
             A 128-dimensional FeatureVector.
         """
-        vec = np.zeros(VECTOR_DIM, dtype=np.float32)
+        if out is None:
+            vec = np.zeros(VECTOR_DIM, dtype=np.float32)
+        else:
+            vec = self._check_out(out, (VECTOR_DIM,))
 
         # Pack syntactic features into [0:32]
         syn = self._build_syntactic(entity_metrics)
@@ -85,29 +92,82 @@ class FeatureExtractor:
         return FeatureVector(entity_id=entity_id, vector=vec)
 
     def extract_all(self, metrics_result: MetricsResult) -> Dict[str, FeatureVector]:
-        """Generate feature vectors for all entities in a MetricsResult."""
-        vectors: Dict[str, FeatureVector] = {}
-        for eid, em in metrics_result.entity_metrics.items():
-            sm = metrics_result.structural_metrics.get(eid)
-            vectors[eid] = self.extract(eid, em, sm)
-        return vectors
+        """Generate feature vectors for all entities in a MetricsResult.
+
+        Vectors are views into the rows of a single matrix built by
+        extract_matrix.
+        """
+        ids, matrix = self.extract_matrix(metrics_result)
+        return {eid: FeatureVector(entity_id=eid, vector=matrix[i]) for i, eid in enumerate(ids)}
+
+    def extract_matrix(
+        self,
+        metrics_result: MetricsResult,
+        out: Optional[np.ndarray] = None,
+    ) -> Tuple[List[str], np.ndarray]:
+        """Generate feature vectors for all entities as one (N, 128) matrix.
+
+        Args:
+            metrics_result: Metrics for every entity.
+            out: Optional (N, 128) float32 buffer to fill instead of
+                allocating, e.g. an np.memmap or a shared-memory array.
+
+        Returns:
+            Entity IDs and a float32 matrix whose row i belongs to ids[i].
+        """
+        ids = list(metrics_result.entity_metrics)
+        if out is None:
+            matrix = np.zeros((len(ids), VECTOR_DIM), dtype=np.float32)
+        else:
+            matrix = self._check_out(out, (len(ids), VECTOR_DIM))
+        if not ids:
+            return ids, matrix
+
+        entity = metrics_result.entity_metrics
+        syn = self._normalize_rows([entity[eid] for eid in ids], _SYNTACTIC_FIELDS)
+        matrix[:, SYNTACTIC_SLICE.start : SYNTACTIC_SLICE.start + syn.shape[1]] = syn
+
+        structural = metrics_result.structural_metrics
+        rows = [i for i, eid in enumerate(ids) if structural.get(eid) is not None]
+        if rows:
+            struc = self._normalize_rows([structural[ids[i]] for i in rows], _STRUCTURAL_FIELDS)
+            start = STRUCTURAL_SLICE.start
+            matrix[rows, start : start + struc.shape[1]] = struc
+
+        return ids, matrix
+
+    @staticmethod
+    def _check_out(out: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+        """Validate a caller-provided output buffer and clear it."""
+        if out.shape != shape or out.dtype != np.float32:
+            raise ValueError(f"out must be float32 with shape {shape}, got {out.dtype} {out.shape}")
+        out.fill(0.0)
+        return out
 
     def _build_syntactic(self, m: EntityMetrics) -> np.ndarray:
         """Build normalized syntactic feature array (32 dims)."""
-        arr = np.zeros(32, dtype=np.float32)
-        for i, field_name in enumerate(_SYNTACTIC_FIELDS):
-            if i >= 32:
-                break
-            raw = getattr(m, field_name, 0)
-            arr[i] = self._normalizer.normalize(float(raw), field_name)
-        return arr  # type: ignore[no-any-return]
+        return self._build(m, _SYNTACTIC_FIELDS)
 
     def _build_structural(self, m: StructuralMetrics) -> np.ndarray:
         """Build normalized structural feature array (32 dims)."""
+        return self._build(m, _STRUCTURAL_FIELDS)
+
+    def _normalize_rows(self, items: List[object], fields: List[str]) -> np.ndarray:
+        """Normalize the named fields of every item into an (N, fields) array."""
+        names = fields[:32]
+        lo, _, scale, _ = self._normalizer.build_arrays(names)
+        raws = np.array(
+            [[getattr(m, name, 0) for name in names] for m in items],
+            dtype=np.float64,
+        ).reshape(len(items), len(names))
+        out = np.empty(raws.shape, dtype=np.float32)
+        # Zero raws need no special case: with lo >= 0 the clip maps them to 0
+        normalize_pack(raws, lo, scale, out)
+        return out
+
+    def _build(self, m: object, fields: List[str]) -> np.ndarray:
+        """Normalize the named fields of m into a 32-dim float32 array."""
+        row = self._normalize_rows([m], fields)[0]
         arr = np.zeros(32, dtype=np.float32)
-        for i, field_name in enumerate(_STRUCTURAL_FIELDS):
-            if i >= 32:
-                break
-            raw = getattr(m, field_name, 0)
-            arr[i] = self._normalizer.normalize(float(raw), field_name)
-        return arr  # type: ignore[no-any-return]
+        arr[: len(row)] = row
+        return arr
@@ -24,6 +24,9 @@ class FeatureVector:
         [96:128] Historical features (reserved for git, zeroed)
     """
 
+    # Explicit slots (not slots=True, which needs Python 3.10) drop __dict__
+    __slots__ = ("entity_id", "vector")
+
     entity_id: str
     vector: np.ndarray  # shape (128,), dtype float32
 
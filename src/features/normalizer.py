@@ -1,7 +1,12 @@
 """Feature value normalization to [0, 1] range."""
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
+import numpy as np
+
+
+# (lo, hi, scale, zero_mask) arrays for one field order
+_BoundsArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
 
 # Default bounds for min-max normalization
 DEFAULT_BOUNDS: Dict[str, Tuple[float, float]] = {
@@ -41,6 +46,8 @@ class FeatureNormalizer:
         bounds: Optional[Dict[str, Tuple[float, float]]] = None,
     ) -> None:
         self._bounds = bounds or dict(DEFAULT_BOUNDS)
+        # Field-name tuple -> (lo, hi, scale, zero_mask); cleared by set_bounds
+        self._arrays: Dict[Tuple[str, ...], _BoundsArrays] = {}
 
     def normalize(self, value: float, metric_name: str) -> float:
         """Normalize a single value to [0, 1].
@@ -52,12 +59,44 @@ class FeatureNormalizer:
         Returns:
             Normalized value in [0, 1].
         """
-        lo, hi = self._bounds.get(metric_name, (0, 1))
+        lo, hi = self.get_bounds(metric_name)
         if hi == lo:
             return 0.0
         normalized = (value - lo) / (hi - lo)
         return max(0.0, min(1.0, normalized))
 
+    def get_bounds(self, metric_name: str) -> Tuple[float, float]:
+        """Return the (lo, hi) bounds for a metric, defaulting to (0, 1)."""
+        return self._bounds.get(metric_name, (0, 1))
+
     def set_bounds(self, metric_name: str, lo: float, hi: float) -> None:
         """Set or update normalization bounds for a metric."""
         self._bounds[metric_name] = (lo, hi)
+        self._arrays.clear()
+
+    def build_arrays(self, metric_names: Sequence[str]) -> _BoundsArrays:
+        """Return bounds for a fixed field order as arrays for vectorized use.
+
+        Normalizing a row of raw values is then
+        ``np.clip((raws - lo) * scale, 0, 1)``; fields with an empty range
+        have scale 0 and are flagged in zero_mask. Results are cached and
+        must not be modified.
+
+        Args:
+            metric_names: Metric names in vector order.
+
+        Returns:
+            Float64 arrays (lo, hi, scale) and a boolean zero_mask.
+        """
+        key = tuple(metric_names)
+        cached = self._arrays.get(key)
+        if cached is None:
+            bounds = [self.get_bounds(name) for name in key]
+            lo = np.array([b[0] for b in bounds], dtype=np.float64)
+            hi = np.array([b[1] for b in bounds], dtype=np.float64)
+            zero_mask = hi == lo
+            scale = np.divide(1.0, hi - lo, out=np.zeros_like(lo), where=~zero_mask)
+            for arr in (lo, hi, scale, zero_mask):
+                arr.setflags(write=False)
+            cached = self._arrays[key] = (lo, hi, scale, zero_mask)
+        return cached
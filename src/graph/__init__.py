@@ -4,7 +4,7 @@ This package extracts CodeEntity objects and relationships from ASTNode trees
 and stores them in a NetworkX-backed knowledge graph.
 """
 
-from src.graph.relationship import RelationshipType
+from src.graph.relationship import RelationshipType, Unresolved
 from src.graph.extraction_result import ExtractionResult
 from src.graph.knowledge_graph import KnowledgeGraph
 from src.graph.entity_extractor import EntityExtractor
@@ -12,6 +12,7 @@ from src.graph.graph_builder import GraphBuilder
 
 __all__ = [
     "RelationshipType",
+    "Unresolved",
     "ExtractionResult",
     "KnowledgeGraph",
     "EntityExtractor",
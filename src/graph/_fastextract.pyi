@@ -0,0 +1,9 @@
+from typing import Collection, List, Tuple
+
+from src.parsing.ast_nodes import ASTNode, NodeType
+
+def plan_walk(
+    root: ASTNode,
+    entity_node_types: Collection[NodeType],
+    call_type: NodeType,
+) -> List[Tuple[ASTNode, int]]: ...
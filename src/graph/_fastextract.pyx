@@ -0,0 +1,30 @@
+# cython: language_level=3
+"""Compiled version of entity_extractor._plan_walk.
+
+Built only when Cython is available at install time; entity_extractor.py
+falls back to the pure-Python implementation otherwise. Semantics must
+match entity_extractor._plan_walk exactly.
+"""
+
+
+def plan_walk(root, entity_node_types, call_type):
+    """Return (node, parent_pos) for entity and call nodes in pre-order."""
+    cdef list plan = []
+    cdef list stack = [(root, -1)]
+    cdef list children
+    cdef Py_ssize_t parent, pos, i
+    cdef object node, node_type
+
+    while stack:
+        node, parent = stack.pop()
+        node_type = node.node_type
+        pos = parent
+        if node_type in entity_node_types:
+            pos = len(plan)
+            plan.append((node, parent))
+        elif node_type == call_type:
+            plan.append((node, parent))
+        children = node.children
+        for i in range(len(children) - 1, -1, -1):
+            stack.append((children[i], pos))
+    return plan
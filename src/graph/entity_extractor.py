@@ -1,16 +1,23 @@
 """Extract CodeEntity objects and relationships from ASTNode trees."""
 
 import hashlib
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Collection, Dict, Iterator, List, Optional, Tuple
 
 from src.models.code_entity import CodeEntity, EntityType
 from src.models.source_location import SourceLocation
 from src.parsing.ast_nodes import ASTNode, NodeType
-from src.graph.relationship import RelationshipType
+from src.graph.relationship import RelationshipType, TargetId, Unresolved
 from src.graph.extraction_result import ExtractionResult
 
+try:
+    from src.graph._fastextract import plan_walk as _compiled_plan_walk
+except ImportError:  # Cython extension not built
+    _compiled_plan_walk = None  # type: ignore[assignment]
 
-# NodeType -> EntityType mapping for extractable nodes
+
+# NodeType -> EntityType mapping for extractable nodes. NodeType is a str
+# enum, so this stays a dict; only plan entries (entity and call nodes) are
+# looked up here, the traversal itself just tests membership.
 _NODE_TO_ENTITY: Dict[NodeType, EntityType] = {
     NodeType.MODULE: EntityType.MODULE,
     NodeType.CLASS: EntityType.CLASS,
@@ -22,15 +29,107 @@ _NODE_TO_ENTITY: Dict[NodeType, EntityType] = {
     NodeType.IMPORT: EntityType.IMPORT,
 }
 
-# NodeTypes that represent control-flow containers (classes/functions)
-_CONTAINER_TYPES = {
-    NodeType.MODULE,
-    NodeType.CLASS,
-    NodeType.FUNCTION,
-    NodeType.METHOD,
-    NodeType.CONSTRUCTOR,
+# EntityType -> relationship linking it to its parent; anything else is CONTAINS
+_CONTAINMENT_REL: Dict[EntityType, RelationshipType] = {
+    EntityType.METHOD: RelationshipType.HAS_METHOD,
+    EntityType.CONSTRUCTOR: RelationshipType.HAS_METHOD,
+    EntityType.FIELD: RelationshipType.HAS_FIELD,
+    EntityType.PARAMETER: RelationshipType.HAS_PARAMETER,
 }
 
+# Entity types that can carry a docstring
+_DOCUMENTED_TYPES = frozenset(
+    {
+        EntityType.CLASS,
+        EntityType.FUNCTION,
+        EntityType.METHOD,
+        EntityType.CONSTRUCTOR,
+    }
+)
+
+# ts_type values of nodes that name a modifier keyword
+_MODIFIER_TS = frozenset({"public", "private", "protected", "static", "final", "abstract"})
+
+# ts_type values of nodes whose source text is the modifier list itself
+_MODIFIER_GROUP_TS = frozenset({"modifiers", "modifier"})
+
+# ts_type values of nodes holding a class's superclasses/interfaces
+_INHERITANCE_TS = frozenset(
+    {
+        "argument_list",
+        "superclass",
+        "class_heritage",
+        "superclass_list",
+        "super_interfaces",
+        "extends_type",
+    }
+)
+
+# ts_type values of attribute/member access nodes (obj.method)
+_ATTR_TS = frozenset({"attribute", "member_expression"})
+
+# NodeTypes that represent control-flow containers (classes/functions)
+_CONTAINER_TYPES = frozenset(
+    {
+        NodeType.MODULE,
+        NodeType.CLASS,
+        NodeType.FUNCTION,
+        NodeType.METHOD,
+        NodeType.CONSTRUCTOR,
+    }
+)
+
+# Bytes of hash digest in entity IDs (12 hex characters)
+_ID_DIGEST_SIZE = 6
+
+# (source_id, target_id, type, properties) as stored in ExtractionResult
+_Relationship = Tuple[str, TargetId, RelationshipType, Dict[str, Any]]
+
+
+def _iter_identifier_names(root: ASTNode) -> Iterator[str]:
+    """Yield the names of IDENTIFIER descendants of root in pre-order.
+
+    Iterative, and without the intermediate lists get_descendants builds.
+    """
+    identifier_type = NodeType.IDENTIFIER
+    stack = list(reversed(root.children))
+    while stack:
+        node = stack.pop()
+        if node.node_type == identifier_type and node.name:
+            yield node.name
+        stack.extend(reversed(node.children))
+
+
+def _plan_walk(
+    root: ASTNode,
+    entity_node_types: Collection[NodeType],
+    call_type: NodeType,
+) -> List[Tuple[ASTNode, int]]:
+    """Collect entity and call nodes in pre-order with an explicit stack.
+
+    Each entry is (node, parent_pos), where parent_pos indexes the entry
+    of the nearest enclosing entity node, or -1 at the top level.
+    src/graph/_fastextract.pyx mirrors this function and is used instead
+    when compiled.
+    """
+    plan: List[Tuple[ASTNode, int]] = []
+    stack: List[Tuple[ASTNode, int]] = [(root, -1)]
+    while stack:
+        node, parent = stack.pop()
+        node_type = node.node_type
+        pos = parent
+        if node_type in entity_node_types:
+            pos = len(plan)
+            plan.append((node, parent))
+        elif node_type == call_type:
+            plan.append((node, parent))
+        # Push in reverse so children are visited in source order
+        stack.extend((child, pos) for child in reversed(node.children))
+    return plan
+
+
+_plan = _plan_walk if _compiled_plan_walk is None else _compiled_plan_walk
+
 
 class EntityExtractor:
     """Extracts CodeEntity objects and relationships from an ASTNode tree.
@@ -49,63 +148,66 @@ class EntityExtractor:
         Returns:
             ExtractionResult with entities and relationships.
         """
-        self._entities: List[CodeEntity] = []
-        self._relationships: List[Tuple[str, str, RelationshipType, Dict[str, Any]]] = []
         self._file_path = file_path
         self._language = ast_root.language or "unknown"
 
-        self._walk(ast_root, parent_id=None)
+        entities, relationships = self._walk(ast_root)
 
-        result = ExtractionResult(
+        # The walk's lists are handed over as-is; pooling them per instance
+        # would still need a copy per file to keep results independent.
+        return ExtractionResult(
             file_path=file_path,
-            entities=list(self._entities),
-            relationships=list(self._relationships),
+            entities=entities,
+            relationships=relationships,
         )
-        # Clean up instance state
-        self._entities = []
-        self._relationships = []
-        return result
 
-    def _walk(self, node: ASTNode, parent_id: Optional[str]) -> Optional[str]:
-        """Walk the AST, extracting entities and relationships.
+    def _walk(self, root: ASTNode) -> Tuple[List[CodeEntity], List[_Relationship]]:
+        """Walk the AST iteratively, extracting entities and relationships.
+
+        The traversal itself (_plan_walk, compiled when available) only
+        collects entity and call nodes in pre-order; entities are built
+        from that plan afterwards.
 
         Args:
-            node: Current ASTNode.
-            parent_id: ID of the parent entity (if any).
+            root: Root ASTNode.
 
         Returns:
-            The entity ID if this node was extracted, else None.
+            Entities and relationships in source order.
         """
-        entity_type = _NODE_TO_ENTITY.get(node.node_type)
-        current_id = parent_id
+        entities: List[CodeEntity] = []
+        relationships: List[_Relationship] = []
+
+        # ids[i] is the entity ID for plan[i] (None for call nodes)
+        ids: List[Optional[str]] = []
+        for node, parent_pos in _plan(root, _NODE_TO_ENTITY, NodeType.CALL):
+            parent_id = ids[parent_pos] if parent_pos >= 0 else None
+            entity_type = _NODE_TO_ENTITY.get(node.node_type)
+
+            # Extract call relationships from CALL nodes
+            if entity_type is None:
+                ids.append(None)
+                if parent_id is not None:
+                    self._extract_call(node, parent_id, relationships)
+                continue
 
-        if entity_type is not None:
             entity = self._build_entity(node, entity_type, parent_id)
-            self._entities.append(entity)
-            current_id = entity.id
+            entities.append(entity)
+            ids.append(entity.id)
 
             # Add containment/structural relationships
             if parent_id is not None:
-                rel_type = self._containment_rel_type(entity_type)
-                self._relationships.append((parent_id, entity.id, rel_type, {}))
+                rel_type = _CONTAINMENT_REL.get(entity_type, RelationshipType.CONTAINS)
+                relationships.append((parent_id, entity.id, rel_type, {}))
 
             # Extract inheritance from class nodes
             if entity_type in (EntityType.CLASS, EntityType.INTERFACE):
-                self._extract_inheritance(node, entity.id)
+                self._extract_inheritance(node, entity.id, relationships)
 
             # Extract import relationships
             if entity_type == EntityType.IMPORT:
-                self._extract_import_info(node, entity.id, parent_id)
+                self._extract_import_info(node, entity.id, parent_id, relationships)
 
-        # Extract call relationships from CALL nodes
-        if node.node_type == NodeType.CALL and parent_id is not None:
-            self._extract_call(node, parent_id)
-
-        # Recurse into children
-        for child in node.children:
-            self._walk(child, current_id)
-
-        return current_id
+        return entities, relationships
 
     def _build_entity(
         self,
@@ -128,10 +230,7 @@ class EntityExtractor:
 
         loc = max(node.end_line - node.start_line + 1, 0)
 
-        # Extract modifiers from attributes if present
-        modifiers = self._extract_modifiers(node)
-        signature = self._extract_signature(node, entity_type)
-        docstring = self._extract_docstring(node)
+        modifiers, signature, docstring = self._extract_meta(node, entity_type)
 
         return CodeEntity(
             id=entity_id,
@@ -152,11 +251,15 @@ class EntityExtractor:
         name: str,
         parent_id: Optional[str],
     ) -> str:
-        """Generate a deterministic entity ID."""
+        """Generate a deterministic entity ID.
+
+        BLAKE2b with a 6-byte digest gives the 12 hex characters directly
+        and is much cheaper than SHA-256 on keys this short.
+        """
         key = f"{self._file_path}:{entity_type.value}:{name}"
         if parent_id:
             key += f":{parent_id}"
-        digest = hashlib.sha256(key.encode()).hexdigest()[:12]
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=_ID_DIGEST_SIZE).hexdigest()
         return f"{entity_type.value}_{digest}"
 
     def _fallback_name(self, node: ASTNode, entity_type: EntityType) -> str:
@@ -169,23 +272,18 @@ class EntityExtractor:
             return text[:80] if text else "import"
         return f"anonymous_{node.start_line}"
 
-    def _containment_rel_type(self, entity_type: EntityType) -> RelationshipType:
-        """Determine the containment relationship type for an entity."""
-        mapping = {
-            EntityType.METHOD: RelationshipType.HAS_METHOD,
-            EntityType.CONSTRUCTOR: RelationshipType.HAS_METHOD,
-            EntityType.FIELD: RelationshipType.HAS_FIELD,
-            EntityType.PARAMETER: RelationshipType.HAS_PARAMETER,
-        }
-        return mapping.get(entity_type, RelationshipType.CONTAINS)
-
-    def _extract_call(self, node: ASTNode, caller_id: str) -> None:
+    def _extract_call(
+        self,
+        node: ASTNode,
+        caller_id: str,
+        relationships: List[_Relationship],
+    ) -> None:
         """Extract a call relationship from a CALL node."""
         callee_name = self._resolve_call_name(node)
         if callee_name:
-            # Store as an unresolved reference using a placeholder target ID
-            target_id = f"unresolved:{callee_name}"
-            self._relationships.append(
+            # Store as an unresolved reference using a placeholder target
+            target_id = Unresolved(callee_name)
+            relationships.append(
                 (
                     caller_id,
                     target_id,
@@ -203,8 +301,7 @@ class EntityExtractor:
             # For attribute access like obj.method(), look deeper
             if child.node_type == NodeType.UNKNOWN:
                 # Check attributes for ts_type = 'attribute'
-                ts_type = child.attributes.get("ts_type", "")
-                if ts_type in ("attribute", "member_expression"):
+                if child.attributes.get("ts_type") in _ATTR_TS:
                     return self._extract_attribute_name(child)
         return None
 
@@ -214,43 +311,39 @@ class EntityExtractor:
         identifiers = [c for c in node.children if c.node_type == NodeType.IDENTIFIER and c.name]
         return identifiers[-1].name if identifiers else None
 
-    def _extract_inheritance(self, class_node: ASTNode, class_id: str) -> None:
+    def _extract_inheritance(
+        self,
+        class_node: ASTNode,
+        class_id: str,
+        relationships: List[_Relationship],
+    ) -> None:
         """Extract inheritance relationships from a class node."""
         # Look for argument_list or superclass indicators in children
         for child in class_node.children:
-            ts_type = child.attributes.get("ts_type", "")
-            if ts_type in (
-                "argument_list",
-                "superclass",
-                "class_heritage",
-                "superclass_list",
-                "super_interfaces",
-                "extends_type",
-            ):
+            if child.attributes.get("ts_type") in _INHERITANCE_TS:
                 # Extract parent class names from identifiers
-                for desc in child.get_descendants(NodeType.IDENTIFIER):
-                    if desc.name:
-                        target = f"unresolved:{desc.name}"
-                        self._relationships.append(
-                            (
-                                class_id,
-                                target,
-                                RelationshipType.INHERITS,
-                                {"parent_name": desc.name},
-                            )
+                for name in _iter_identifier_names(child):
+                    relationships.append(
+                        (
+                            class_id,
+                            Unresolved(name),
+                            RelationshipType.INHERITS,
+                            {"parent_name": name},
                         )
+                    )
 
     def _extract_import_info(
         self,
         import_node: ASTNode,
         import_id: str,
         module_id: Optional[str],
+        relationships: List[_Relationship],
     ) -> None:
         """Extract import relationship details."""
         if module_id is None:
             return
         # Link the module to the imported entity
-        self._relationships.append(
+        relationships.append(
             (
                 module_id,
                 import_id,
@@ -259,23 +352,23 @@ class EntityExtractor:
             )
         )
 
-    def _extract_modifiers(self, node: ASTNode) -> List[str]:
-        """Extract access modifiers from a node."""
+    def _extract_meta(
+        self, node: ASTNode, entity_type: EntityType
+    ) -> Tuple[List[str], Optional[str], Optional[str]]:
+        """Extract modifiers, signature and docstring in one pass over children."""
+        documented = entity_type in _DOCUMENTED_TYPES
         modifiers: List[str] = []
+        docstring: Optional[str] = None
         for child in node.children:
-            ts_type = child.attributes.get("ts_type", "")
-            if ts_type == "modifiers" or ts_type == "modifier":
+            # One lookup per child; None (no ts_type) matches no set below
+            ts_type = child.attributes.get("ts_type")
+            if ts_type in _MODIFIER_GROUP_TS:
                 modifiers.append(child.source_text.strip())
-            elif ts_type in (
-                "public",
-                "private",
-                "protected",
-                "static",
-                "final",
-                "abstract",
-            ):
+            elif ts_type in _MODIFIER_TS:
                 modifiers.append(ts_type)
-        return modifiers
+            elif documented and docstring is None and child.node_type == NodeType.BLOCK:
+                docstring = self._block_docstring(child)
+        return modifiers, self._extract_signature(node, entity_type), docstring
 
     def _extract_signature(self, node: ASTNode, entity_type: EntityType) -> Optional[str]:
         """Extract function/method signature."""
@@ -286,23 +379,19 @@ class EntityExtractor:
         ):
             return None
         # Use the first line of source text as signature
-        first_line = node.source_text.split("\n")[0].strip()
+        first_line = node.source_text.partition("\n")[0].strip()
         return first_line[:200] if first_line else None
 
-    def _extract_docstring(self, node: ASTNode) -> Optional[str]:
-        """Extract docstring from a function/class node."""
-        # Look for the first string literal or comment child in a block
-        for child in node.children:
-            if child.node_type == NodeType.BLOCK:
-                for block_child in child.children:
-                    if block_child.node_type == NodeType.UNKNOWN:
-                        ts_type = block_child.attributes.get("ts_type", "")
-                        if ts_type == "expression_statement":
-                            for expr_child in block_child.children:
-                                if (
-                                    expr_child.node_type == NodeType.LITERAL
-                                    and expr_child.source_text.startswith(('"""', "'''", '"', "'"))
-                                ):
-                                    return expr_child.source_text.strip("\"' \n")
-                    break  # Only check the first statement
+    def _block_docstring(self, block: ASTNode) -> Optional[str]:
+        """Return the docstring if the block's first statement is a string literal."""
+        for block_child in block.children:
+            if block_child.node_type == NodeType.UNKNOWN:
+                if block_child.attributes.get("ts_type") == "expression_statement":
+                    for expr_child in block_child.children:
+                        if (
+                            expr_child.node_type == NodeType.LITERAL
+                            and expr_child.source_text.startswith(('"""', "'''", '"', "'"))
+                        ):
+                            return expr_child.source_text.strip("\"' \n")
+            break  # Only check the first statement
         return None
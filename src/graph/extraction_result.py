@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple
 
 from src.models.code_entity import CodeEntity
-from src.graph.relationship import RelationshipType
+from src.graph.relationship import RelationshipType, TargetId
 
 
 @dataclass
@@ -19,6 +19,6 @@ class ExtractionResult:
 
     file_path: str
     entities: List[CodeEntity] = field(default_factory=list)
-    relationships: List[Tuple[str, str, RelationshipType, Dict[str, Any]]] = field(
+    relationships: List[Tuple[str, TargetId, RelationshipType, Dict[str, Any]]] = field(
         default_factory=list
     )
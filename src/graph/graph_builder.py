@@ -1,11 +1,22 @@
 """Builds a KnowledgeGraph from one or more parsed files."""
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 from src.parsing.ast_nodes import ASTNode
 from src.graph.knowledge_graph import KnowledgeGraph
+from src.graph.relationship import Unresolved
 from src.graph.entity_extractor import EntityExtractor
-from src.graph.relationship import RelationshipType
+from src.graph.extraction_result import ExtractionResult
+
+
+# Files handed to each worker process at a time by add_files
+_CHUNKSIZE = 32
+
+
+def _extract_one(ast_root: ASTNode, file_path: str) -> ExtractionResult:
+    """Extract one file; module-level so worker processes can unpickle it."""
+    return EntityExtractor().extract(ast_root, file_path)
 
 
 class GraphBuilder:
@@ -20,17 +31,40 @@ class GraphBuilder:
 
     def add_file(self, ast_root: ASTNode, file_path: str) -> None:
         """Extract entities/relationships from one file and add to graph."""
-        result = self._extractor.extract(ast_root, file_path)
+        self._add_result(self._extractor.extract(ast_root, file_path))
+
+    def add_files(
+        self,
+        files: List[Tuple[ASTNode, str]],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Add multiple files to the graph.
+
+        Args:
+            files: (ast_root, file_path) pairs.
+            max_workers: Extract in this many worker processes. None or 1
+                extracts in the current process; ASTs are pickled to the
+                workers, so this pays off only for large file sets.
+        """
+        if max_workers is None or max_workers <= 1 or len(files) <= 1:
+            for ast_root, file_path in files:
+                self.add_file(ast_root, file_path)
+            return
+
+        roots = [ast_root for ast_root, _ in files]
+        paths = [file_path for _, file_path in files]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields in input order, so the graph is built deterministically
+            for result in executor.map(_extract_one, roots, paths, chunksize=_CHUNKSIZE):
+                self._add_result(result)
+
+    def _add_result(self, result: ExtractionResult) -> None:
+        """Add one file's extracted entities and relationships to the graph."""
         for entity in result.entities:
             self._graph.add_entity(entity)
         for src_id, tgt_id, rel_type, metadata in result.relationships:
             self._graph.add_relationship(src_id, tgt_id, rel_type, metadata)
 
-    def add_files(self, files: List[Tuple[ASTNode, str]]) -> None:
-        """Add multiple files to the graph."""
-        for ast_root, file_path in files:
-            self.add_file(ast_root, file_path)
-
     def update_file(self, ast_root: ASTNode, file_path: str) -> None:
         """Re-extract a file: removes old entities, adds new ones."""
         self._graph.remove_file_entities(file_path)
@@ -39,32 +73,25 @@ class GraphBuilder:
     def resolve_cross_file_references(self) -> None:
         """Resolve unresolved call/inheritance references across files.
 
-        Matches 'unresolved:name' target IDs to actual entity IDs
+        Matches Unresolved placeholder targets to actual entity IDs
         using a name-based lookup. Ambiguous matches are skipped.
         """
+        targets = self._graph.unresolved_targets()
+        if not targets:
+            return
+
         # Build name -> entity_id index
         name_index: Dict[str, List[str]] = {}
         for entity in self._graph.entities.values():
             name_index.setdefault(entity.name, []).append(entity.id)
 
-        # Find edges with unresolved targets
-        edges_to_resolve: List[Tuple[str, str, RelationshipType, dict]] = []
-        for src, tgt, data in self._graph.networkx_graph.edges(data=True):
-            if isinstance(tgt, str) and tgt.startswith("unresolved:"):
-                edges_to_resolve.append((src, tgt, data["type"], data.get("metadata", {})))
-
-        # Resolve each edge
-        for src_id, old_tgt, rel_type, metadata in edges_to_resolve:
-            name = old_tgt.removeprefix("unresolved:")
-            candidates = name_index.get(name, [])
-
+        resolved: Dict[Unresolved, str] = {}
+        for old_tgt in targets:
+            candidates = name_index.get(old_tgt.name, [])
             # Only resolve if there's exactly one match (unambiguous)
             if len(candidates) == 1:
-                new_tgt = candidates[0]
-                # Don't create self-loops
-                if new_tgt != src_id:
-                    self._graph.networkx_graph.remove_edge(src_id, old_tgt)
-                    self._graph.add_relationship(src_id, new_tgt, rel_type, metadata)
+                resolved[old_tgt] = candidates[0]
+        self._graph.retarget_unresolved(resolved)
 
     def build(self) -> KnowledgeGraph:
         """Return the constructed graph."""
@@ -1,11 +1,17 @@
 """In-memory code knowledge graph backed by NetworkX."""
 
+import json
 from typing import Any, Dict, List, Optional, Tuple
 
 import networkx as nx
 
+try:
+    import orjson
+except ImportError:  # orjson not installed; fall back to the json module
+    orjson = None  # type: ignore[assignment]
+
 from src.models.code_entity import CodeEntity, EntityType
-from src.graph.relationship import RelationshipType
+from src.graph.relationship import RelationshipType, TargetId, Unresolved
 
 
 class KnowledgeGraph:
@@ -18,32 +24,58 @@ class KnowledgeGraph:
     def __init__(self) -> None:
         self._graph: nx.DiGraph = nx.DiGraph()
         self._entities: Dict[str, CodeEntity] = {}
+        # file_path -> entity IDs; dict keys keep insertion order, unlike a set
+        self._by_file: Dict[str, Dict[str, None]] = {}
+        self._by_type: Dict[EntityType, Dict[str, None]] = {}
+        # Unresolved target nodes that may still have incoming edges, in
+        # the order they were first referenced
+        self._unresolved: Dict[Unresolved, None] = {}
 
     # --- Entity management ---
 
     def add_entity(self, entity: CodeEntity) -> None:
         """Add a code entity to the graph."""
+        old = self._entities.get(entity.id)
+        if old is not None:
+            self._unindex(old)
         self._entities[entity.id] = entity
+        self._by_file.setdefault(entity.location.file_path, {})[entity.id] = None
+        self._by_type.setdefault(entity.entity_type, {})[entity.id] = None
         self._graph.add_node(entity.id)
 
+    def _unindex(self, entity: CodeEntity) -> None:
+        """Drop an entity from the lookup indexes."""
+        by_file = self._by_file.get(entity.location.file_path)
+        if by_file is not None:
+            by_file.pop(entity.id, None)
+            if not by_file:
+                del self._by_file[entity.location.file_path]
+        by_type = self._by_type.get(entity.entity_type)
+        if by_type is not None:
+            by_type.pop(entity.id, None)
+
     def get_entity(self, entity_id: str) -> Optional[CodeEntity]:
         """Get an entity by ID, or None if not found."""
         return self._entities.get(entity_id)
 
     def get_entities_by_type(self, entity_type: EntityType) -> List[CodeEntity]:
         """Get all entities of a given type."""
-        return [e for e in self._entities.values() if e.entity_type == entity_type]
+        return [self._entities[eid] for eid in self._by_type.get(entity_type, ())]
+
+    def count_entities_by_type(self) -> Dict[EntityType, int]:
+        """Count entities per type without materializing them."""
+        return {t: len(ids) for t, ids in self._by_type.items() if ids}
 
     def get_entities_by_file(self, file_path: str) -> List[CodeEntity]:
         """Get all entities from a given file."""
-        return [e for e in self._entities.values() if e.location.file_path == file_path]
+        return [self._entities[eid] for eid in self._by_file.get(file_path, ())]
 
     # --- Relationship management ---
 
     def add_relationship(
         self,
         source_id: str,
-        target_id: str,
+        target_id: TargetId,
         rel_type: RelationshipType,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
@@ -55,6 +87,8 @@ class KnowledgeGraph:
             self._graph.add_node(source_id)
         if not self._graph.has_node(target_id):
             self._graph.add_node(target_id)
+        if isinstance(target_id, Unresolved):
+            self._unresolved[target_id] = None
         self._graph.add_edge(
             source_id,
             target_id,
@@ -62,12 +96,52 @@ class KnowledgeGraph:
             metadata=metadata or {},
         )
 
+    def unresolved_targets(self) -> List[Unresolved]:
+        """Get unresolved target IDs that still have incoming edges."""
+        pred = self._graph._pred
+        self._unresolved = {t: None for t in self._unresolved if pred.get(t)}
+        return list(self._unresolved)
+
+    def retarget_unresolved(self, resolved: Dict[Unresolved, str]) -> None:
+        """Point edges at resolved entities, keeping each edge's position.
+
+        Edge order matters: the first INHERITS edge is the primary base
+        class. An edge that would become a self-loop is left unresolved.
+        If the source already has an edge to the entity, the two merge
+        and the resolved edge's attributes win.
+
+        Args:
+            resolved: Unresolved target -> entity ID it resolves to.
+        """
+        succ, pred = self._graph._succ, self._graph._pred
+        sources = {src: None for old in resolved for src in pred.get(old, ())}
+        for src in sources:
+            nbrs = succ[src]
+            rewritten: Dict[TargetId, Dict[str, Any]] = {}
+            for tgt, data in nbrs.items():
+                new_tgt = resolved.get(tgt) if isinstance(tgt, Unresolved) else None
+                if new_tgt is None or new_tgt == src:
+                    if tgt in rewritten:
+                        # An earlier resolved edge already landed here
+                        data.update(rewritten[tgt])
+                        pred[tgt][src] = data
+                    rewritten[tgt] = data
+                    continue
+                del pred[tgt][src]
+                if new_tgt in rewritten:
+                    rewritten[new_tgt].update(data)
+                else:
+                    rewritten[new_tgt] = data
+                    pred[new_tgt][src] = data
+            nbrs.clear()
+            nbrs.update(rewritten)
+
     def get_relationships(
         self,
         entity_id: str,
         direction: str = "outgoing",
         rel_type: Optional[RelationshipType] = None,
-    ) -> List[Tuple[str, str, RelationshipType, Dict[str, Any]]]:
+    ) -> List[Tuple[str, TargetId, RelationshipType, Dict[str, Any]]]:
         """Get relationships for an entity.
 
         Args:
@@ -78,15 +152,17 @@ class KnowledgeGraph:
         Returns:
             List of (source_id, target_id, rel_type, metadata) tuples.
         """
-        results: List[Tuple[str, str, RelationshipType, Dict[str, Any]]] = []
+        results: List[Tuple[str, TargetId, RelationshipType, Dict[str, Any]]] = []
 
+        # Read the DiGraph's adjacency dicts directly; the out_edges/in_edges
+        # views cost several times more per call than the edges themselves
         if direction in ("outgoing", "both"):
-            for _, target, data in self._graph.out_edges(entity_id, data=True):
+            for target, data in self._graph._succ.get(entity_id, {}).items():
                 if rel_type is None or data.get("type") == rel_type:
                     results.append((entity_id, target, data["type"], data.get("metadata", {})))
 
         if direction in ("incoming", "both"):
-            for source, _, data in self._graph.in_edges(entity_id, data=True):
+            for source, data in self._graph._pred.get(entity_id, {}).items():
                 if rel_type is None or data.get("type") == rel_type:
                     results.append((source, entity_id, data["type"], data.get("metadata", {})))
 
@@ -164,6 +240,8 @@ class KnowledgeGraph:
             if not rels:
                 break
             parent_id = rels[0][1]
+            if isinstance(parent_id, Unresolved):
+                break
             if parent_id in self._entities:
                 chain.append(self._entities[parent_id])
             current = parent_id
@@ -229,29 +307,45 @@ class KnowledgeGraph:
 
     def remove_file_entities(self, file_path: str) -> None:
         """Remove all entities and their relationships from a given file."""
-        entity_ids = [e.id for e in self._entities.values() if e.location.file_path == file_path]
-        for eid in entity_ids:
+        for eid in self._by_file.pop(file_path, ()):
             if self._graph.has_node(eid):
                 self._graph.remove_node(eid)
-            del self._entities[eid]
+            entity = self._entities.pop(eid)
+            self._by_type[entity.entity_type].pop(eid, None)
 
     # --- Serialization ---
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the graph to a dictionary."""
+        relationships: List[Dict[str, Any]] = []
+        append = relationships.append
+        # Walk the adjacency directly rather than through the edges() view
+        for src, nbrs in self._graph.succ.items():
+            for tgt, data in nbrs.items():
+                append(
+                    {
+                        "source": src,
+                        "target": str(tgt),
+                        "type": data["type"].value,
+                        "metadata": data.get("metadata", {}),
+                    }
+                )
         return {
             "entities": {eid: e.to_dict() for eid, e in self._entities.items()},
-            "relationships": [
-                {
-                    "source": src,
-                    "target": tgt,
-                    "type": data["type"].value,
-                    "metadata": data.get("metadata", {}),
-                }
-                for src, tgt, data in self._graph.edges(data=True)
-            ],
+            "relationships": relationships,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the graph to compact UTF-8 JSON.
+
+        Uses orjson when installed, which encodes the to_dict() output
+        in C; the json module produces the same document otherwise.
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
     def merge(self, other: "KnowledgeGraph") -> None:
         """Merge another graph into this one."""
         for entity in other._entities.values():
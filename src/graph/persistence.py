@@ -1,8 +1,12 @@
 """Graph persistence protocols and in-memory implementation."""
 
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Set
 
 from src.graph.knowledge_graph import KnowledgeGraph
+from src.graph.relationship import Unresolved
+
+# Serialized form of an Unresolved target, as written by to_dict()
+_UNRESOLVED_PREFIX = str(Unresolved(""))
 
 
 class GraphPersistence(Protocol):
@@ -26,10 +30,17 @@ class InMemoryGraphStore:
 
     def __init__(self) -> None:
         self._stored: Optional[Dict[str, Any]] = None
+        # file_path -> entity IDs currently in the snapshot
+        self._file_ids: Dict[str, List[str]] = {}
 
     def save(self, graph: KnowledgeGraph) -> None:
         """Save graph as a dict snapshot."""
         self._stored = graph.to_dict()
+        self._file_ids = {}
+        for eid in self._stored["entities"]:
+            entity = graph.get_entity(eid)
+            if entity is not None:
+                self._file_ids.setdefault(entity.location.file_path, []).append(eid)
 
     def load(self) -> KnowledgeGraph:
         """Load returns a new empty graph (data not reconstructed).
@@ -40,8 +51,62 @@ class InMemoryGraphStore:
         return KnowledgeGraph()
 
     def update_file(self, graph: KnowledgeGraph, file_path: str) -> None:
-        """Re-save the whole graph (no incremental optimization)."""
-        self.save(graph)
+        """Replace one file's slice of the snapshot in place.
+
+        Falls back to a full save when nothing has been saved yet.
+        """
+        if self._stored is None:
+            self.save(graph)
+            return
+
+        entities: Dict[str, Any] = self._stored["entities"]
+        old_ids = set(self._file_ids.pop(file_path, ()))
+        for eid in old_ids:
+            entities.pop(eid, None)
+
+        new_entities = graph.get_entities_by_file(file_path)
+        new_ids = {e.id for e in new_entities}
+        # Sources whose outgoing edges are re-emitted from the graph: the
+        # file's own entities, callers into them, and any source whose
+        # unresolved edge was retargeted by cross-file resolution
+        refresh: Dict[str, None] = {e.id: None for e in new_entities}
+        for entity in new_entities:
+            for src, _, _, _ in graph.get_relationships(entity.id, "incoming"):
+                refresh[src] = None
+        current: Dict[str, Set[str]] = {}
+        for rel in self._stored["relationships"]:
+            src, tgt = rel["source"], rel["target"]
+            if src in refresh or not tgt.startswith(_UNRESOLVED_PREFIX):
+                continue
+            if src not in current:
+                current[src] = {str(t) for _, t, _, _ in graph.get_relationships(src)}
+            if tgt not in current[src]:
+                refresh[src] = None
+
+        relationships = [
+            rel
+            for rel in self._stored["relationships"]
+            if rel["source"] not in refresh
+            and rel["source"] not in old_ids
+            and rel["target"] not in old_ids
+        ]
+        for src in refresh:
+            for _, tgt, rel_type, metadata in graph.get_relationships(src):
+                relationships.append(
+                    {
+                        "source": src,
+                        "target": str(tgt),
+                        "type": rel_type.value,
+                        "metadata": metadata,
+                    }
+                )
+
+        for entity in new_entities:
+            entities[entity.id] = entity.to_dict()
+
+        self._stored["relationships"] = relationships
+        if new_ids:
+            self._file_ids[file_path] = [e.id for e in new_entities]
 
     @property
     def stored_data(self) -> Optional[Dict[str, Any]]:
@@ -1,10 +1,15 @@
 """Relationship types for the code knowledge graph."""
 
 from enum import Enum
+from typing import NamedTuple, Union
 
 
 class RelationshipType(str, Enum):
-    """Types of relationships between code entities in the knowledge graph."""
+    """Types of relationships between code entities in the knowledge graph.
+
+    A str enum so values serialize as-is; members are singletons, so
+    comparing edge types costs no more than with an IntEnum.
+    """
 
     CALLS = "calls"
     INHERITS = "inherits"
@@ -16,3 +21,20 @@ class RelationshipType(str, Enum):
     HAS_FIELD = "has_field"
     HAS_PARAMETER = "has_parameter"
     CONTAINS = "contains"
+
+
+class Unresolved(NamedTuple):
+    """Placeholder target for a reference not yet matched to an entity.
+
+    Used as a graph node in place of an entity ID until
+    GraphBuilder.resolve_cross_file_references finds the entity by name.
+    """
+
+    name: str
+
+    def __str__(self) -> str:
+        return f"unresolved:{self.name}"
+
+
+# Relationship target: an entity ID or an unresolved reference
+TargetId = Union[str, Unresolved]
@@ -3,20 +3,34 @@
 import argparse
 import os
 import sys
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict
+
 from src.utils.logger import setup_logging, get_logger
 from src.config.settings import get_settings
-from src.pipeline.pipeline import AnalysisPipeline, PipelineResult
+from src.models.code_entity import EntityType
+
+if TYPE_CHECKING:
+    from src.pipeline.pipeline import PipelineResult
 
 logger = get_logger(__name__)
 
+# Unsanitized taint flows listed in the summary
+_FLOWS_SHOWN = 5
+
 
-def analyze_path(path: str) -> None:
+def analyze_path(path: str, quiet: bool = False) -> None:
     """Analyze a file or directory through the full pipeline.
 
     Args:
         path: Path to a source file or directory.
+        quiet: Run the analysis without summarizing or printing results.
     """
-    logger.info(f"Analyzing: {path}")
+    # Imported here so that commands other than analyze skip loading the
+    # pipeline (networkx, numpy, the parsers)
+    from src.pipeline.pipeline import AnalysisPipeline
+
+    logger.info("Analyzing: %s", path)
     pipeline = AnalysisPipeline()
 
     if os.path.isdir(path):
@@ -27,46 +41,85 @@ def analyze_path(path: str) -> None:
         print(f"Error: '{path}' is not a valid file or directory")
         return
 
-    _print_results(result, path)
-
+    if not quiet:
+        _render(_summarize(result), path)
 
-def _print_results(result: PipelineResult, path: str) -> None:
-    """Print pipeline results to stdout."""
-    print(f"\n=== Analysis Results for {path} ===")
-    print(f"  Files processed:    {result.files_processed}")
-    print(f"  Entities found:     {result.entities_found}")
-    print(f"  Relationships:      {result.graph.relationship_count}")
-    print(f"  Processing time:    {result.processing_time_seconds:.2f}s")
 
-    # Entity breakdown
-    from src.models.code_entity import EntityType
+def _summarize(result: "PipelineResult") -> Dict[str, Any]:
+    """Collect the figures shown for a pipeline result.
 
-    for etype in EntityType:
-        entities = result.graph.get_entities_by_type(etype)
-        if entities:
-            print(f"  {etype.value:15s}:   {len(entities)}")
+    Returns:
+        Plain dict of counts and metrics, suitable for JSON output.
+    """
+    counts = result.graph.count_entities_by_type()
+    summary: Dict[str, Any] = {
+        "files_processed": result.files_processed,
+        "entities_found": result.entities_found,
+        "relationships": result.graph.relationship_count,
+        "processing_time_seconds": result.processing_time_seconds,
+        "entity_counts": {etype.value: counts[etype] for etype in EntityType if counts.get(etype)},
+        "feature_vectors": len(result.feature_vectors),
+        "cfgs": len(result.cfgs),
+    }
 
-    # Metrics summary
     if result.entity_metrics:
         complexities = [m.cyclomatic_complexity for m in result.entity_metrics.values()]
-        avg_cc = sum(complexities) / len(complexities)
-        max_cc = max(complexities)
-        print(f"\n  Avg complexity:     {avg_cc:.1f}")
-        print(f"  Max complexity:     {max_cc}")
+        summary["avg_complexity"] = sum(complexities) / len(complexities)
+        summary["max_complexity"] = max(complexities)
+
+    if result.taint_flows:
+        summary["taint_flows"] = len(result.taint_flows)
+        summary["unsanitized"] = sum(1 for flow in result.taint_flows if not flow.sanitized)
+        unsanitized = (flow for flow in result.taint_flows if not flow.sanitized)
+        summary["unsanitized_flows"] = [
+            {
+                "vulnerability": flow.sink.vulnerability,
+                "source": flow.source.name,
+                "sink": flow.sink.name,
+            }
+            for flow in islice(unsanitized, _FLOWS_SHOWN)
+        ]
+
+    return summary
+
+
+def _render(summary: Dict[str, Any], path: str) -> None:
+    """Print a summary from _summarize to stdout.
+
+    Lines are collected and written once, so piped output is not
+    flushed line by line.
+    """
+    lines = [
+        f"\n=== Analysis Results for {path} ===",
+        f"  Files processed:    {summary['files_processed']}",
+        f"  Entities found:     {summary['entities_found']}",
+        f"  Relationships:      {summary['relationships']}",
+        f"  Processing time:    {summary['processing_time_seconds']:.2f}s",
+    ]
+
+    # Entity breakdown
+    for etype, count in summary["entity_counts"].items():
+        lines.append(f"  {etype:15s}:   {count}")
+
+    # Metrics summary
+    if "avg_complexity" in summary:
+        lines.append(f"\n  Avg complexity:     {summary['avg_complexity']:.1f}")
+        lines.append(f"  Max complexity:     {summary['max_complexity']}")
 
     # Feature vectors
-    print(f"  Feature vectors:    {len(result.feature_vectors)}")
+    lines.append(f"  Feature vectors:    {summary['feature_vectors']}")
 
     # CFGs
-    print(f"  CFGs built:         {len(result.cfgs)}")
+    lines.append(f"  CFGs built:         {summary['cfgs']}")
 
     # Taint flows
-    if result.taint_flows:
-        unsanitized = [f for f in result.taint_flows if not f.sanitized]
-        print(f"\n  Taint flows found:  {len(result.taint_flows)}")
-        print(f"  Unsanitized:        {len(unsanitized)}")
-        for flow in unsanitized[:5]:
-            print(f"    [{flow.sink.vulnerability}] " f"{flow.source.name} -> {flow.sink.name}")
+    if "taint_flows" in summary:
+        lines.append(f"\n  Taint flows found:  {summary['taint_flows']}")
+        lines.append(f"  Unsanitized:        {summary['unsanitized']}")
+        for flow in summary["unsanitized_flows"]:
+            lines.append(f"    [{flow['vulnerability']}] {flow['source']} -> {flow['sink']}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> int:
@@ -84,6 +137,9 @@ def main() -> int:
     # Analyze command
     analyze_parser = subparsers.add_parser("analyze", help="Analyze code files")
     analyze_parser.add_argument("path", help="Path to file or directory to analyze")
+    analyze_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Run the analysis without printing results"
+    )
 
     # Version command
     subparsers.add_parser("version", help="Show version information")
@@ -96,7 +152,7 @@ def main() -> int:
 
     # Handle commands
     if args.command == "analyze":
-        analyze_path(args.path)
+        analyze_path(args.path, quiet=args.quiet)
         return 0
 
     elif args.command == "version":
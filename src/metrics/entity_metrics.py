@@ -1,16 +1,31 @@
 """Per-entity code metrics computed from AST trees."""
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 
 from src.parsing.ast_nodes import ASTNode, NodeType
-
+from src.utils.compat import DATACLASS_SLOTS
 
 # NodeTypes that represent control-flow branches
-_BRANCH_TYPES = {NodeType.IF, NodeType.FOR, NodeType.WHILE, NodeType.TRY}
+_BRANCH_TYPES = frozenset({NodeType.IF, NodeType.FOR, NodeType.WHILE, NodeType.TRY})
+
+# Branch NodeTypes that are loops
+_LOOP_TYPES = frozenset({NodeType.FOR, NodeType.WHILE})
+
+# Operator tokens (ts_type of a BINARY_OP's operator child) that count as
+# decision points
+_BOOLEAN_OPS = frozenset({"and", "or", "&&", "||"})
 
+# Child node types that do not count as logical lines
+_NON_STATEMENT_TYPES = frozenset({NodeType.COMMENT, NodeType.UNKNOWN, NodeType.BLOCK})
 
-@dataclass
+# Subtree tally reused by enclosing entities: (type counts including the
+# subtree root, branch nodes, sum of their depths, max depth, boolean ops)
+_Tally = Tuple[Dict[NodeType, int], int, int, int, int]
+
+
+# Created per entity; slots drop the per-instance __dict__
+@dataclass(**DATACLASS_SLOTS)
 class EntityMetrics:
     """Computed metrics for a single code entity.
 
@@ -49,6 +64,8 @@ class EntityMetricsCalculator:
     def compute(self, node: ASTNode, entity_id: str) -> EntityMetrics:
         """Compute all metrics for a single entity's AST subtree.
 
+        Every metric is gathered in one iterative pass over the subtree.
+
         Args:
             node: Root ASTNode of the entity (function, class, etc.).
             entity_id: The entity's ID.
@@ -56,19 +73,108 @@ class EntityMetricsCalculator:
         Returns:
             EntityMetrics with all computed values.
         """
+        return self._compute(node, entity_id, None)
+
+    def compute_nested(self, entities: List[Tuple[ASTNode, str]]) -> Dict[str, EntityMetrics]:
+        """Compute metrics for entities whose subtrees may contain each other.
+
+        Inner entities are computed first and their subtree tallies are
+        reused by the entities enclosing them, so a module or class does
+        not walk its methods again. Results equal calling compute() on
+        each entity.
+
+        Args:
+            entities: (node, entity_id) pairs in AST pre-order.
+
+        Returns:
+            entity_id -> EntityMetrics, in the order given.
+        """
+        tallies: Dict[int, _Tally] = {}
+        # Reversed pre-order visits every descendant before its ancestors
+        computed = {
+            entity_id: self._compute(node, entity_id, tallies)
+            for node, entity_id in reversed(entities)
+        }
+        return {entity_id: computed[entity_id] for _, entity_id in entities}
+
+    def _compute(
+        self,
+        node: ASTNode,
+        entity_id: str,
+        tallies: Optional[Dict[int, _Tally]],
+    ) -> EntityMetrics:
+        """Compute metrics, reusing and recording subtree tallies if given."""
+        counts: Dict[NodeType, int] = {}
+        # Branch nodes (the entity itself included) and their depths
+        branches = 0
+        depth_sum = 0
+        depth_max = 0
+        boolean_ops = 0
+        logical_lines = 0
+
+        # (node, nesting depth, whether the node is a statement of the body)
+        stack: List[Tuple[ASTNode, int, bool]] = [(node, 0, False)]
+        while stack:
+            current, depth, is_statement = stack.pop()
+            node_type = current.node_type
+
+            # Logical lines are the entity's direct statements, looking
+            # through nested blocks
+            if is_statement and node_type not in _NON_STATEMENT_TYPES:
+                logical_lines += 1
+
+            if tallies is not None and current is not node and id(current) in tallies:
+                # A nested entity already tallied: shift its depths by ours
+                sub_counts, sub_branches, sub_sum, sub_max, sub_bool = tallies[id(current)]
+                for t, c in sub_counts.items():
+                    counts[t] = counts.get(t, 0) + c
+                if sub_branches:
+                    branches += sub_branches
+                    depth_sum += sub_sum + depth * sub_branches
+                    depth_max = max(depth_max, sub_max + depth)
+                boolean_ops += sub_bool
+                continue
+
+            counts[node_type] = counts.get(node_type, 0) + 1
+            if node_type in _BRANCH_TYPES:
+                depth += 1
+                branches += 1
+                depth_sum += depth
+                depth_max = max(depth_max, depth)
+            elif node_type == NodeType.BINARY_OP:
+                # Check the operator token itself; scanning source_text also
+                # matched operands, string literals and enclosing expressions
+                for child in current.children:
+                    if child.attributes.get("ts_type") in _BOOLEAN_OPS:
+                        boolean_ops += 1
+                        break
+
+            children_are_statements = current is node or (
+                is_statement and node_type == NodeType.BLOCK
+            )
+            for child in current.children:
+                stack.append((child, depth, children_are_statements))
+
+        if tallies is not None:
+            tallies[id(node)] = (dict(counts), branches, depth_sum, depth_max, boolean_ops)
+
+        # Type counts cover descendants only
+        counts[node.node_type] -= 1
+
         metrics = EntityMetrics(entity_id=entity_id)
         metrics.lines_of_code = self._compute_loc(node)
-        metrics.logical_lines = self._compute_logical_lines(node)
-        metrics.cyclomatic_complexity = self._compute_cyclomatic(node)
-        max_depth, avg_depth = self._compute_nesting_depth(node)
-        metrics.nesting_depth_max = max_depth
-        metrics.nesting_depth_avg = avg_depth
-        metrics.parameter_count = self._count_type(node, NodeType.PARAMETER)
-        metrics.return_count = self._count_type(node, NodeType.RETURN)
-        metrics.branch_count = self._count_branches(node)
-        metrics.loop_count = self._count_loops(node)
-        metrics.comment_count = self._count_type(node, NodeType.COMMENT)
-        metrics.call_count = self._count_type(node, NodeType.CALL)
+        metrics.logical_lines = logical_lines
+        # Decision points: every branch node plus every boolean operator
+        metrics.cyclomatic_complexity = 1 + branches + boolean_ops
+        if branches:
+            metrics.nesting_depth_max = depth_max
+            metrics.nesting_depth_avg = depth_sum / branches
+        metrics.parameter_count = counts.get(NodeType.PARAMETER, 0)
+        metrics.return_count = counts.get(NodeType.RETURN, 0)
+        metrics.branch_count = sum(counts.get(t, 0) for t in _BRANCH_TYPES)
+        metrics.loop_count = sum(counts.get(t, 0) for t in _LOOP_TYPES)
+        metrics.comment_count = counts.get(NodeType.COMMENT, 0)
+        metrics.call_count = counts.get(NodeType.CALL, 0)
         return metrics
 
     def _compute_loc(self, node: ASTNode) -> int:
@@ -76,84 +182,3 @@ class EntityMetricsCalculator:
         if node.end_line <= 0 or node.start_line <= 0:
             return 0
         return max(node.end_line - node.start_line + 1, 0)
-
-    def _compute_logical_lines(self, node: ASTNode) -> int:
-        """Count non-comment, non-blank logical lines (approximate).
-
-        Counts direct statement-level children as logical lines.
-        """
-        count = 0
-        for child in node.children:
-            if child.node_type not in (
-                NodeType.COMMENT,
-                NodeType.UNKNOWN,
-                NodeType.BLOCK,
-            ):
-                count += 1
-            # Recurse into blocks
-            if child.node_type == NodeType.BLOCK:
-                count += self._compute_logical_lines(child)
-        return count
-
-    def _compute_cyclomatic(self, node: ASTNode) -> int:
-        """Compute McCabe cyclomatic complexity.
-
-        Starts at 1 and adds 1 for each decision point:
-        IF, FOR, WHILE, TRY, boolean AND/OR operators.
-        """
-        complexity = 1
-        complexity += self._count_decision_points(node)
-        return complexity
-
-    def _count_decision_points(self, node: ASTNode) -> int:
-        """Recursively count decision points in the AST."""
-        count = 0
-        if node.node_type in _BRANCH_TYPES:
-            count += 1
-        # Count boolean operators (and/or) as decision points
-        if node.node_type == NodeType.BINARY_OP:
-            op_text = node.source_text.strip()
-            if " and " in op_text or " or " in op_text:
-                count += 1
-            elif "&&" in op_text or "||" in op_text:
-                count += 1
-        for child in node.children:
-            count += self._count_decision_points(child)
-        return count
-
-    def _compute_nesting_depth(self, node: ASTNode) -> Tuple[int, float]:
-        """Compute max and average nesting depth of control structures.
-
-        Returns:
-            (max_depth, avg_depth) tuple.
-        """
-        depths: list[int] = []
-        self._collect_nesting_depths(node, 0, depths)
-        if not depths:
-            return 0, 0.0
-        return max(depths), sum(depths) / len(depths)
-
-    def _collect_nesting_depths(self, node: ASTNode, current_depth: int, depths: list) -> None:
-        """Collect depths of all control-flow nodes."""
-        if node.node_type in _BRANCH_TYPES:
-            depths.append(current_depth + 1)
-            for child in node.children:
-                self._collect_nesting_depths(child, current_depth + 1, depths)
-        else:
-            for child in node.children:
-                self._collect_nesting_depths(child, current_depth, depths)
-
-    def _count_type(self, node: ASTNode, node_type: NodeType) -> int:
-        """Count descendants of a given type."""
-        return len(node.get_descendants(node_type))
-
-    def _count_branches(self, node: ASTNode) -> int:
-        """Count branch statements (if/for/while/try)."""
-        count = 0
-        for bt in _BRANCH_TYPES:
-            count += len(node.get_descendants(bt))
-        return count
-
-    def _count_loops(self, node: ASTNode) -> int:
-        """Count loop statements (for/while)."""
-        return len(node.get_descendants(NodeType.FOR)) + len(node.get_descendants(NodeType.WHILE))
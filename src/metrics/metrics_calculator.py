@@ -1,15 +1,74 @@
 """Facade for computing both entity and structural metrics."""
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
+from src.analysis.cache import AnalysisCache
 from src.graph.knowledge_graph import KnowledgeGraph
 from src.metrics.entity_metrics import EntityMetrics, EntityMetricsCalculator
 from src.metrics.structural_metrics import (
     StructuralMetrics,
     StructuralMetricsCalculator,
 )
-from src.parsing.ast_nodes import ASTNode
+from src.parsing.ast_nodes import ASTNode, NodeType
+
+# AST node types that can carry an entity, indexed by start line
+_SIGNIFICANT_TYPES = frozenset(
+    {
+        NodeType.MODULE,
+        NodeType.CLASS,
+        NodeType.FUNCTION,
+        NodeType.METHOD,
+        NodeType.CONSTRUCTOR,
+        NodeType.FIELD,
+    }
+)
+
+# AnalysisCache kind for a file's entity metrics
+_METRICS_KIND = "entity_metrics"
+
+# Files handed to each worker process at a time by compute_all
+_CHUNKSIZE = 8
+
+
+def _index_ast_by_line(root: ASTNode) -> Dict[int, ASTNode]:
+    """Build an index of AST nodes by their start line.
+
+    Only significant nodes (classes, functions, etc.) are indexed;
+    on a shared line the last one in pre-order wins.
+    """
+    index: Dict[int, ASTNode] = {}
+    stack: List[ASTNode] = [root]
+    while stack:
+        node = stack.pop()
+        if node.node_type in _SIGNIFICANT_TYPES:
+            index[node.start_line] = node
+        stack.extend(reversed(node.children))
+    return index
+
+
+def _compute_file_metrics(
+    ast_nodes_by_line: Dict[int, ASTNode],
+    entities: List[Tuple[str, int]],
+    calc: EntityMetricsCalculator,
+) -> Dict[str, EntityMetrics]:
+    """Compute metrics for one file's (entity_id, start_line) pairs."""
+    nodes: List[Tuple[ASTNode, str]] = []
+    for entity_id, start_line in entities:
+        ast_node = ast_nodes_by_line.get(start_line)
+        if ast_node is not None:
+            nodes.append((ast_node, entity_id))
+    # Start-line order is pre-order for nested entities, so modules and
+    # classes reuse the tallies of the methods inside them
+    ordered = sorted(nodes, key=lambda pair: pair[0].start_line)
+    computed = calc.compute_nested(ordered)
+    return {entity_id: computed[entity_id] for _, entity_id in nodes}
+
+
+def _compute_one(ast_root: ASTNode, entities: List[Tuple[str, int]]) -> Dict[str, EntityMetrics]:
+    """Compute one file's metrics; module-level so worker processes can unpickle it."""
+    return _compute_file_metrics(_index_ast_by_line(ast_root), entities, EntityMetricsCalculator())
 
 
 @dataclass
@@ -28,20 +87,30 @@ class MetricsResult:
 class MetricsCalculator:
     """Coordinates entity and structural metrics computation."""
 
-    def __init__(self) -> None:
+    def __init__(self, analysis_cache: Optional[AnalysisCache] = None) -> None:
         self._entity_calc = EntityMetricsCalculator()
         self._structural_calc = StructuralMetricsCalculator()
+        self._analysis_cache = analysis_cache
+        # file_path -> (AST root, line index); reused while the root is unchanged
+        self._line_indexes: Dict[str, Tuple[ASTNode, Dict[int, ASTNode]]] = {}
 
     def compute_all(
         self,
         graph: KnowledgeGraph,
         ast_map: Dict[str, ASTNode],
+        max_workers: Optional[int] = None,
+        digests: Optional[Dict[str, bytes]] = None,
     ) -> MetricsResult:
         """Compute all metrics for entities in the graph.
 
         Args:
             graph: The knowledge graph with entities/relationships.
             ast_map: Mapping of file_path -> root ASTNode.
+            max_workers: Compute entity metrics in this many worker
+                processes. None or 1 computes them in the current process.
+            digests: file_path -> content digest. With an analysis cache,
+                a file whose digest has cached entity metrics is not
+                recomputed.
 
         Returns:
             MetricsResult with both entity and structural metrics.
@@ -49,7 +118,7 @@ class MetricsCalculator:
         result = MetricsResult()
 
         # Compute entity metrics using AST nodes
-        result.entity_metrics = self._compute_entity_metrics(graph, ast_map)
+        result.entity_metrics = self._compute_entity_metrics(graph, ast_map, max_workers, digests)
 
         # Compute structural metrics from graph
         result.structural_metrics = self._structural_calc.compute_all(graph)
@@ -60,45 +129,55 @@ class MetricsCalculator:
         self,
         graph: KnowledgeGraph,
         ast_map: Dict[str, ASTNode],
+        max_workers: Optional[int] = None,
+        digests: Optional[Dict[str, bytes]] = None,
     ) -> Dict[str, EntityMetrics]:
         """Compute entity metrics by matching entities to AST nodes."""
-        metrics: Dict[str, EntityMetrics] = {}
+        by_file: Dict[str, Dict[str, EntityMetrics]] = {}
+        cache = self._analysis_cache
+        digests = digests or {}
 
+        # Plain (id, start_line) pairs keep what is pickled to workers small
+        pending: List[Tuple[str, ASTNode, List[Tuple[str, int]]]] = []
         for file_path, ast_root in ast_map.items():
-            entities = graph.get_entities_by_file(file_path)
-            ast_nodes_by_line = self._index_ast_by_line(ast_root)
-
-            for entity in entities:
-                ast_node = ast_nodes_by_line.get(entity.location.start_line)
-                if ast_node is not None:
-                    metrics[entity.id] = self._entity_calc.compute(ast_node, entity.id)
-
+            digest = digests.get(file_path)
+            if cache is not None and digest is not None:
+                cached_metrics = cache.load(file_path, digest, _METRICS_KIND)
+                if cached_metrics is not None:
+                    by_file[file_path] = cached_metrics
+                    continue
+            entities = [
+                (e.id, e.location.start_line) for e in graph.get_entities_by_file(file_path)
+            ]
+            pending.append((file_path, ast_root, entities))
+
+        if max_workers is None or max_workers <= 1 or len(pending) <= 1:
+            for file_path, ast_root, entities in pending:
+                cached = self._line_indexes.get(file_path)
+                if cached is not None and cached[0] is ast_root:
+                    ast_nodes_by_line = cached[1]
+                else:
+                    ast_nodes_by_line = _index_ast_by_line(ast_root)
+                    self._line_indexes[file_path] = (ast_root, ast_nodes_by_line)
+                by_file[file_path] = _compute_file_metrics(
+                    ast_nodes_by_line, entities, self._entity_calc
+                )
+        else:
+            roots = [ast_root for _, ast_root, _ in pending]
+            entity_lists = [entities for _, _, entities in pending]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(_compute_one, roots, entity_lists, chunksize=_CHUNKSIZE)
+                for (file_path, _, _), file_metrics in zip(pending, results):
+                    by_file[file_path] = file_metrics
+
+        if cache is not None:
+            for file_path, _, _ in pending:
+                digest = digests.get(file_path)
+                if digest is not None:
+                    cache.store(file_path, digest, _METRICS_KIND, by_file[file_path])
+
+        # Merge in ast_map order so hits and misses give the same ordering
+        metrics: Dict[str, EntityMetrics] = {}
+        for file_path in ast_map:
+            metrics.update(by_file[file_path])
         return metrics
-
-    def _index_ast_by_line(self, root: ASTNode) -> Dict[int, ASTNode]:
-        """Build an index of AST nodes by their start line.
-
-        Prefers nodes that are significant (classes, functions, etc.)
-        over generic nodes.
-        """
-        index: Dict[int, ASTNode] = {}
-        self._collect_by_line(root, index)
-        return index
-
-    def _collect_by_line(self, node: ASTNode, index: Dict[int, ASTNode]) -> None:
-        """Recursively collect nodes indexed by start line."""
-        # Only index "significant" nodes
-        from src.parsing.ast_nodes import NodeType
-
-        significant = {
-            NodeType.MODULE,
-            NodeType.CLASS,
-            NodeType.FUNCTION,
-            NodeType.METHOD,
-            NodeType.CONSTRUCTOR,
-            NodeType.FIELD,
-        }
-        if node.node_type in significant:
-            index[node.start_line] = node
-        for child in node.children:
-            self._collect_by_line(child, index)
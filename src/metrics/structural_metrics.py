@@ -1,13 +1,29 @@
 """Structural/coupling metrics computed from the knowledge graph."""
 
 from dataclasses import dataclass
-from typing import Dict, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 from src.graph.knowledge_graph import KnowledgeGraph
-from src.graph.relationship import RelationshipType
+from src.graph.relationship import RelationshipType, TargetId, Unresolved
+from src.metrics._kernels import shared_pairs
+from src.utils.compat import DATACLASS_SLOTS
+
+# Relationship types that count towards afferent/efferent coupling
+_DEPENDENCY_TYPES = frozenset(
+    {RelationshipType.CALLS, RelationshipType.USES, RelationshipType.DEPENDS_ON}
+)
+
+# (source_id, target_id, rel_type, metadata) as returned by get_relationships
+_Relationship = Tuple[str, TargetId, RelationshipType, Dict[str, Any]]
 
+# Classes with fewer methods than this compare method pairs in Python;
+# below it building the access matrix costs more than the pairwise loop
+_LCOM_NUMPY_MIN_METHODS = 50
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class StructuralMetrics:
     """Structural metrics for a code entity (typically class-level).
 
@@ -41,15 +57,31 @@ class StructuralMetrics:
 class StructuralMetricsCalculator:
     """Computes structural metrics from a KnowledgeGraph."""
 
-    def compute(self, graph: KnowledgeGraph, entity_id: str) -> StructuralMetrics:
-        """Compute structural metrics for a single entity."""
+    def compute(
+        self,
+        graph: KnowledgeGraph,
+        entity_id: str,
+        inheritance_depths: Optional[Dict[str, int]] = None,
+    ) -> StructuralMetrics:
+        """Compute structural metrics for a single entity.
+
+        Args:
+            graph: The knowledge graph.
+            entity_id: The entity's ID.
+            inheritance_depths: Precomputed DIT per class, as built by
+                compute_all; computed on demand when omitted.
+        """
         metrics = StructuralMetrics(entity_id=entity_id)
 
-        fan_in, fan_out = self._compute_fan_in_out(graph, entity_id)
+        # Fetch the entity's edges once; the helpers filter them locally
+        outgoing = graph.get_relationships(entity_id, direction="outgoing")
+        incoming = graph.get_relationships(entity_id, direction="incoming")
+
+        fan_in, fan_out = self._compute_fan_in_out(incoming, outgoing)
         metrics.fan_in = fan_in
         metrics.fan_out = fan_out
 
-        ca, ce = self._compute_coupling(graph, entity_id)
+        ca, ce = self._compute_coupling(incoming, outgoing)
         metrics.afferent_coupling = ca
         metrics.efferent_coupling = ce
         metrics.coupling_between_objects = ca + ce
@@ -60,59 +92,38 @@ class StructuralMetricsCalculator:
         entity = graph.get_entity(entity_id)
         if entity and entity.is_class_like():
             metrics.lack_of_cohesion = self._compute_lcom(graph, entity_id)
-            metrics.depth_of_inheritance = self._compute_dit(graph, entity_id)
-            metrics.number_of_children = self._compute_noc(graph, entity_id)
+            if inheritance_depths is not None:
+                metrics.depth_of_inheritance = inheritance_depths[entity_id]
+            else:
+                metrics.depth_of_inheritance = self._compute_dit(graph, entity_id)
+            metrics.number_of_children = self._compute_noc(incoming)
 
         return metrics
 
     def compute_all(self, graph: KnowledgeGraph) -> Dict[str, StructuralMetrics]:
         """Compute structural metrics for all entities in the graph."""
-        return {eid: self.compute(graph, eid) for eid in graph.entities}
+        depths = self._compute_all_dit(graph)
+        return {eid: self.compute(graph, eid, depths) for eid in graph.entities}
 
-    def _compute_fan_in_out(self, graph: KnowledgeGraph, entity_id: str) -> Tuple[int, int]:
+    def _compute_fan_in_out(
+        self, incoming: List[_Relationship], outgoing: List[_Relationship]
+    ) -> Tuple[int, int]:
         """Count incoming and outgoing CALLS edges."""
-        fan_in = len(
-            graph.get_relationships(
-                entity_id,
-                direction="incoming",
-                rel_type=RelationshipType.CALLS,
-            )
-        )
-        fan_out = len(
-            graph.get_relationships(
-                entity_id,
-                direction="outgoing",
-                rel_type=RelationshipType.CALLS,
-            )
-        )
+        fan_in = sum(1 for rel in incoming if rel[2] == RelationshipType.CALLS)
+        fan_out = sum(1 for rel in outgoing if rel[2] == RelationshipType.CALLS)
         return fan_in, fan_out
 
-    def _compute_coupling(self, graph: KnowledgeGraph, entity_id: str) -> Tuple[int, int]:
+    def _compute_coupling(
+        self, incoming: List[_Relationship], outgoing: List[_Relationship]
+    ) -> Tuple[int, int]:
         """Compute afferent (Ca) and efferent (Ce) coupling.
 
         Ca = number of distinct classes that depend on this class.
         Ce = number of distinct classes this class depends on.
         Considers CALLS, USES, and DEPENDS_ON relationships.
         """
-        dep_types = (
-            RelationshipType.CALLS,
-            RelationshipType.USES,
-            RelationshipType.DEPENDS_ON,
-        )
-
-        ca_set: Set[str] = set()
-        ce_set: Set[str] = set()
-
-        for rel_type in dep_types:
-            for src, _, _, _ in graph.get_relationships(
-                entity_id, direction="incoming", rel_type=rel_type
-            ):
-                ca_set.add(src)
-            for _, tgt, _, _ in graph.get_relationships(
-                entity_id, direction="outgoing", rel_type=rel_type
-            ):
-                ce_set.add(tgt)
-
+        ca_set: Set[str] = {src for src, _, rel, _ in incoming if rel in _DEPENDENCY_TYPES}
+        ce_set: Set[TargetId] = {tgt for _, tgt, rel, _ in outgoing if rel in _DEPENDENCY_TYPES}
         return len(ca_set), len(ce_set)
 
     def _compute_lcom(self, graph: KnowledgeGraph, class_id: str) -> float:
@@ -129,49 +140,93 @@ class StructuralMetricsCalculator:
         if len(methods) <= 1 or not fields:
             return 0.0
 
-        field_ids = {f.id for f in fields}
+        field_index: Dict[TargetId, int] = {f.id: i for i, f in enumerate(fields)}
 
-        # For each method, find which fields it accesses
-        method_fields: Dict[str, Set[str]] = {}
+        # For each method, a bitmask of the fields it accesses (bit k is
+        # field k); Python ints grow, so any field count fits
+        masks: List[int] = []
+        rows: List[int] = []
+        cols: List[int] = []
         for method in methods:
-            accessed = set()
+            mask = 0
             for _, tgt, rel, _ in graph.get_relationships(
                 method.id,
                 direction="outgoing",
                 rel_type=RelationshipType.USES,
             ):
-                if tgt in field_ids:
-                    accessed.add(tgt)
-            method_fields[method.id] = accessed
-
-        # Count pairs
-        method_list = list(method_fields.keys())
-        p = 0  # pairs with no shared fields
-        q = 0  # pairs with shared fields
-
-        for i in range(len(method_list)):
-            for j in range(i + 1, len(method_list)):
-                shared = method_fields[method_list[i]] & method_fields[method_list[j]]
-                if shared:
-                    q += 1
-                else:
-                    p += 1
-
-        total = p + q
-        if total == 0:
-            return 0.0
+                idx = field_index.get(tgt)
+                if idx is not None:
+                    mask |= 1 << idx
+                    rows.append(len(masks))
+                    cols.append(idx)
+            masks.append(mask)
+
+        m = len(masks)
+        total = m * (m - 1) // 2
+        if m < _LCOM_NUMPY_MIN_METHODS:
+            q = 0  # pairs with shared fields
+            for i in range(m):
+                mask_i = masks[i]
+                for j in range(i + 1, m):
+                    if mask_i & masks[j]:
+                        q += 1
+        else:
+            # access[i, k] is True when method i uses field k
+            access = np.zeros((m, len(fields)), dtype=bool)
+            access[rows, cols] = True
+            q = int(shared_pairs(access))
+        p = total - q  # pairs with no shared fields
         return max((p - q) / total, 0.0)
 
     def _compute_dit(self, graph: KnowledgeGraph, class_id: str) -> int:
         """Compute Depth of Inheritance Tree."""
         return len(graph.get_inheritance_chain(class_id))
 
-    def _compute_noc(self, graph: KnowledgeGraph, class_id: str) -> int:
-        """Compute Number of Children (direct subclasses)."""
-        return len(
-            graph.get_relationships(
-                class_id,
-                direction="incoming",
-                rel_type=RelationshipType.INHERITS,
-            )
+    def _compute_all_dit(self, graph: KnowledgeGraph) -> Dict[str, int]:
+        """Compute DIT for every class-like entity, sharing ancestor chains.
+
+        Gives the same result as _compute_dit: a chain follows each
+        class's first parent, and a cycle counts each of its entities once.
+        """
+        entities = graph.entities
+        depths: Dict[str, int] = {}
+        for class_id, entity in entities.items():
+            if class_id in depths or not entity.is_class_like():
+                continue
+
+            # Walk first parents until a known depth, a root or a cycle
+            path: List[str] = []
+            on_path: Dict[str, int] = {}
+            current: Optional[str] = class_id
+            while current is not None and current not in depths and current not in on_path:
+                on_path[current] = len(path)
+                path.append(current)
+                current = self._first_parent(graph, current)
+
+            end = len(path) - 1
+            if current is None:
+                depths[path[end]] = 0
+            elif current in on_path:
+                # Every class on a cycle sees the whole cycle as its chain
+                end = on_path[current]
+                cycle_depth = sum(1 for node in path[end:] if node in entities)
+                for node in path[end:]:
+                    depths[node] = cycle_depth
+            else:
+                depths[path[end]] = (current in entities) + depths[current]
+            for i in range(end - 1, -1, -1):
+                depths[path[i]] = (path[i + 1] in entities) + depths[path[i + 1]]
+        return depths
+
+    def _first_parent(self, graph: KnowledgeGraph, class_id: str) -> Optional[str]:
+        """The first INHERITS target, as followed by get_inheritance_chain."""
+        rels = graph.get_relationships(
+            class_id, direction="outgoing", rel_type=RelationshipType.INHERITS
         )
+        if not rels or isinstance(rels[0][1], Unresolved):
+            return None
+        return rels[0][1]
+
+    def _compute_noc(self, incoming: List[_Relationship]) -> int:
+        """Compute Number of Children (direct subclasses)."""
+        return sum(1 for rel in incoming if rel[2] == RelationshipType.INHERITS)
@@ -23,6 +23,13 @@ class EntityType(str, Enum):
     IMPORT = "import"
 
 
+# Entity types that have a body of statements
+_FUNCTION_LIKE_TYPES = frozenset({EntityType.FUNCTION, EntityType.METHOD, EntityType.CONSTRUCTOR})
+
+# Entity types that declare members
+_CLASS_LIKE_TYPES = frozenset({EntityType.CLASS, EntityType.INTERFACE})
+
+
 class CodeEntity(BaseModel):
     """Represents a code entity (class, function, variable, etc.).
 
@@ -73,11 +80,7 @@ class CodeEntity(BaseModel):
         Returns:
             True if entity is a function, method, or constructor
         """
-        return self.entity_type in {
-            EntityType.FUNCTION,
-            EntityType.METHOD,
-            EntityType.CONSTRUCTOR,
-        }
+        return self.entity_type in _FUNCTION_LIKE_TYPES
 
     def is_class_like(self) -> bool:
         """Check if this entity is class-like (class, interface).
@@ -85,7 +88,7 @@ class CodeEntity(BaseModel):
         Returns:
             True if entity is a class or interface
         """
-        return self.entity_type in {EntityType.CLASS, EntityType.INTERFACE}
+        return self.entity_type in _CLASS_LIKE_TYPES
 
     def is_public(self) -> bool:
         """Check if this entity is public.
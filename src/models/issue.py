@@ -55,6 +55,27 @@ class Severity(str, Enum):
     INFO = "info"  # Informational only
 
 
+# Base priority score for each severity
+_SEVERITY_SCORES = {
+    Severity.CRITICAL: 10.0,
+    Severity.HIGH: 7.0,
+    Severity.MEDIUM: 4.0,
+    Severity.LOW: 2.0,
+    Severity.INFO: 0.5,
+}
+
+# Issue types that count as security issues
+_SECURITY_TYPES = frozenset(
+    {
+        IssueType.SQL_INJECTION,
+        IssueType.XSS_VULNERABILITY,
+        IssueType.AUTHENTICATION_ISSUE,
+        IssueType.SENSITIVE_DATA_EXPOSURE,
+        IssueType.CRYPTO_MISUSE,
+    }
+)
+
+
 class Issue(BaseModel):
     """Represents a code quality issue or code smell.
 
@@ -120,14 +141,7 @@ class Issue(BaseModel):
         Returns:
             True if issue is security-related
         """
-        security_types = {
-            IssueType.SQL_INJECTION,
-            IssueType.XSS_VULNERABILITY,
-            IssueType.AUTHENTICATION_ISSUE,
-            IssueType.SENSITIVE_DATA_EXPOSURE,
-            IssueType.CRYPTO_MISUSE,
-        }
-        return self.type in security_types
+        return self.type in _SECURITY_TYPES
 
     def add_affected_entity(self, entity_id: str) -> None:
         """Add an affected entity ID.
@@ -144,15 +158,7 @@ class Issue(BaseModel):
         Returns:
             Priority score (0-10, higher = more important)
         """
-        severity_scores = {
-            Severity.CRITICAL: 10.0,
-            Severity.HIGH: 7.0,
-            Severity.MEDIUM: 4.0,
-            Severity.LOW: 2.0,
-            Severity.INFO: 0.5,
-        }
-
-        base_score = severity_scores.get(self.severity, 1.0)
+        base_score = _SEVERITY_SCORES.get(self.severity, 1.0)
 
         # Adjust by confidence
         adjusted_score = base_score * self.confidence
@@ -49,6 +49,10 @@ class RefactoringStatus(str, Enum):
     REJECTED = "rejected"  # Rejected by user
 
 
+# Statuses of refactorings still awaiting application
+_PENDING_STATUSES = frozenset({RefactoringStatus.PROPOSED, RefactoringStatus.APPROVED})
+
+
 class Refactoring(BaseModel):
     """Represents a code refactoring operation.
 
@@ -130,7 +134,7 @@ class Refactoring(BaseModel):
         Returns:
             True if pending application
         """
-        return self.status in {RefactoringStatus.PROPOSED, RefactoringStatus.APPROVED}
+        return self.status in _PENDING_STATUSES
 
     def can_apply(self) -> bool:
         """Check if refactoring can be applied.
@@ -117,6 +117,9 @@ class SourceLocation(BaseModel):
     class Config:
         """Pydantic config."""
 
+        # Locations are never modified after parsing; frozen makes them
+        # hashable so they can key dicts and sets
+        frozen = True
         json_schema_extra = {
             "example": {
                 "file_path": "src/models/user.py",
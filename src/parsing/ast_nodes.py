@@ -85,6 +85,25 @@ class ASTNode:
         for child in self.children:
             child.parent = self
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the parent link; __setstate__ restores it.
+
+        Keeps pickles (e.g. ASTs sent to worker processes) from carrying
+        every parent reference a second time.
+        """
+        state = self.__dict__.copy()
+        del state["parent"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.parent = None
+        # Unpickled children arrive detached; a shallow copy shares the
+        # original's children, which keep their existing parent
+        for child in self.children:
+            if child.parent is None:
+                child.parent = self
+
     def add_child(self, child: "ASTNode") -> None:
         """Add a child node and set its parent reference.
 
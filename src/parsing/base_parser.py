@@ -1,5 +1,6 @@
 """Base parser interface for multi-language support."""
 
+import io
 from abc import ABC, abstractmethod
 from typing import Optional
 from pathlib import Path
@@ -100,13 +101,31 @@ class BaseParser(ABC):
             FileNotFoundError: If file doesn't exist
             UnicodeDecodeError: If file encoding is not UTF-8
         """
+        with open(file_path, "rb") as f:
+            return self._decode(f.read(), file_path)
+
+    def parse_bytes(self, data: bytes, file_path: str = "<string>") -> Optional[ASTNode]:
+        """Parse source code from the raw bytes of a file.
+
+        Decodes like read_file, for callers that already hold the bytes
+        (e.g. to hash them) and should not read the file again.
+
+        Args:
+            data: File contents as bytes
+            file_path: Optional file path for error messages
+
+        Returns:
+            Root AST node or None if parsing fails
+        """
+        return self.parse_string(self._decode(data, file_path), file_path)
+
+    def _decode(self, data: bytes, file_path: str) -> str:
+        """Decode file bytes as text mode would, falling back to latin-1."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            return io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").read()
         except UnicodeDecodeError:
             logger.warning(f"Failed to decode {file_path} as UTF-8, trying latin-1")
-            with open(file_path, "r", encoding="latin-1") as f:
-                return f.read()
+            return io.TextIOWrapper(io.BytesIO(data), encoding="latin-1").read()
 
     def __repr__(self) -> str:
         """String representation."""
@@ -1,9 +1,10 @@
 """Analysis pipeline orchestrating parse -> graph -> metrics -> features -> analysis."""
 
+import importlib
 import os
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.config.parser_config import ParserConfig
 from src.parsing.base_parser import BaseParser
@@ -15,6 +16,7 @@ from src.metrics.entity_metrics import EntityMetrics
 from src.metrics.structural_metrics import StructuralMetrics
 from src.features.feature_extractor import FeatureExtractor
 from src.features.feature_vector import FeatureVector
+from src.analysis.cache import AnalysisCache, file_digest
 from src.analysis.cfg_builder import CFGBuilder
 from src.analysis.cfg import ControlFlowGraph
 from src.analysis.taint import TaintAnalyzer, TaintFlow
@@ -24,6 +26,23 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# NodeTypes that get a control flow graph
+_FUNC_TYPES = frozenset(
+    {
+        NodeType.FUNCTION,
+        NodeType.METHOD,
+        NodeType.CONSTRUCTOR,
+    }
+)
+
+# language -> (module, class) of its parser, imported on first use
+_PARSERS = {
+    "python": ("src.parsing.python_parser", "PythonParser"),
+    "javascript": ("src.parsing.javascript_parser", "JavaScriptParser"),
+    "typescript": ("src.parsing.javascript_parser", "TypeScriptParser"),
+    "java": ("src.parsing.java_parser", "JavaParser"),
+}
+
 
 @dataclass
 class PipelineResult:
@@ -62,16 +81,24 @@ class AnalysisPipeline:
         self,
         cache: Optional[CacheBackend] = None,
         storage: Optional[StorageBackend] = None,
+        analysis_cache: Optional[AnalysisCache] = None,
     ) -> None:
         self._parser_config = ParserConfig()
         self._graph_builder = GraphBuilder()
-        self._metrics_calc = MetricsCalculator()
+        self._metrics_calc = MetricsCalculator(analysis_cache)
         self._feature_extractor = FeatureExtractor()
         self._cfg_builder = CFGBuilder()
         self._taint_analyzer = TaintAnalyzer()
         self._cache = cache
         self._storage = storage
+        self._analysis_cache = analysis_cache
         self._ast_map: Dict[str, ASTNode] = {}
+        self._file_digests: Dict[str, bytes] = {}
+        # language -> parser, created once per pipeline rather than per file
+        self._parsers: Dict[str, BaseParser] = {}
+        # file_path -> (AST root, function nodes by start line); reused
+        # while the root is unchanged
+        self._func_indexes: Dict[str, Tuple[ASTNode, Dict[int, ASTNode]]] = {}
 
     def analyze_file(self, file_path: str) -> PipelineResult:
         """Analyze a single file."""
@@ -92,7 +119,7 @@ class AnalysisPipeline:
             parser = self._select_parser(fp)
             if parser is None:
                 continue
-            ast = parser.parse_file(fp)
+            ast = self._parse(parser, fp)
             if ast is not None:
                 self._ast_map[fp] = ast
                 self._graph_builder.add_file(ast, fp)
@@ -104,7 +131,9 @@ class AnalysisPipeline:
         result.entities_found = result.graph.entity_count
 
         # Step 3: Compute metrics
-        metrics_result = self._metrics_calc.compute_all(result.graph, self._ast_map)
+        metrics_result = self._metrics_calc.compute_all(
+            result.graph, self._ast_map, digests=self._file_digests
+        )
         result.entity_metrics = metrics_result.entity_metrics
         result.structural_metrics = metrics_result.structural_metrics
 
@@ -114,12 +143,8 @@ class AnalysisPipeline:
         # Step 5: Build CFGs and run taint analysis
         for entity in result.graph.entities.values():
             if entity.is_function_like():
-                ast_node = self._find_ast_node(
-                    entity.location.file_path,
-                    entity.location.start_line,
-                )
-                if ast_node is not None:
-                    cfg = self._cfg_builder.build(ast_node)
+                cfg = self._get_cfg(entity.location.file_path, entity.location.start_line)
+                if cfg is not None:
                     result.cfgs[entity.id] = cfg
                     flows = self._taint_analyzer.analyze(cfg)
                     result.taint_flows.extend(flows)
@@ -145,7 +170,7 @@ class AnalysisPipeline:
         if parser is None:
             return previous_result
 
-        ast = parser.parse_file(file_path)
+        ast = self._parse(parser, file_path)
         if ast is None:
             return previous_result
 
@@ -156,7 +181,9 @@ class AnalysisPipeline:
         self._graph_builder.resolve_cross_file_references()
 
         # Recompute metrics
-        metrics_result = self._metrics_calc.compute_all(previous_result.graph, self._ast_map)
+        metrics_result = self._metrics_calc.compute_all(
+            previous_result.graph, self._ast_map, digests=self._file_digests
+        )
         previous_result.entity_metrics = metrics_result.entity_metrics
         previous_result.structural_metrics = metrics_result.structural_metrics
 
@@ -167,13 +194,38 @@ class AnalysisPipeline:
 
         return previous_result
 
+    def _parse(self, parser: BaseParser, file_path: str) -> Optional[ASTNode]:
+        """Parse a file, recording its digest when the analysis cache is on.
+
+        The file is read once and the same bytes are hashed and parsed, so
+        the cache key always matches the parsed contents.
+        """
+        if self._analysis_cache is None:
+            return parser.parse_file(file_path)
+        try:
+            parser.validate_file(file_path)
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to parse file {file_path}: {e}")
+            return None
+        ast = parser.parse_bytes(data, file_path)
+        if ast is not None:
+            self._file_digests[file_path] = file_digest(data)
+        return ast
+
     def _select_parser(self, file_path: str) -> Optional[BaseParser]:
         """Select the appropriate parser for a file."""
         if self._parser_config.should_skip_file(file_path):
             return None
 
         lang = self._parser_config.get_language_for_file(file_path)
-        return _get_parser(lang)
+        parser = self._parsers.get(lang)
+        if parser is None:
+            parser = _get_parser(lang)
+            if parser is not None:
+                self._parsers[lang] = parser
+        return parser
 
     def _discover_files(self, dir_path: str) -> List[str]:
         """Discover all supported source files in a directory."""
@@ -188,48 +240,73 @@ class AnalysisPipeline:
                     files.append(full_path)
         return files
 
+    def _get_cfg(self, file_path: str, start_line: int) -> Optional[ControlFlowGraph]:
+        """Build (or fetch from the analysis cache) the CFG of a function.
+
+        CFGs loaded from the cache hold unpickled statement subtrees: links
+        within a statement survive, but its own parent is None, so
+        statements must not be walked upward.
+        """
+        digest = self._file_digests.get(file_path)
+        if self._analysis_cache is None or digest is None:
+            ast_node = self._find_ast_node(file_path, start_line)
+            return self._cfg_builder.build(ast_node) if ast_node is not None else None
+
+        # Cache all CFGs of a file as one entry: they share the file's AST
+        cfgs: Dict[int, ControlFlowGraph] = self._analysis_cache.get_or_compute(
+            file_path, digest, "cfgs", lambda: self._build_file_cfgs(file_path)
+        )
+        return cfgs.get(start_line)
+
+    def _build_file_cfgs(self, file_path: str) -> Dict[int, ControlFlowGraph]:
+        """Build CFGs for every function in a file, keyed by start line."""
+        return {
+            line: self._cfg_builder.build(node)
+            for line, node in self._function_index(file_path).items()
+        }
+
     def _find_ast_node(self, file_path: str, start_line: int) -> Optional[ASTNode]:
-        """Find an AST node by file path and start line."""
+        """Find a function/method node by file path and start line."""
+        return self._function_index(file_path).get(start_line)
+
+    def _function_index(self, file_path: str) -> Dict[int, ASTNode]:
+        """Get the file's function nodes by start line, reindexing on change."""
         root = self._ast_map.get(file_path)
         if root is None:
-            return None
-        return self._search_by_line(root, start_line)
-
-    def _search_by_line(self, node: ASTNode, target_line: int) -> Optional[ASTNode]:
-        """Search for a function/method node at the given start line."""
-        func_types = {
-            NodeType.FUNCTION,
-            NodeType.METHOD,
-            NodeType.CONSTRUCTOR,
-        }
-        if node.node_type in func_types and node.start_line == target_line:
-            return node
-        for child in node.children:
-            result = self._search_by_line(child, target_line)
-            if result is not None:
-                return result
-        return None
+            return {}
+        cached = self._func_indexes.get(file_path)
+        if cached is None or cached[0] is not root:
+            cached = (root, _index_functions_by_line(root))
+            self._func_indexes[file_path] = cached
+        return cached[1]
+
+
+def _index_functions_by_line(root: ASTNode) -> Dict[int, ASTNode]:
+    """Index function-like nodes by start line; the first in pre-order wins."""
+    index: Dict[int, ASTNode] = {}
+    stack: List[ASTNode] = [root]
+    while stack:
+        node = stack.pop()
+        if node.node_type in _FUNC_TYPES:
+            index.setdefault(node.start_line, node)
+        stack.extend(reversed(node.children))
+    return index
 
 
 def _get_parser(language: str) -> Optional[BaseParser]:
-    """Get a parser instance for the given language."""
-    try:
-        if language == "python":
-            from src.parsing.python_parser import PythonParser
-
-            return PythonParser()
-        elif language == "javascript":
-            from src.parsing.javascript_parser import JavaScriptParser
-
-            return JavaScriptParser()
-        elif language == "typescript":
-            from src.parsing.javascript_parser import TypeScriptParser
-
-            return TypeScriptParser()
-        elif language == "java":
-            from src.parsing.java_parser import JavaParser
+    """Get a parser instance for the given language.
 
-            return JavaParser()
+    The backend module is imported only when its language is requested.
+    """
+    entry = _PARSERS.get(language)
+    if entry is None:
+        return None
+    module_name, class_name = entry
+    try:
+        parser_cls = getattr(importlib.import_module(module_name), class_name)
+        parser: BaseParser = parser_cls()
     except ImportError:
+        # Raised by the import or by the parser when tree-sitter is missing
         logger.warning(f"Parser for {language} not available")
-    return None
+        return None
+    return parser
@@ -3,9 +3,11 @@
 This module provides common utilities used across the system.
 """
 
+from src.utils.compat import DATACLASS_SLOTS
 from src.utils.logger import get_logger, setup_logging
 
 __all__ = [
+    "DATACLASS_SLOTS",
     "get_logger",
     "setup_logging",
 ]
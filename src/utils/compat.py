@@ -0,0 +1,8 @@
+"""Shims for differences between supported Python versions."""
+
+import sys
+from typing import Any, Dict
+
+# Keyword arguments that give a dataclass __slots__ where dataclass
+# supports it (Python 3.10+); unpack as @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,48 @@
+"""Tests for AnalysisCache."""
+
+import pytest
+
+from src.analysis.cache import AnalysisCache, file_digest
+
+
+class TestAnalysisCache:
+
+    @pytest.fixture
+    def cache(self) -> AnalysisCache:
+        return AnalysisCache(":memory:")
+
+    def test_get_missing(self, cache: AnalysisCache) -> None:
+        assert cache.get("a.py", file_digest(b"x = 1"), "cfgs") is None
+
+    def test_put_and_get(self, cache: AnalysisCache) -> None:
+        sha = file_digest(b"x = 1")
+        cache.put("a.py", sha, "cfgs", b"blob")
+        assert cache.get("a.py", sha, "cfgs") == b"blob"
+        assert cache.get("a.py", sha, "symbols") is None
+
+    def test_put_drops_stale_versions(self, cache: AnalysisCache) -> None:
+        old, new = file_digest(b"x = 1"), file_digest(b"x = 2")
+        cache.put("a.py", old, "cfgs", b"old")
+        cache.put("a.py", new, "cfgs", b"new")
+        assert cache.get("a.py", old, "cfgs") is None
+        assert cache.get("a.py", new, "cfgs") == b"new"
+
+    def test_get_or_compute_only_computes_once(self, cache: AnalysisCache) -> None:
+        calls = []
+
+        def compute() -> dict:
+            calls.append(1)
+            return {"value": 42}
+
+        sha = file_digest(b"x = 1")
+        assert cache.get_or_compute("a.py", sha, "cfgs", compute) == {"value": 42}
+        assert cache.get_or_compute("a.py", sha, "cfgs", compute) == {"value": 42}
+        assert len(calls) == 1
+
+    def test_persists_across_connections(self, tmp_path) -> None:
+        db = str(tmp_path / "analysis.db")
+        sha = file_digest(b"x = 1")
+        first = AnalysisCache(db)
+        first.put("a.py", sha, "cfgs", b"blob")
+        first.close()
+        assert AnalysisCache(db).get("a.py", sha, "cfgs") == b"blob"
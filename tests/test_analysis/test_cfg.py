@@ -1,5 +1,7 @@
 """Tests for CFG construction."""
 
+import pickle
+
 import pytest
 
 from src.analysis.cfg import BasicBlock, ControlFlowGraph
@@ -79,6 +81,59 @@ class TestControlFlowGraph:
         assert len(preds) == 1
         assert preds[0].id == "b1"
 
+    def test_blocks_is_read_only_view(self) -> None:
+        cfg = ControlFlowGraph("f")
+        cfg.add_block(BasicBlock(id="b1"))
+        view = cfg.blocks
+        cfg.add_block(BasicBlock(id="b2"))
+        assert set(view) == {"b1", "b2"}
+        with pytest.raises(TypeError):
+            view["b3"] = BasicBlock(id="b3")  # type: ignore[index]
+        # The view is built once, not on every access
+        assert cfg.blocks is view
+
+    def test_blocks_view_survives_pickle(self) -> None:
+        cfg = ControlFlowGraph("f")
+        cfg.add_block(BasicBlock(id="b1"))
+        copy = pickle.loads(pickle.dumps(cfg))
+        copy.add_block(BasicBlock(id="b2"))
+        assert set(copy.blocks) == {"b1", "b2"}
+        assert set(cfg.blocks) == {"b1"}
+
+    def test_successor_ids_ignore_duplicate_edges(self) -> None:
+        cfg = ControlFlowGraph("f")
+        cfg.add_block(BasicBlock(id="b1"))
+        cfg.add_block(BasicBlock(id="b2"))
+        cfg.add_edge("b1", "b2", label="true")
+        cfg.add_edge("b1", "b2", label="false")
+        assert cfg.successor_ids("b1") == ["b2"]
+        assert cfg.predecessor_ids("b2") == ["b1"]
+        assert cfg.edge_count == 1
+        assert cfg.get_edge_label("b1", "b2") == "false"
+        assert cfg.has_edge("b1", "b2")
+        assert not cfg.has_edge("b2", "b1")
+        assert cfg.networkx_graph.edges["b1", "b2"]["label"] == "false"
+
+    def test_scc_reachability(self) -> None:
+        # b1 -> (b2 <-> b3) -> b4, b5 isolated
+        cfg = ControlFlowGraph("f")
+        for block_id in ("b1", "b2", "b3", "b4", "b5"):
+            cfg.add_block(BasicBlock(id=block_id))
+        for src, dst in (("b1", "b2"), ("b2", "b3"), ("b3", "b2"), ("b3", "b4")):
+            cfg.add_edge(src, dst)
+        scc = cfg.scc_ids()
+        assert scc["b2"] == scc["b3"]
+        assert len(set(scc.values())) == 4
+        assert scc["b4"] < scc["b2"] < scc["b1"]
+        assert cfg.can_reach("b1", "b4")
+        assert cfg.can_reach("b3", "b2")
+        assert not cfg.can_reach("b4", "b1")
+        assert not cfg.can_reach("b1", "b5")
+        assert not cfg.can_reach("b1", "missing")
+
+        cfg.add_edge("b4", "b5")
+        assert cfg.can_reach("b1", "b5")
+
 
 class TestCFGBuilder:
 
@@ -197,3 +252,44 @@ class TestCFGBuilder:
         for _, _, data in cfg.networkx_graph.edges(data=True):
             labels.add(data.get("label"))
         assert "return" in labels
+
+    def test_straight_line_function_has_single_block(self, builder: CFGBuilder) -> None:
+        body_block = _make_node(
+            NodeType.BLOCK,
+            children=[
+                _make_node(NodeType.ASSIGNMENT, source_text="x = 1"),
+                _make_node(NodeType.CALL, source_text="print(x)"),
+            ],
+        )
+        func = _make_node(NodeType.FUNCTION, name="linear", children=[body_block])
+        cfg = builder.build(func)
+        assert cfg.block_count == 2  # entry + exit
+        assert len(cfg.entry_block.statements) == 2
+        assert cfg.get_edge_label(cfg.entry_block.id, "exit") == "next"
+
+    def test_trailing_return_adds_no_unreachable_block(self, builder: CFGBuilder) -> None:
+        body_block = _make_node(
+            NodeType.BLOCK,
+            children=[
+                _make_node(NodeType.ASSIGNMENT, source_text="x = 1"),
+                _make_node(NodeType.RETURN, source_text="return x"),
+            ],
+        )
+        func = _make_node(NodeType.FUNCTION, name="ret", children=[body_block])
+        cfg = builder.build(func)
+        assert cfg.block_count == 2
+        assert cfg.edge_count == 1
+        assert cfg.get_edge_label(cfg.entry_block.id, "exit") == "return"
+
+    def test_code_after_return_gets_own_block(self, builder: CFGBuilder) -> None:
+        body_block = _make_node(
+            NodeType.BLOCK,
+            children=[
+                _make_node(NodeType.RETURN, source_text="return 1"),
+                _make_node(NodeType.CALL, source_text="dead()"),
+            ],
+        )
+        func = _make_node(NodeType.FUNCTION, name="dead_code", children=[body_block])
+        cfg = builder.build(func)
+        assert cfg.block_count == 3
+        assert cfg.get_predecessors("block_2") == []
@@ -122,3 +122,83 @@ class TestDataFlowAnalyzer:
         x_use = Use(variable="x", block_id="b1")
         defs = result.use_def_chains.get(x_use, set())
         assert len(defs) == 0
+
+    def test_reaching_definitions_through_loop(self, analyzer: DataFlowAnalyzer) -> None:
+        # b1 (x=1) -> header <-> body (y=2) ; header -> exit
+        cfg = ControlFlowGraph("loop")
+        x_def = _make_node(NodeType.ASSIGNMENT, children=[_make_node(NodeType.IDENTIFIER, "x")])
+        y_def = _make_node(NodeType.ASSIGNMENT, children=[_make_node(NodeType.IDENTIFIER, "y")])
+        for block in (
+            BasicBlock(id="b1", statements=[x_def]),
+            BasicBlock(id="header"),
+            BasicBlock(id="body", statements=[y_def]),
+            BasicBlock(id="exit"),
+        ):
+            cfg.add_block(block)
+        cfg.add_edge("b1", "header")
+        cfg.add_edge("header", "body", label="true")
+        cfg.add_edge("body", "header", label="back")
+        cfg.add_edge("header", "exit", label="false")
+
+        result = analyzer.analyze(cfg)
+        expected = {Definition("x", "b1"), Definition("y", "body")}
+        assert result.reaching_definitions["header"] == expected
+        assert result.reaching_definitions["exit"] == expected
+        assert result.reaching_definitions["b1"] == set()
+
+    def test_assignment_target_is_not_a_use(self, analyzer: DataFlowAnalyzer) -> None:
+        # x = y
+        assign = _make_node(
+            NodeType.ASSIGNMENT,
+            children=[
+                _make_node(NodeType.IDENTIFIER, name="x"),
+                _make_node(NodeType.IDENTIFIER, name="y"),
+            ],
+            source_text="x = y",
+        )
+        cfg = ControlFlowGraph("assign")
+        cfg.add_block(BasicBlock(id="b1", statements=[assign]))
+        result = analyzer.analyze(cfg)
+        assert Use("y", "b1") in result.use_def_chains
+        assert Use("x", "b1") not in result.use_def_chains
+
+    def test_variable_names_are_interned(self, analyzer: DataFlowAnalyzer) -> None:
+        cfg = _build_simple_cfg()
+        result = analyzer.analyze(cfg)
+        (x_def,) = result.reaching_definitions["b2"]
+        (x_use,) = result.use_def_chains
+        assert x_def.variable is x_use.variable
+
+
+class TestDefinitionUse:
+
+    def test_equality_and_hash(self) -> None:
+        assert Definition("x", "b1") == Definition(variable="x", block_id="b1")
+        assert hash(Definition("x", "b1")) == hash(Definition("x", "b1"))
+        assert Definition("x", "b1") != Use("x", "b1")
+        assert len({Definition("x", "b1"), Definition("x", "b1"), Use("x", "b1")}) == 2
+
+    def test_immutable(self) -> None:
+        d = Definition("x", "b1")
+        with pytest.raises(AttributeError):
+            d.variable = "y"  # type: ignore[misc]
+
+    def test_no_instance_dict_and_pickles(self) -> None:
+        import pickle
+
+        d = Definition("x", "b1")
+        assert not hasattr(d, "__dict__")
+        assert pickle.loads(pickle.dumps(d)) == d
+
+    def test_result_objects_are_shared(self) -> None:
+        # print(x, x) in b2: one Use object, same Definition in both chains
+        cfg = _build_simple_cfg()
+        call = cfg.get_block("b2").statements[0]
+        call.add_child(_make_node(NodeType.IDENTIFIER, name="x"))
+        result = DataFlowAnalyzer().analyze(cfg)
+
+        (use,) = result.use_def_chains
+        (chain_def,) = result.use_def_chains[use]
+        (reaching_def,) = result.reaching_definitions["b2"]
+        assert chain_def is reaching_def
+        assert next(iter(result.def_use_chains[chain_def])) is use
@@ -71,6 +71,37 @@ class TestScope:
         assert child.lookup("x") is child_sym
         assert parent.lookup("x") is parent_sym
 
+    def test_lookup_sees_define_after_cached_miss(self) -> None:
+        parent = Scope("parent")
+        child = Scope("child", parent=parent)
+        grandchild = Scope("grandchild", parent=child)
+        assert grandchild.lookup("x") is None
+        sym = Symbol(name="x", symbol_type="variable", scope_id="parent")
+        parent.define(sym)
+        # Memoized miss must be invalidated by the parent's define
+        assert grandchild.lookup("x") is sym
+
+    def test_constructor_does_not_link_children(self) -> None:
+        parent = Scope("parent")
+        child = Scope("child", parent=parent)
+        # Callers that link the child themselves must not get it twice
+        parent.children.append(child)
+        assert parent.children == [child]
+
+    def test_define_does_not_walk_descendants(self) -> None:
+        parent = Scope("parent")
+        children = [Scope(f"c{i}", parent=parent) for i in range(3)]
+        assert children[0].lookup("x") is None
+        # Replacing the child list would break any eager descendant walk
+        parent.children = None  # type: ignore[assignment]
+        sym = Symbol(name="x", symbol_type="variable", scope_id="parent")
+        parent.define(sym)
+        assert [c.lookup("x") for c in children] == [sym, sym, sym]
+        # A define in a sibling scope also refreshes memos, without hiding x
+        children[1].define(Symbol(name="y", symbol_type="variable", scope_id="c1"))
+        assert children[0].lookup("x") is sym
+        assert children[0].lookup("y") is None
+
 
 class TestSymbolTable:
 
@@ -85,6 +116,14 @@ class TestSymbolTable:
         assert table.global_scope is not None
         assert table.scope_count >= 2  # global + foo
 
+    def test_scope_children_linked(self, table: SymbolTable) -> None:
+        method = _make_node(NodeType.METHOD, name="bar")
+        cls = _make_node(NodeType.CLASS, name="Foo", children=[method])
+        table.build_from_ast(_make_node(NodeType.MODULE, children=[cls]))
+        foo = table.get_scope("global.Foo")
+        assert table.global_scope.children == [foo]
+        assert foo.children == [table.get_scope("global.Foo.bar")]
+
     def test_resolve_function_in_global(self, table: SymbolTable) -> None:
         func = _make_node(NodeType.FUNCTION, name="foo")
         root = _make_node(NodeType.MODULE, children=[func])
@@ -150,3 +189,21 @@ class TestSymbolTable:
         sym = table.resolve("x", "global.foo")
         assert sym is not None
         assert sym.symbol_type == "variable"
+
+    def test_deeply_nested_ast(self, table: SymbolTable) -> None:
+        # Deeper than the default recursion limit
+        node = _make_node(NodeType.IDENTIFIER, name="leaf")
+        for _ in range(5000):
+            node = _make_node(NodeType.BLOCK, children=[node])
+        func = _make_node(NodeType.FUNCTION, name="deep", children=[node])
+        table.build_from_ast(_make_node(NodeType.MODULE, children=[func]))
+        assert table.resolve("deep", "global.deep") is not None
+
+    def test_get_definitions_after_redefinition(self, table: SymbolTable) -> None:
+        first = _make_node(NodeType.FUNCTION, name="process")
+        second = _make_node(NodeType.FUNCTION, name="process")
+        table.build_from_ast(_make_node(NodeType.MODULE, children=[first, second]))
+        defs = table.get_definitions("process")
+        # Same scope: the later definition replaces the earlier one
+        assert [d.definition_node for d in defs] == [second]
+        assert table.get_definitions("missing") == []
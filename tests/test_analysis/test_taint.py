@@ -1,5 +1,7 @@
 """Tests for TaintAnalyzer."""
 
+import importlib.util
+
 import pytest
 
 from src.analysis.cfg import BasicBlock, ControlFlowGraph
@@ -169,3 +171,192 @@ class TestTaintAnalyzer:
         for f in unsanitized:
             # If there's a flow, it must have a valid path
             assert len(f.path) > 0 or f.sanitized
+
+    def test_invalid_pattern_fails_at_construction(self) -> None:
+        import re
+
+        with pytest.raises(re.error):
+            TaintAnalyzer([TaintSource("bad", r"input(", "user_input")])
+
+    def test_overlapping_sinks_all_reported(self, analyzer: TaintAnalyzer) -> None:
+        # "cursor.execute" matches both the sql_exec and eval (exec) sinks
+        cfg = ControlFlowGraph("overlap")
+        cfg.add_block(BasicBlock(id="b1", statements=[_make_stmt("q = input()")]))
+        cfg.add_block(BasicBlock(id="b2", statements=[_make_stmt("cursor.execute(q)")]))
+        cfg.add_edge("b1", "b2")
+        flows = analyzer.analyze(cfg)
+        assert {f.sink.name for f in flows} == {"sql_exec", "eval"}
+
+    def test_flow_path_is_shortest(self) -> None:
+        # b1 -> b2 -> b3 -> b4 and a shortcut b1 -> b3, plus a cycle b3 -> b1
+        analyzer = TaintAnalyzer(
+            [TaintSource("input", r"input", "user_input")],
+            [TaintSink("sql", r"execute", "sql_injection")],
+            [],
+        )
+        cfg = ControlFlowGraph("paths")
+        cfg.add_block(BasicBlock(id="b1", statements=[_make_stmt("a = input()")]))
+        cfg.add_block(BasicBlock(id="b2"))
+        cfg.add_block(BasicBlock(id="b3"))
+        cfg.add_block(BasicBlock(id="b4", statements=[_make_stmt("execute(a)")]))
+        for src, dst in (("b1", "b2"), ("b2", "b3"), ("b3", "b4"), ("b1", "b3"), ("b3", "b1")):
+            cfg.add_edge(src, dst)
+        assert [f.path for f in analyzer.analyze(cfg)] == [["b1", "b3", "b4"]]
+
+    def test_one_traversal_per_source_block(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sources = [TaintSource("input", r"input", "user_input")]
+        sinks = [TaintSink("sql", r"execute", "sql_injection")]
+        analyzer = TaintAnalyzer(sources, sinks, [])
+        cfg = ControlFlowGraph("multi")
+        cfg.add_block(BasicBlock(id="b1", statements=[_make_stmt("a = input()")] * 2))
+        for block_id in ("b2", "b3", "b4"):
+            cfg.add_block(BasicBlock(id=block_id, statements=[_make_stmt("execute(a)")]))
+            cfg.add_edge("b1", block_id)
+        cfg.add_edge("b2", "b4")
+
+        calls = []
+        original = TaintAnalyzer._bfs_parents
+        monkeypatch.setattr(
+            TaintAnalyzer,
+            "_bfs_parents",
+            staticmethod(lambda c, b: calls.append(b) or original(c, b)),
+        )
+        flows = analyzer.analyze(cfg)
+        assert calls == ["b1"]
+        assert len(flows) == 6
+        assert sorted({tuple(f.path) for f in flows}) == [
+            ("b1", "b2"),
+            ("b1", "b3"),
+            ("b1", "b4"),
+        ]
+
+    def test_statement_hits_reused_across_analyses(self, analyzer: TaintAnalyzer) -> None:
+        cfg = ControlFlowGraph("reuse")
+        cfg.add_block(BasicBlock(id="b1", statements=[_make_stmt("cmd = input()")]))
+        cfg.add_block(BasicBlock(id="b2", statements=[_make_stmt("os.system(cmd)")]))
+        cfg.add_edge("b1", "b2")
+        first = analyzer.analyze(cfg)
+        cached = dict(analyzer._source_hits)
+        second = analyzer.analyze(cfg)
+        assert first == second
+        assert analyzer._source_hits == cached
+        assert len(cached) == 2
+
+    def test_flow_path_on_long_chain(self, analyzer: TaintAnalyzer) -> None:
+        # Parent pointers keep this linear; copying paths per edge was quadratic
+        cfg = ControlFlowGraph("chain")
+        ids = [f"b{i}" for i in range(5000)]
+        for block_id in ids:
+            cfg.add_block(BasicBlock(id=block_id))
+        cfg.get_block(ids[0]).statements.append(_make_stmt("a = input()"))
+        cfg.get_block(ids[-1]).statements.append(_make_stmt("eval(a)"))
+        for src, dst in zip(ids, ids[1:]):
+            cfg.add_edge(src, dst)
+        assert [f.path for f in analyzer.analyze(cfg)] == [ids]
+
+    def test_unreachable_source_block_skips_bfs(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        analyzer = TaintAnalyzer()
+        cfg = ControlFlowGraph("split")
+        cfg.add_block(BasicBlock(id="b1", statements=[_make_stmt("a = input()")]))
+        cfg.add_block(BasicBlock(id="b2", statements=[_make_stmt("eval(a)")]))
+        cfg.add_block(BasicBlock(id="b3", statements=[_make_stmt("b = input()")]))
+        cfg.add_edge("b1", "b2")
+        cfg.add_edge("b2", "b3")
+
+        calls = []
+        original = TaintAnalyzer._bfs_parents
+        monkeypatch.setattr(
+            TaintAnalyzer,
+            "_bfs_parents",
+            staticmethod(lambda c, b: calls.append(b) or original(c, b)),
+        )
+        flows = analyzer.analyze(cfg)
+        assert calls == ["b1"]
+        assert [f.path for f in flows] == [["b1", "b2"]]
+
+    def test_sanitizer_only_counts_for_its_vulnerability(self) -> None:
+        sources = [TaintSource("input", r"input", "user_input")]
+        sinks = [
+            TaintSink("sql", r"execute", "sql_injection"),
+            TaintSink("html", r"render", "xss"),
+        ]
+        sanitizers = [TaintSanitizer("escape", r"escape_string", ["sql_injection"])]
+        analyzer = TaintAnalyzer(sources, sinks, sanitizers)
+        cfg = ControlFlowGraph("mixed")
+        cfg.add_block(BasicBlock(id="b1", statements=[_make_stmt("u = input()")]))
+        cfg.add_block(BasicBlock(id="b2", statements=[_make_stmt("s = escape_string(u)")]))
+        cfg.add_block(BasicBlock(id="b3", statements=[_make_stmt("execute(s); render(s)")]))
+        cfg.add_edge("b1", "b2")
+        cfg.add_edge("b2", "b3")
+        flows = {f.sink.vulnerability: f.sanitized for f in analyzer.analyze(cfg)}
+        assert flows == {"sql_injection": True, "xss": False}
+
+    def test_identical_statements_scanned_once(self, analyzer: TaintAnalyzer) -> None:
+        cfg = ControlFlowGraph("dup")
+        for i in range(3):
+            stmts = [_make_stmt("x = input()"), _make_stmt("log(x)")]
+            cfg.add_block(BasicBlock(id=f"b{i}", statements=stmts))
+        analyzer.analyze(cfg)
+        assert set(analyzer._source_hits) == {"x = input()", "log(x)"}
+
+    def test_hit_caches_are_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from src.analysis import taint
+
+        monkeypatch.setattr(taint, "_HIT_CACHE_SIZE", 3)
+        analyzer = TaintAnalyzer()
+        cfg = ControlFlowGraph("many")
+        stmts = [_make_stmt(f"x{i} = input()") for i in range(5)]
+        cfg.add_block(BasicBlock(id="b1", statements=stmts))
+        cfg.add_block(BasicBlock(id="b2", statements=[_make_stmt("eval(x0)")]))
+        cfg.add_edge("b1", "b2")
+        assert len(analyzer.analyze(cfg)) == 5
+        assert list(analyzer._source_hits) == ["x3 = input()", "x4 = input()", "eval(x0)"]
+
+    def test_flows_only_within_component(self, analyzer: TaintAnalyzer) -> None:
+        # Two disconnected regions, each with its own source and sink
+        cfg = ControlFlowGraph("regions")
+        cfg.add_block(BasicBlock(id="a1", statements=[_make_stmt("x = input()")]))
+        cfg.add_block(BasicBlock(id="a2", statements=[_make_stmt("os.system(x)")]))
+        cfg.add_block(BasicBlock(id="h1", statements=[_make_stmt("y = getenv('Y')")]))
+        cfg.add_block(BasicBlock(id="h2", statements=[_make_stmt("render(y)")]))
+        cfg.add_edge("a1", "a2")
+        cfg.add_edge("h1", "h2")
+        flows = analyzer.analyze(cfg)
+        assert [(f.source.name, f.sink.name, f.path) for f in flows] == [
+            ("user_input", "os_command", ["a1", "a2"]),
+            ("env_var", "html_render", ["h1", "h2"]),
+        ]
+        assert flows[0].path is not flows[1].path
+
+
+class TestPatternBackends:
+
+    def test_scanner_unavailable_without_hyperscan(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from src.analysis import _hyperscan
+
+        monkeypatch.setattr(_hyperscan, "hyperscan", None)
+        assert _hyperscan.compile_scanner([r"input"]) is None
+
+    def test_matcher_uses_scanner_ids(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from src.analysis import taint
+
+        # Stand-in scanner: report pattern indices whose literal text occurs
+        def fake_compile(patterns):
+            return lambda text: {i for i, p in enumerate(patterns) if p in text}
+
+        monkeypatch.setattr(taint, "compile_scanner", fake_compile)
+        match = taint._make_matcher(["exec", "execute", "eval"])
+        assert match("cursor.execute(q)") == 0b011
+        assert match("print(q)") == 0
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("hyperscan") is None,
+        reason="hyperscan not installed",
+    )
+    def test_hyperscan_matches_re(self) -> None:
+        from src.analysis._hyperscan import compile_scanner
+
+        scan = compile_scanner([r"input|readline", r"eval|exec", r"os\.system"])
+        assert scan is not None
+        assert scan("cursor.execute(input())") == {0, 1}
+        assert scan("x = 1") == set()
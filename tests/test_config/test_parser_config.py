@@ -0,0 +1,50 @@
+"""Tests for ParserConfig."""
+
+import pytest
+
+from src.config.parser_config import ParserConfig
+
+
+class TestParserConfig:
+
+    @pytest.fixture
+    def config(self) -> ParserConfig:
+        return ParserConfig()
+
+    @pytest.mark.parametrize(
+        "path, language",
+        [
+            ("src/app.py", "python"),
+            ("stubs/app.pyi", "python"),
+            ("web/index.jsx", "javascript"),
+            ("web/index.tsx", "typescript"),
+            ("Main.java", "java"),
+            ("README", "unknown"),
+            ("notes.py.txt", "unknown"),
+            ("pkg.py/data", "unknown"),
+        ],
+    )
+    def test_get_language_for_file(self, config: ParserConfig, path: str, language: str) -> None:
+        assert config.get_language_for_file(path) == language
+
+    def test_multi_dot_extension_falls_back_to_scan(self) -> None:
+        config = ParserConfig(language_extensions={"typescript": [".d.ts", ".ts"]})
+        assert config.get_language_for_file("types/index.d.ts") == "typescript"
+        assert config.get_language_for_file("main.ts") == "typescript"
+        assert config.get_language_for_file("main.py") == "unknown"
+
+    @pytest.mark.parametrize(
+        "path, skipped",
+        [
+            ("proj/node_modules/lib/index.js", True),
+            ("proj/.venv/lib/site.py", True),
+            ("static/app.min.js", True),
+            ("static/app.js", False),
+            ("src/main.py", False),
+        ],
+    )
+    def test_should_skip_file(self, config: ParserConfig, path: str, skipped: bool) -> None:
+        assert config.should_skip_file(path) is skipped
+
+    def test_no_skip_patterns(self) -> None:
+        assert not ParserConfig(skip_patterns=[]).should_skip_file("node_modules/x.js")
@@ -0,0 +1,19 @@
+"""Tests for Settings."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.config.settings import Settings
+
+
+class TestSettings:
+
+    def test_urls_computed_once(self) -> None:
+        settings = Settings(redis_host="cache", redis_port=6380)
+        assert settings.redis_url == "redis://cache:6380"
+        assert settings.postgres_url is settings.postgres_url
+
+    def test_frozen(self) -> None:
+        settings = Settings()
+        with pytest.raises(ValidationError):
+            settings.redis_port = 1
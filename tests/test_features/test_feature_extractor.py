@@ -5,6 +5,7 @@ import pytest
 
 from src.features.feature_extractor import FeatureExtractor
 from src.features.feature_vector import VECTOR_DIM, FeatureVector
+from src.features.normalizer import FeatureNormalizer
 from src.metrics.entity_metrics import EntityMetrics
 from src.metrics.structural_metrics import StructuralMetrics
 from src.metrics.metrics_calculator import MetricsResult
@@ -94,6 +95,85 @@ class TestFeatureExtractor:
         assert "f2" in vectors
         assert vectors["f1"].vector.shape == (VECTOR_DIM,)
 
+    def test_bounds_changed_after_construction(self) -> None:
+        norm = FeatureNormalizer()
+        extractor = FeatureExtractor(norm)
+        norm.set_bounds("lines_of_code", 0, 100)
+        fv = extractor.extract("f1", EntityMetrics(entity_id="f1", lines_of_code=50))
+        assert fv.syntactic_features()[0] == pytest.approx(0.5)
+
+    def test_extract_matrix_matches_extract(self, extractor: FeatureExtractor) -> None:
+        mr = MetricsResult(
+            entity_metrics={
+                "f1": EntityMetrics(entity_id="f1", lines_of_code=50, call_count=7),
+                "f2": EntityMetrics(entity_id="f2", lines_of_code=100),
+            },
+            structural_metrics={
+                "f2": StructuralMetrics(entity_id="f2", fan_in=2, instability=0.4),
+            },
+        )
+        ids, matrix = extractor.extract_matrix(mr)
+        assert ids == ["f1", "f2"]
+        assert matrix.shape == (2, VECTOR_DIM)
+        assert matrix.dtype == np.float32
+        for i, eid in enumerate(ids):
+            single = extractor.extract(eid, mr.entity_metrics[eid], mr.structural_metrics.get(eid))
+            np.testing.assert_allclose(matrix[i], single.vector)
+
+        vectors = extractor.extract_all(mr)
+        assert vectors["f1"].vector.base is vectors["f2"].vector.base
+
+    def test_extract_matrix_uses_kernel(self, extractor: FeatureExtractor, monkeypatch) -> None:
+        from src.features import feature_extractor
+        from src.features._kernels import normalize_pack
+
+        shapes = []
+
+        def spy(raws, lo, scale, out) -> None:
+            shapes.append(raws.shape)
+            normalize_pack(raws, lo, scale, out)
+
+        monkeypatch.setattr(feature_extractor, "normalize_pack", spy)
+        mr = MetricsResult(
+            entity_metrics={eid: EntityMetrics(entity_id=eid) for eid in ("f1", "f2", "f3")},
+            structural_metrics={"f3": StructuralMetrics(entity_id="f3")},
+        )
+        extractor.extract_matrix(mr)
+        # One batched call per feature group, not one per entity
+        assert [rows for rows, _ in shapes] == [3, 1]
+
+    def test_extract_matrix_empty(self, extractor: FeatureExtractor) -> None:
+        ids, matrix = extractor.extract_matrix(MetricsResult())
+        assert ids == []
+        assert matrix.shape == (0, VECTOR_DIM)
+
+    def test_extract_into_buffer(self, extractor: FeatureExtractor, tmp_path) -> None:
+        mr = MetricsResult(
+            entity_metrics={
+                "f1": EntityMetrics(entity_id="f1", lines_of_code=50),
+                "f2": EntityMetrics(entity_id="f2", lines_of_code=100),
+            },
+        )
+        buf = np.memmap(tmp_path / "vectors.f32", dtype=np.float32, mode="w+", shape=(2, 128))
+        buf[:] = 9.0
+        ids, matrix = extractor.extract_matrix(mr, out=buf)
+        assert matrix is buf
+        assert buf[1, 0] == pytest.approx(0.2)
+        assert buf[:, 1:].max() == 0.0
+
+        row = np.full(VECTOR_DIM, 9.0, dtype=np.float32)
+        fv = extractor.extract("f1", mr.entity_metrics["f1"], out=row)
+        assert fv.vector is row
+        assert row[0] == pytest.approx(0.1)
+
+        with pytest.raises(ValueError):
+            extractor.extract_matrix(mr, out=np.zeros((3, 128), dtype=np.float32))
+
+    def test_zero_metrics_give_zero_vector(self, extractor: FeatureExtractor) -> None:
+        em = EntityMetrics(entity_id="f1", cyclomatic_complexity=0)
+        fv = extractor.extract("f1", em, StructuralMetrics(entity_id="f1"))
+        assert not fv.vector.any()
+
     def test_to_dict(self, extractor: FeatureExtractor) -> None:
         em = EntityMetrics(entity_id="f1", lines_of_code=50)
         fv = extractor.extract("f1", em)
@@ -102,9 +182,24 @@ class TestFeatureExtractor:
         assert len(d["vector"]) == VECTOR_DIM
         assert d["dim"] == VECTOR_DIM
 
+    def test_matches_scalar_normalizer(self) -> None:
+        norm = FeatureNormalizer()
+        norm.set_bounds("loop_count", 3, 3)  # empty range normalizes to 0
+        em = EntityMetrics(entity_id="f1", lines_of_code=123, nesting_depth_avg=7.5, loop_count=9)
+        syn = FeatureExtractor(norm).extract("f1", em).syntactic_features()
+        expected = [
+            norm.normalize(float(getattr(em, name)), name)
+            for name in ("lines_of_code", "nesting_depth_avg", "loop_count")
+        ]
+        assert [syn[0], syn[4], syn[8]] == pytest.approx(expected)
+
 
 class TestFeatureVectorValidation:
 
+    def test_no_instance_dict(self) -> None:
+        fv = FeatureVector(entity_id="f1", vector=np.zeros(VECTOR_DIM, dtype=np.float32))
+        assert not hasattr(fv, "__dict__")
+
     def test_wrong_shape_raises(self) -> None:
         with pytest.raises(ValueError):
             FeatureVector(
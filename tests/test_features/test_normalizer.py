@@ -1,7 +1,9 @@
 """Tests for FeatureNormalizer."""
 
+import numpy as np
 import pytest
 
+from src.features._kernels import _normalize_pack_loop, _normalize_pack_py
 from src.features.normalizer import FeatureNormalizer
 
 
@@ -42,3 +44,32 @@ class TestFeatureNormalizer:
         # cyclomatic_complexity bounds = (1, 50)
         val = norm.normalize(25, "cyclomatic_complexity")
         assert 0.0 < val < 1.0
+
+    def test_build_arrays(self, norm: FeatureNormalizer) -> None:
+        norm.set_bounds("const", 5, 5)
+        lo, hi, scale, zero_mask = norm.build_arrays(["lines_of_code", "const"])
+        assert lo.tolist() == [0.0, 5.0]
+        assert hi.tolist() == [500.0, 5.0]
+        assert scale.tolist() == [pytest.approx(1 / 500), 0.0]
+        assert zero_mask.tolist() == [False, True]
+        assert norm.build_arrays(["lines_of_code", "const"])[0] is lo
+
+    def test_set_bounds_invalidates_arrays(self, norm: FeatureNormalizer) -> None:
+        lo, *_ = norm.build_arrays(["lines_of_code"])
+        norm.set_bounds("lines_of_code", 10, 20)
+        assert norm.build_arrays(["lines_of_code"])[0].tolist() == [10.0]
+        assert lo.tolist() == [0.0]
+
+
+class TestNormalizeKernel:
+
+    def test_loop_kernel_matches_numpy(self) -> None:
+        raws = np.array([[-5.0, 0.0, 25.0, 80.0, 3.0], [5.0, 3.0, 0.0, 50.0, 9.0]])
+        lo = np.array([0.0, 1.0, 0.0, 0.0, 3.0])
+        scale = np.array([0.1, 0.5, 0.02, 0.02, 0.0])
+        expected = np.empty((2, 5), dtype=np.float32)
+        actual = np.empty((2, 5), dtype=np.float32)
+        _normalize_pack_py(raws, lo, scale, expected)
+        _normalize_pack_loop(raws, lo, scale, actual)
+        np.testing.assert_allclose(actual, expected)
+        assert expected.tolist() == [[0.0, 0.0, 0.5, 1.0, 0.0], [0.5, 1.0, 0.0, 1.0, 0.0]]
@@ -1,9 +1,12 @@
 """Tests for EntityExtractor."""
 
+import importlib.util
+
 import pytest
 
+from src.graph import entity_extractor
 from src.graph.entity_extractor import EntityExtractor
-from src.graph.relationship import RelationshipType
+from src.graph.relationship import RelationshipType, Unresolved
 from src.models.code_entity import EntityType
 from src.parsing.ast_nodes import ASTNode, NodeType
 
@@ -148,7 +151,7 @@ class TestEntityExtractor:
 
         call_rels = [r for r in result.relationships if r[2] == RelationshipType.CALLS]
         assert len(call_rels) == 1
-        assert call_rels[0][1].startswith("unresolved:bar")
+        assert call_rels[0][1] == Unresolved("bar")
 
     def test_extract_import(self, extractor: EntityExtractor) -> None:
         imp = _make_node(
@@ -192,6 +195,15 @@ class TestEntityExtractor:
         ids2 = [e.id for e in r2.entities]
         assert ids1 == ids2
 
+    def test_entity_id_format(self, extractor: EntityExtractor) -> None:
+        func = _make_node(NodeType.FUNCTION, name="foo")
+        result = extractor.extract(_make_node(NodeType.MODULE, children=[func]), "test.py")
+        prefix, digest = result.entities[1].id.split("_")
+        assert prefix == "function"
+        assert len(digest) == 12
+        int(digest, 16)
+        assert result.entities[0].id != result.entities[1].id
+
     def test_lines_of_code(self, extractor: EntityExtractor) -> None:
         func = _make_node(
             NodeType.FUNCTION,
@@ -204,6 +216,100 @@ class TestEntityExtractor:
         funcs = [e for e in result.entities if e.entity_type == EntityType.FUNCTION]
         assert funcs[0].lines_of_code == 10
 
+    def test_modifiers_and_inheritance(self, extractor: EntityExtractor) -> None:
+        base = _make_node(NodeType.IDENTIFIER, name="Base")
+        heritage = _make_node(
+            NodeType.UNKNOWN, children=[base], attributes={"ts_type": "superclass"}
+        )
+        public = _make_node(NodeType.UNKNOWN, attributes={"ts_type": "public"})
+        other = _make_node(NodeType.UNKNOWN, attributes={"ts_type": "identifier"})
+        cls = _make_node(NodeType.CLASS, name="A", children=[public, other, heritage])
+        result = extractor.extract(_make_node(NodeType.MODULE, children=[cls]), "A.java")
+
+        assert result.entities[1].modifiers == ["public"]
+        inherits = [r for r in result.relationships if r[2] == RelationshipType.INHERITS]
+        assert [r[1] for r in inherits] == [Unresolved("Base")]
+
+    def test_inheritance_nested_identifiers_in_order(self, extractor: EntityExtractor) -> None:
+        # class A(Generic[T], Base) -> Generic, T, Base in source order
+        generic = _make_node(
+            NodeType.UNKNOWN,
+            children=[
+                _make_node(NodeType.IDENTIFIER, name="Generic"),
+                _make_node(NodeType.IDENTIFIER, name="T"),
+            ],
+        )
+        args = _make_node(
+            NodeType.UNKNOWN,
+            children=[generic, _make_node(NodeType.IDENTIFIER, name="Base")],
+            attributes={"ts_type": "argument_list"},
+        )
+        cls = _make_node(NodeType.CLASS, name="A", children=[args])
+        result = extractor.extract(_make_node(NodeType.MODULE, children=[cls]), "test.py")
+        inherits = [r for r in result.relationships if r[2] == RelationshipType.INHERITS]
+        assert [r[3]["parent_name"] for r in inherits] == ["Generic", "T", "Base"]
+
+    def test_docstring_only_for_documented_types(self, extractor: EntityExtractor) -> None:
+        def body() -> ASTNode:
+            literal = _make_node(NodeType.LITERAL, source_text='"""Doc."""')
+            stmt = _make_node(
+                NodeType.UNKNOWN,
+                children=[literal],
+                attributes={"ts_type": "expression_statement"},
+            )
+            return _make_node(NodeType.BLOCK, children=[stmt])
+
+        func = _make_node(NodeType.FUNCTION, name="foo", children=[body()])
+        fld = _make_node(NodeType.FIELD, name="x", children=[body()])
+        result = extractor.extract(_make_node(NodeType.MODULE, children=[func, fld]), "test.py")
+        docs = {e.name: e.docstring for e in result.entities}
+        assert docs["foo"] == "Doc."
+        assert docs["x"] is None
+
+    def test_deeply_nested_ast(self, extractor: EntityExtractor) -> None:
+        # Deeper than the default recursion limit
+        node = _make_node(NodeType.FUNCTION, name="leaf")
+        for _ in range(5000):
+            node = _make_node(NodeType.BLOCK, children=[node])
+        result = extractor.extract(_make_node(NodeType.MODULE, children=[node]), "test.py")
+        assert [e.name for e in result.entities] == ["test", "leaf"]
+        assert result.entities[1].parent_id == result.entities[0].id
+
+    def test_preserves_source_order(self, extractor: EntityExtractor) -> None:
+        method = _make_node(NodeType.METHOD, name="m")
+        cls = _make_node(NodeType.CLASS, name="A", children=[method])
+        func = _make_node(NodeType.FUNCTION, name="f")
+        root = _make_node(NodeType.MODULE, children=[cls, func])
+        result = extractor.extract(root, "test.py")
+        assert [e.name for e in result.entities] == ["test", "A", "m", "f"]
+        assert [r[2] for r in result.relationships] == [
+            RelationshipType.CONTAINS,
+            RelationshipType.HAS_METHOD,
+            RelationshipType.CONTAINS,
+        ]
+
+    def test_non_entity_nodes_skip_build(
+        self, extractor: EntityExtractor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        built = []
+        build = EntityExtractor._build_entity
+
+        def counting_build(self, node, entity_type, parent_id):  # type: ignore[no-untyped-def]
+            built.append(node.name)
+            return build(self, node, entity_type, parent_id)
+
+        monkeypatch.setattr(EntityExtractor, "_build_entity", counting_build)
+        call = _make_node(NodeType.CALL, children=[_make_node(NodeType.IDENTIFIER, name="g")])
+        block = _make_node(NodeType.BLOCK, children=[call, _make_node(NodeType.UNKNOWN)])
+        root = _make_node(NodeType.MODULE, children=[_make_node(NodeType.FUNCTION, name="f")])
+        root.children[0].add_child(block)
+        result = extractor.extract(root, "test.py")
+        assert built == [None, "f"]
+        assert [r[2] for r in result.relationships] == [
+            RelationshipType.CONTAINS,
+            RelationshipType.CALLS,
+        ]
+
 
 class TestEntityExtractorWithParsers:
     """Integration tests using real parsers."""
@@ -231,3 +337,51 @@ class TestEntityExtractorWithParsers:
         assert EntityType.MODULE in entity_types
         assert EntityType.CLASS in entity_types
         assert EntityType.FUNCTION in entity_types
+
+    def test_entities_share_path_and_language(
+        self, extractor: EntityExtractor, sample_python_file
+    ) -> None:
+        from src.parsing.python_parser import PythonParser
+
+        ast = PythonParser().parse_file(str(sample_python_file))
+        result = extractor.extract(ast, str(sample_python_file))
+
+        # One string object per file, not a copy per entity
+        assert len({id(e.location.file_path) for e in result.entities}) == 1
+        assert len({id(e.language) for e in result.entities}) == 1
+
+
+class TestPlanWalk:
+    """Tests for the traversal plan behind EntityExtractor._walk."""
+
+    @staticmethod
+    def _tree() -> ASTNode:
+        call = _make_node(NodeType.CALL, children=[_make_node(NodeType.IDENTIFIER, name="f")])
+        method = _make_node(NodeType.METHOD, name="m", children=[call])
+        block = _make_node(NodeType.BLOCK, children=[method])
+        cls = _make_node(NodeType.CLASS, name="A", children=[block])
+        func = _make_node(NodeType.FUNCTION, name="g")
+        return _make_node(NodeType.MODULE, children=[cls, func])
+
+    def test_plan_links_nearest_entity(self) -> None:
+        plan = entity_extractor._plan_walk(
+            self._tree(), entity_extractor._NODE_TO_ENTITY, NodeType.CALL
+        )
+        assert [(n.node_type, pos) for n, pos in plan] == [
+            (NodeType.MODULE, -1),
+            (NodeType.CLASS, 0),
+            (NodeType.METHOD, 1),
+            (NodeType.CALL, 2),
+            (NodeType.FUNCTION, 0),
+        ]
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("src.graph._fastextract") is None,
+        reason="Cython extension not built",
+    )
+    def test_compiled_plan_matches(self) -> None:
+        from src.graph._fastextract import plan_walk
+
+        root = self._tree()
+        args = (entity_extractor._NODE_TO_ENTITY, NodeType.CALL)
+        assert plan_walk(root, *args) == entity_extractor._plan_walk(root, *args)
@@ -1,10 +1,13 @@
 """Tests for GraphBuilder."""
 
+import copy
+import pickle
+
 import pytest
 
 from src.graph.graph_builder import GraphBuilder
 from src.graph.knowledge_graph import KnowledgeGraph
-from src.graph.relationship import RelationshipType
+from src.graph.relationship import RelationshipType, Unresolved
 from src.models.code_entity import EntityType
 from src.parsing.ast_nodes import ASTNode, NodeType
 
@@ -68,6 +71,47 @@ class TestGraphBuilder:
         classes = graph.get_entities_by_type(EntityType.CLASS)
         assert len(classes) == 2
 
+    def test_add_files_in_worker_processes(self) -> None:
+        files = []
+        for i in range(3):
+            call = _make_node(NodeType.CALL, children=[_make_node(NodeType.IDENTIFIER, name="f")])
+            func = _make_node(NodeType.FUNCTION, name=f"g{i}", children=[call])
+            files.append((_make_node(NodeType.MODULE, children=[func]), f"m{i}.py"))
+
+        sequential = GraphBuilder()
+        sequential.add_files(files)
+        parallel = GraphBuilder()
+        parallel.add_files(files, max_workers=2)
+        assert parallel.build().to_dict() == sequential.build().to_dict()
+        assert list(parallel.build().entities) == list(sequential.build().entities)
+
+    def test_ast_pickle_restores_parents(self) -> None:
+        leaf = _make_node(NodeType.IDENTIFIER, name="x")
+        root = _make_node(NodeType.MODULE, children=[_make_node(NodeType.BLOCK, children=[leaf])])
+        restored = pickle.loads(pickle.dumps(root))
+        block = restored.children[0]
+        assert restored.parent is None
+        assert block.parent is restored
+        assert block.children[0].parent is block
+        assert block.children[0].name == "x"
+
+    def test_ast_copy_keeps_original_parents(self) -> None:
+        class Node(ASTNode):
+            pass
+
+        leaf = _make_node(NodeType.IDENTIFIER, name="x")
+        root = Node(node_type=NodeType.MODULE, children=[leaf])
+        shallow = copy.copy(root)
+        assert type(shallow) is Node
+        assert shallow.children[0] is leaf
+        assert leaf.parent is root
+
+        deep = copy.deepcopy(root)
+        assert type(deep) is Node
+        assert deep.children[0] is not leaf
+        assert deep.children[0].parent is deep
+        assert leaf.parent is root
+
     def test_update_file(self, builder: GraphBuilder) -> None:
         root1 = _make_node(
             NodeType.MODULE,
@@ -132,6 +176,83 @@ class TestGraphBuilder:
         callees = graph.get_callees(foo_entities[0].id)
         assert len(callees) == 1
         assert callees[0].name == "bar"
+        assert graph.unresolved_targets() == []
+
+    def test_resolve_skips_ambiguous_and_unknown(self, builder: GraphBuilder) -> None:
+        graph = builder.build()
+        for file_path in ("a.py", "b.py"):
+            func = _make_node(NodeType.FUNCTION, name="dup")
+            builder.add_file(_make_node(NodeType.MODULE, children=[func]), file_path)
+        src = graph.get_entities_by_file("a.py")[0].id
+        graph.add_relationship(src, Unresolved("dup"), RelationshipType.CALLS)
+        graph.add_relationship(src, Unresolved("missing"), RelationshipType.CALLS)
+        edges = graph.relationship_count
+
+        builder.resolve_cross_file_references()
+        assert graph.relationship_count == edges
+        assert graph.unresolved_targets() == [Unresolved("dup"), Unresolved("missing")]
+
+    def test_resolve_keeps_edge_order(self, builder: GraphBuilder) -> None:
+        # class C(Zeta, Alpha) in c.py; both bases defined in other files
+        graph = builder.build()
+        for name in ("Zeta", "Alpha"):
+            cls = _make_node(NodeType.CLASS, name=name)
+            builder.add_file(_make_node(NodeType.MODULE, children=[cls]), f"{name.lower()}.py")
+        builder.add_file(_make_node(NodeType.MODULE, children=[_make_node(NodeType.CLASS)]), "c.py")
+        c_id = graph.get_entities_by_type(EntityType.CLASS)[-1].id
+        zeta = graph.get_entities_by_file("zeta.py")[-1].id
+        alpha = graph.get_entities_by_file("alpha.py")[-1].id
+        graph.add_relationship(c_id, Unresolved("Zeta"), RelationshipType.INHERITS)
+        graph.add_relationship(c_id, Unresolved("Missing"), RelationshipType.INHERITS)
+        graph.add_relationship(c_id, Unresolved("Alpha"), RelationshipType.INHERITS)
+        assert graph.unresolved_targets() == [
+            Unresolved("Zeta"),
+            Unresolved("Missing"),
+            Unresolved("Alpha"),
+        ]
+
+        builder.resolve_cross_file_references()
+        targets = [
+            t for _, t, _, _ in graph.get_relationships(c_id, rel_type=RelationshipType.INHERITS)
+        ]
+        assert targets == [zeta, Unresolved("Missing"), alpha]
+        assert [e.name for e in graph.get_inheritance_chain(c_id)] == ["Zeta"]
+        incoming = graph.get_relationships(
+            alpha, direction="incoming", rel_type=RelationshipType.INHERITS
+        )
+        assert [s for s, _, _, _ in incoming] == [c_id]
+        assert graph.unresolved_targets() == [Unresolved("Missing")]
+
+    def test_resolve_merges_with_existing_edge(self, builder: GraphBuilder) -> None:
+        graph = builder.build()
+        for file_path, name in (("a.py", "foo"), ("b.py", "bar"), ("c.py", "baz")):
+            func = _make_node(NodeType.FUNCTION, name=name)
+            builder.add_file(_make_node(NodeType.MODULE, children=[func]), file_path)
+        foo, bar, baz = (graph.get_entities_by_file(f)[-1].id for f in ("a.py", "b.py", "c.py"))
+        graph.add_relationship(foo, Unresolved("bar"), RelationshipType.CALLS)
+        graph.add_relationship(foo, baz, RelationshipType.USES)
+        graph.add_relationship(foo, bar, RelationshipType.USES)
+
+        builder.resolve_cross_file_references()
+        rels = graph.get_relationships(foo)
+        assert [(t, r) for _, t, r, _ in rels] == [
+            (bar, RelationshipType.CALLS),
+            (baz, RelationshipType.USES),
+        ]
+        assert graph.has_relationship(foo, bar, RelationshipType.CALLS)
+        assert graph.get_callers(bar)[0].id == foo
+
+    def test_resolve_is_noop_without_unresolved(
+        self, builder: GraphBuilder, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        builder.add_file(_make_node(NodeType.MODULE, children=[_make_node(NodeType.CLASS)]), "a.py")
+
+        def fail(self: KnowledgeGraph) -> None:
+            raise AssertionError("name index built without unresolved references")
+
+        # The early exit must skip building the name index entirely
+        monkeypatch.setattr(KnowledgeGraph, "entities", property(fail))
+        builder.resolve_cross_file_references()
 
     def test_build_returns_graph(self, builder: GraphBuilder) -> None:
         graph = builder.build()
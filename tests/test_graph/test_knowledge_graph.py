@@ -1,9 +1,11 @@
 """Tests for KnowledgeGraph."""
 
+import json
+
 import pytest
 
 from src.graph.knowledge_graph import KnowledgeGraph
-from src.graph.relationship import RelationshipType
+from src.graph.relationship import RelationshipType, Unresolved
 from src.models.code_entity import CodeEntity, EntityType
 from src.models.source_location import SourceLocation
 
@@ -91,6 +93,16 @@ class TestKnowledgeGraph:
         assert len(rels) == 1
         assert rels[0][1] == "f2"
 
+    def test_get_relationships_both_and_missing(self, graph: KnowledgeGraph) -> None:
+        graph.add_relationship("a", "b", RelationshipType.CALLS, {"k": 1})
+        graph.add_relationship("c", "a", RelationshipType.USES)
+        rels = graph.get_relationships("a", direction="both")
+        assert rels == [
+            ("a", "b", RelationshipType.CALLS, {"k": 1}),
+            ("c", "a", RelationshipType.USES, {}),
+        ]
+        assert graph.get_relationships("missing", direction="both") == []
+
 
 class TestKnowledgeGraphQueries:
     """Tests for structural query methods."""
@@ -174,6 +186,32 @@ class TestKnowledgeGraphFileOps:
         assert g.get_entity("c1") is None
         assert g.get_entity("c2") is not None
 
+    def test_file_index_follows_updates(self) -> None:
+        g = KnowledgeGraph()
+        g.add_entity(_make_entity("c1", "A", EntityType.CLASS, "a.py"))
+        g.add_entity(_make_entity("f1", "foo", EntityType.FUNCTION, "a.py"))
+        # Re-adding an ID under another file moves it between files
+        g.add_entity(_make_entity("c1", "A", EntityType.CLASS, "b.py"))
+        assert [e.id for e in g.get_entities_by_file("a.py")] == ["f1"]
+        assert [e.id for e in g.get_entities_by_file("b.py")] == ["c1"]
+        g.remove_file_entities("a.py")
+        assert g.get_entities_by_file("a.py") == []
+        assert g.get_entity("c1") is not None
+        g.remove_file_entities("missing.py")
+        assert g.entity_count == 1
+
+    def test_type_index_follows_updates(self) -> None:
+        g = KnowledgeGraph()
+        g.add_entity(_make_entity("x1", "A", EntityType.CLASS, "a.py"))
+        g.add_entity(_make_entity("f1", "foo", EntityType.FUNCTION, "b.py"))
+        # Re-adding an ID with another type moves it between types
+        g.add_entity(_make_entity("x1", "A", EntityType.INTERFACE, "a.py"))
+        assert g.get_entities_by_type(EntityType.CLASS) == []
+        assert [e.id for e in g.get_entities_by_type(EntityType.INTERFACE)] == ["x1"]
+        g.remove_file_entities("b.py")
+        assert g.get_entities_by_type(EntityType.FUNCTION) == []
+        assert g.count_entities_by_type() == {EntityType.INTERFACE: 1}
+
     def test_to_dict(self) -> None:
         g = KnowledgeGraph()
         g.add_entity(_make_entity("c1", "A", EntityType.CLASS))
@@ -183,6 +221,28 @@ class TestKnowledgeGraphFileOps:
         assert "c1" in d["entities"]
         assert "m1" in d["entities"]
         assert len(d["relationships"]) == 1
+        assert d["relationships"][0]["type"] == "has_method"
+
+    def test_to_dict_unresolved_target(self) -> None:
+        g = KnowledgeGraph()
+        g.add_entity(_make_entity("f1", "foo", EntityType.FUNCTION))
+        g.add_relationship("f1", Unresolved("bar"), RelationshipType.CALLS)
+        assert g.to_dict()["relationships"][0]["target"] == "unresolved:bar"
+        assert g.unresolved_targets() == [Unresolved("bar")]
+
+    def test_to_json_bytes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import src.graph.knowledge_graph as kg_module
+
+        g = KnowledgeGraph()
+        g.add_entity(_make_entity("c1", "Größe", EntityType.CLASS))
+        g.add_entity(_make_entity("m1", "foo", EntityType.METHOD))
+        g.add_relationship("c1", "m1", RelationshipType.HAS_METHOD)
+        g.add_relationship("m1", Unresolved("bar"), RelationshipType.CALLS)
+        encoded = g.to_json_bytes()
+        assert json.loads(encoded) == g.to_dict()
+
+        monkeypatch.setattr(kg_module, "orjson", None)
+        assert g.to_json_bytes() == encoded
 
     def test_merge(self) -> None:
         g1 = KnowledgeGraph()
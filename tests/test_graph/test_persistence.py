@@ -0,0 +1,104 @@
+"""Tests for graph persistence."""
+
+from typing import Any, Dict
+
+from src.graph.graph_builder import GraphBuilder
+from src.graph.persistence import InMemoryGraphStore
+from src.parsing.ast_nodes import ASTNode, NodeType
+
+
+def _make_node(node_type: NodeType, name: str = None, children: list = None) -> ASTNode:
+    """Helper to create ASTNode for testing."""
+    node = ASTNode(
+        node_type=node_type,
+        name=name,
+        source_text="",
+        start_line=1,
+        end_line=5,
+        start_column=0,
+        end_column=0,
+        language="python",
+    )
+    for child in children or []:
+        node.add_child(child)
+    return node
+
+
+def _module(func_name: str, callee: str) -> ASTNode:
+    call = _make_node(NodeType.CALL, children=[_make_node(NodeType.IDENTIFIER, name=callee)])
+    func = _make_node(NodeType.FUNCTION, name=func_name, children=[call])
+    return _make_node(NodeType.MODULE, children=[func])
+
+
+def _normalized(data: Dict[str, Any]) -> Dict[str, Any]:
+    rels = sorted(data["relationships"], key=lambda r: (r["source"], r["target"], r["type"]))
+    return {"entities": data["entities"], "relationships": rels}
+
+
+class TestInMemoryGraphStore:
+    """Tests for the in-memory store."""
+
+    def test_update_file_matches_full_save(self) -> None:
+        builder = GraphBuilder()
+        builder.add_files([(_module("foo", "bar"), "a.py"), (_module("bar", "foo"), "b.py")])
+        builder.resolve_cross_file_references()
+        store = InMemoryGraphStore()
+        store.save(builder.build())
+
+        builder.update_file(_module("baz", "foo"), "b.py")
+        builder.resolve_cross_file_references()
+        graph = builder.build()
+        store.update_file(graph, "b.py")
+
+        expected = InMemoryGraphStore()
+        expected.save(graph)
+        assert _normalized(store.stored_data) == _normalized(expected.stored_data)
+
+    def test_update_file_drops_resolved_unresolved_edges(self) -> None:
+        # b.py calls foo before a.py defines it
+        builder = GraphBuilder()
+        builder.add_files([(_module("bar", "baz"), "a.py"), (_module("qux", "foo"), "b.py")])
+        builder.resolve_cross_file_references()
+        store = InMemoryGraphStore()
+        store.save(builder.build())
+
+        builder.update_file(_module("foo", "baz"), "a.py")
+        builder.resolve_cross_file_references()
+        graph = builder.build()
+        store.update_file(graph, "a.py")
+
+        expected = InMemoryGraphStore()
+        expected.save(graph)
+        targets = {r["target"] for r in store.stored_data["relationships"]}
+        assert "unresolved:foo" not in targets
+        assert _normalized(store.stored_data) == _normalized(expected.stored_data)
+
+    def test_update_file_refreshes_edges_resolved_outside_file(self) -> None:
+        # dup is ambiguous until b.py drops its definition
+        builder = GraphBuilder()
+        builder.add_files(
+            [
+                (_module("dup", "x"), "a.py"),
+                (_module("dup", "y"), "b.py"),
+                (_module("caller", "dup"), "c.py"),
+            ]
+        )
+        builder.resolve_cross_file_references()
+        store = InMemoryGraphStore()
+        store.save(builder.build())
+
+        builder.update_file(_module("other", "y"), "b.py")
+        builder.resolve_cross_file_references()
+        graph = builder.build()
+        store.update_file(graph, "b.py")
+
+        expected = InMemoryGraphStore()
+        expected.save(graph)
+        assert _normalized(store.stored_data) == _normalized(expected.stored_data)
+
+    def test_update_file_without_snapshot_saves(self) -> None:
+        builder = GraphBuilder()
+        builder.add_file(_module("foo", "bar"), "a.py")
+        store = InMemoryGraphStore()
+        store.update_file(builder.build(), "a.py")
+        assert store.stored_data == builder.build().to_dict()
@@ -0,0 +1,38 @@
+"""Tests for the command-line entry point."""
+
+from src.analysis.taint import TaintFlow, TaintSink, TaintSource
+from src.main import _render, _summarize
+from src.pipeline.pipeline import AnalysisPipeline
+
+
+class TestSummary:
+
+    def test_summarize_and_render(self, sample_python_file, capsys) -> None:
+        result = AnalysisPipeline().analyze_file(str(sample_python_file))
+        summary = _summarize(result)
+
+        assert summary["files_processed"] == 1
+        assert summary["entities_found"] == result.entities_found
+        assert summary["entity_counts"]["class"] >= 1
+        assert summary["max_complexity"] >= summary["avg_complexity"] >= 1
+
+        _render(summary, "sample.py")
+        out = capsys.readouterr().out
+        assert "=== Analysis Results for sample.py ===" in out
+        assert f"Entities found:     {result.entities_found}" in out
+
+    def test_summarize_taint_flows(self, sample_python_file) -> None:
+        result = AnalysisPipeline().analyze_file(str(sample_python_file))
+        source = TaintSource("user_input", "input", "user_input")
+        sink = TaintSink("sql_exec", "execute", "sql_injection")
+        result.taint_flows = [TaintFlow(source, sink, sanitized=i == 0) for i in range(8)]
+
+        summary = _summarize(result)
+        assert summary["taint_flows"] == 8
+        assert summary["unsanitized"] == 7
+        assert len(summary["unsanitized_flows"]) == 5
+        assert summary["unsanitized_flows"][0] == {
+            "vulnerability": "sql_injection",
+            "source": "user_input",
+            "sink": "sql_exec",
+        }
@@ -78,6 +78,25 @@ class TestEntityMetricsCalculator:
         m = calc.compute(node, "f1")
         assert m.cyclomatic_complexity == 4
 
+    def test_cyclomatic_complexity_boolean_operators(self, calc: EntityMetricsCalculator) -> None:
+        # (a && b) + s where s is the string "x || y": one boolean operator
+        def op(token: str) -> ASTNode:
+            return _make_node(NodeType.UNKNOWN, attributes={"ts_type": token})
+
+        inner = _make_node(
+            NodeType.BINARY_OP,
+            source_text="a && b",
+            children=[_make_node(NodeType.IDENTIFIER), op("&&"), _make_node(NodeType.IDENTIFIER)],
+        )
+        outer = _make_node(
+            NodeType.BINARY_OP,
+            source_text='(a && b) + "x || y"',
+            children=[inner, op("+"), _make_node(NodeType.LITERAL, source_text='"x || y"')],
+        )
+        node = _make_node(NodeType.FUNCTION, children=[outer])
+        m = calc.compute(node, "f1")
+        assert m.cyclomatic_complexity == 2
+
     def test_nesting_depth(self, calc: EntityMetricsCalculator) -> None:
         # if -> for (nested)
         inner_for = _make_node(NodeType.FOR, start_line=3, end_line=4)
@@ -97,6 +116,18 @@ class TestEntityMetricsCalculator:
         m = calc.compute(node, "f1")
         assert m.nesting_depth_max == 2
 
+    def test_nesting_depth_avg(self, calc: EntityMetricsCalculator) -> None:
+        # Branch depths 1, 2, 3 and 1
+        chain = _make_node(
+            NodeType.IF,
+            children=[_make_node(NodeType.FOR, children=[_make_node(NodeType.WHILE)])],
+        )
+        node = _make_node(NodeType.FUNCTION, children=[chain, _make_node(NodeType.TRY)])
+        m = calc.compute(node, "f1")
+        assert m.nesting_depth_max == 3
+        assert m.nesting_depth_avg == 1.75
+        assert calc.compute(_make_node(NodeType.FUNCTION), "f2").nesting_depth_avg == 0.0
+
     def test_parameter_count(self, calc: EntityMetricsCalculator) -> None:
         node = _make_node(
             NodeType.FUNCTION,
@@ -197,6 +228,55 @@ class TestEntityMetricsCalculator:
         m = calc.compute(node, "f1")
         assert m.lines_of_code == 0
 
+    def test_logical_lines_through_blocks(self, calc: EntityMetricsCalculator) -> None:
+        # Statements inside blocks count; nested statements do not
+        inner_if = _make_node(NodeType.IF, children=[_make_node(NodeType.RETURN)])
+        block = _make_node(
+            NodeType.BLOCK,
+            children=[inner_if, _make_node(NodeType.COMMENT), _make_node(NodeType.CALL)],
+        )
+        node = _make_node(NodeType.FUNCTION, children=[_make_node(NodeType.PARAMETER), block])
+        m = calc.compute(node, "f1")
+        assert m.logical_lines == 3
+        assert m.comment_count == 1
+
+    def test_deeply_nested_branches(self, calc: EntityMetricsCalculator) -> None:
+        # Deeper than the default recursion limit
+        node = _make_node(NodeType.RETURN)
+        for _ in range(5000):
+            node = _make_node(NodeType.IF, children=[node])
+        m = calc.compute(_make_node(NodeType.FUNCTION, children=[node]), "f1")
+        assert m.nesting_depth_max == 5000
+        assert m.cyclomatic_complexity == 5001
+        assert m.return_count == 1
+
+    def test_compute_nested_matches_compute(self, calc: EntityMetricsCalculator) -> None:
+        # Class with a method nested under an if; the module contains both
+        def boolean_op() -> ASTNode:
+            return _make_node(
+                NodeType.BINARY_OP,
+                children=[_make_node(NodeType.UNKNOWN, attributes={"ts_type": "or"})],
+            )
+
+        method = _make_node(
+            NodeType.METHOD,
+            children=[
+                _make_node(NodeType.PARAMETER),
+                _make_node(NodeType.FOR, children=[_make_node(NodeType.IF), boolean_op()]),
+            ],
+        )
+        cls = _make_node(NodeType.CLASS, children=[_make_node(NodeType.IF, children=[method])])
+        module = _make_node(
+            NodeType.MODULE, children=[_make_node(NodeType.WHILE), cls, _make_node(NodeType.CALL)]
+        )
+
+        entities = [(module, "mod"), (cls, "cls"), (method, "meth")]
+        nested = calc.compute_nested(entities)
+        assert list(nested) == ["mod", "cls", "meth"]
+        for node, entity_id in entities:
+            assert nested[entity_id] == calc.compute(node, entity_id)
+        assert nested["mod"].nesting_depth_max == 3
+
 
 class TestEntityMetricsWithParser:
     """Integration test using real parser output."""
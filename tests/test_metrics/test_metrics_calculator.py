@@ -0,0 +1,76 @@
+"""Tests for the MetricsCalculator facade."""
+
+import pytest
+
+from src.analysis.cache import AnalysisCache
+from src.graph.graph_builder import GraphBuilder
+from src.metrics.entity_metrics import EntityMetricsCalculator
+from src.metrics.metrics_calculator import MetricsCalculator, _index_ast_by_line
+from src.parsing.ast_nodes import ASTNode, NodeType
+
+
+def _module(func_name: str, branches: int) -> ASTNode:
+    func = ASTNode(node_type=NodeType.FUNCTION, name=func_name, start_line=2, end_line=9)
+    for _ in range(branches):
+        func.add_child(ASTNode(node_type=NodeType.IF, start_line=3, end_line=4))
+    return ASTNode(node_type=NodeType.MODULE, start_line=1, end_line=9, children=[func])
+
+
+class TestMetricsCalculator:
+
+    def test_line_index_tracks_replaced_root(self) -> None:
+        calc = MetricsCalculator()
+        builder = GraphBuilder()
+        root = _module("f", 1)
+        builder.add_file(root, "a.py")
+        first = calc.compute_all(builder.build(), {"a.py": root})
+        again = calc.compute_all(builder.build(), {"a.py": root})
+        assert again.entity_metrics == first.entity_metrics
+
+        new_root = _module("g", 2)
+        builder.update_file(new_root, "a.py")
+        result = calc.compute_all(builder.build(), {"a.py": new_root})
+        complexities = sorted(m.cyclomatic_complexity for m in result.entity_metrics.values())
+        assert complexities == [3, 3]
+
+    def test_worker_processes_match_serial(self) -> None:
+        builder = GraphBuilder()
+        ast_map = {f"m{i}.py": _module(f"f{i}", i) for i in range(3)}
+        for file_path, root in ast_map.items():
+            builder.add_file(root, file_path)
+        graph = builder.build()
+
+        serial = MetricsCalculator().compute_all(graph, ast_map)
+        parallel = MetricsCalculator().compute_all(graph, ast_map, max_workers=2)
+        assert parallel.entity_metrics == serial.entity_metrics
+        assert list(parallel.entity_metrics) == list(serial.entity_metrics)
+
+    def test_index_ast_by_line(self) -> None:
+        # Deeper than the default recursion limit
+        leaf = ASTNode(node_type=NodeType.FIELD, name="x", start_line=2)
+        node = leaf
+        for _ in range(5000):
+            node = ASTNode(node_type=NodeType.BLOCK, start_line=2, children=[node])
+        method = ASTNode(node_type=NodeType.METHOD, name="m", start_line=2, children=[node])
+        root = ASTNode(node_type=NodeType.MODULE, start_line=1, children=[method])
+        # Non-significant blocks are skipped; on a shared line the last
+        # node in pre-order wins, as with the previous recursive walk
+        assert _index_ast_by_line(root) == {1: root, 2: leaf}
+
+    def test_cached_metrics_skip_recompute(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        builder = GraphBuilder()
+        ast_map = {"a.py": _module("f", 1), "b.py": _module("g", 2)}
+        for file_path, root in ast_map.items():
+            builder.add_file(root, file_path)
+        graph = builder.build()
+        cache = AnalysisCache(":memory:")
+        digests = {"a.py": b"a1", "b.py": b"b1"}
+        cold = MetricsCalculator(cache).compute_all(graph, ast_map, digests=digests)
+
+        def fail(self, node, entity_id):  # type: ignore[no-untyped-def]
+            raise AssertionError("metrics recomputed for an unchanged file")
+
+        monkeypatch.setattr(EntityMetricsCalculator, "compute", fail)
+        warm = MetricsCalculator(cache).compute_all(graph, ast_map, digests=digests)
+        assert warm.entity_metrics == cold.entity_metrics
+        assert list(warm.entity_metrics) == list(cold.entity_metrics)
@@ -1,9 +1,12 @@
 """Tests for StructuralMetricsCalculator."""
 
+import numpy as np
 import pytest
 
 from src.graph.knowledge_graph import KnowledgeGraph
-from src.graph.relationship import RelationshipType
+from src.graph.relationship import RelationshipType, Unresolved
+from src.metrics import structural_metrics
+from src.metrics._kernels import _shared_pairs_loop, _shared_pairs_py
 from src.metrics.structural_metrics import (
     StructuralMetrics,
     StructuralMetricsCalculator,
@@ -91,6 +94,27 @@ class TestStructuralMetricsCalculator:
         m = calc.compute(g, "c3")
         assert m.depth_of_inheritance == 2
 
+    def test_dit_precomputed_matches_chain(self, calc: StructuralMetricsCalculator) -> None:
+        rng = np.random.default_rng(1)
+        g = KnowledgeGraph()
+        for i in range(40):
+            g.add_entity(_make_entity(f"c{i}", f"C{i}", EntityType.CLASS))
+        for i in range(40):
+            # Random first parents give chains, shared ancestors and cycles;
+            # some point at unresolved names or at nodes with no entity
+            choice = int(rng.integers(0, 44))
+            if choice < 40:
+                g.add_relationship(f"c{i}", f"c{choice}", RelationshipType.INHERITS)
+            elif choice < 42:
+                g.add_relationship(f"c{i}", Unresolved("Base"), RelationshipType.INHERITS)
+            elif choice == 42:
+                g.add_relationship(f"c{i}", "ghost", RelationshipType.INHERITS)
+
+        all_metrics = calc.compute_all(g)
+        for i in range(40):
+            expected = len(g.get_inheritance_chain(f"c{i}"))
+            assert all_metrics[f"c{i}"].depth_of_inheritance == expected
+
     def test_noc(self, calc: StructuralMetricsCalculator) -> None:
         g = KnowledgeGraph()
         g.add_entity(_make_entity("c1", "Base", EntityType.CLASS))
@@ -136,6 +160,44 @@ class TestStructuralMetricsCalculator:
         m = calc.compute(g, "c1")
         assert m.lack_of_cohesion == 1.0
 
+    def test_lcom_numpy_matches_pairwise(
+        self, calc: StructuralMetricsCalculator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        g = KnowledgeGraph()
+        g.add_entity(_make_entity("c1", "A", EntityType.CLASS))
+        for i in range(4):
+            g.add_entity(_make_entity(f"f{i}", f"x{i}", EntityType.FIELD))
+            g.add_relationship("c1", f"f{i}", RelationshipType.HAS_FIELD)
+        for i in range(12):
+            g.add_entity(_make_entity(f"m{i}", f"get{i}", EntityType.METHOD))
+            g.add_relationship("c1", f"m{i}", RelationshipType.HAS_METHOD)
+            # Every third method touches no field at all
+            if i % 3:
+                g.add_relationship(f"m{i}", f"f{i % 4}", RelationshipType.USES)
+
+        pairwise = calc.compute(g, "c1").lack_of_cohesion
+        monkeypatch.setattr(structural_metrics, "_LCOM_NUMPY_MIN_METHODS", 2)
+        assert calc.compute(g, "c1").lack_of_cohesion == pairwise
+        assert 0.0 < pairwise < 1.0
+
+    def test_lcom_many_fields(self, calc: StructuralMetricsCalculator) -> None:
+        # Field bitmasks wider than 64 bits
+        g = KnowledgeGraph()
+        g.add_entity(_make_entity("c1", "A", EntityType.CLASS))
+        for i in range(70):
+            g.add_entity(_make_entity(f"f{i}", f"x{i}", EntityType.FIELD))
+            g.add_relationship("c1", f"f{i}", RelationshipType.HAS_FIELD)
+        for i in range(3):
+            g.add_entity(_make_entity(f"m{i}", f"get{i}", EntityType.METHOD))
+            g.add_relationship("c1", f"m{i}", RelationshipType.HAS_METHOD)
+        g.add_relationship("m0", "f69", RelationshipType.USES)
+        g.add_relationship("m1", "f69", RelationshipType.USES)
+        g.add_relationship("m2", "f5", RelationshipType.USES)
+
+        # One sharing pair, two disjoint: (2 - 1) / 3
+        m = calc.compute(g, "c1")
+        assert m.lack_of_cohesion == pytest.approx(1 / 3)
+
     def test_compute_all(self, calc: StructuralMetricsCalculator) -> None:
         g = KnowledgeGraph()
         g.add_entity(_make_entity("c1", "A", EntityType.CLASS))
@@ -151,3 +213,14 @@ class TestStructuralMetricsCalculator:
         assert m.afferent_coupling == 0
         assert m.efferent_coupling == 0
         assert m.instability == 0.0
+
+
+class TestSharedPairsKernel:
+
+    def test_loop_kernel_matches_numpy(self) -> None:
+        rng = np.random.default_rng(0)
+        access = rng.random((30, 6)) < 0.2
+        access[3] = False  # a method using no field shares with nobody
+        assert _shared_pairs_loop(access) == _shared_pairs_py(access)
+        assert _shared_pairs_py(np.eye(4, dtype=bool)) == 0
+        assert _shared_pairs_py(np.ones((4, 2), dtype=bool)) == 6
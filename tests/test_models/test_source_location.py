@@ -1,5 +1,7 @@
 """Tests for SourceLocation model."""
 
+import random
+
 import pytest
 from pydantic import ValidationError
 from src.models.source_location import SourceLocation
@@ -116,3 +118,40 @@ class TestSourceLocation:
         assert "42" in string_repr
         assert "58" in string_repr
         assert "calculate_total" in string_repr
+
+    def test_frozen_and_hashable(self):
+        """Test that locations are immutable and usable as keys."""
+        loc = SourceLocation(file_path="test.py", start_line=10, end_line=20)
+        same = SourceLocation(file_path="test.py", start_line=10, end_line=20)
+
+        assert hash(loc) == hash(same)
+        assert len({loc, same}) == 1
+
+        with pytest.raises(ValidationError):
+            loc.start_line = 5
+
+    def test_contains_is_lexicographic(self):
+        """Test that contains orders (line, column) pairs lexicographically."""
+        rng = random.Random(0)
+
+        def random_location() -> SourceLocation:
+            start_line = rng.randint(1, 4)
+            end_line = rng.randint(start_line, 5)
+            start_column = rng.randint(0, 4)
+            end_column = rng.randint(start_column if end_line == start_line else 0, 5)
+            return SourceLocation(
+                file_path=rng.choice(["a.py", "b.py"]),
+                start_line=start_line,
+                end_line=end_line,
+                start_column=start_column,
+                end_column=end_column,
+            )
+
+        for _ in range(2000):
+            outer, inner = random_location(), random_location()
+            expected = (
+                outer.file_path == inner.file_path
+                and (outer.start_line, outer.start_column) <= (inner.start_line, inner.start_column)
+                and (inner.end_line, inner.end_column) <= (outer.end_line, outer.end_column)
+            )
+            assert outer.contains(inner) == expected
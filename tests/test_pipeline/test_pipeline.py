@@ -2,6 +2,7 @@
 
 import pytest
 
+from src.analysis.cache import AnalysisCache
 from src.pipeline.pipeline import AnalysisPipeline, PipelineResult
 from src.pipeline.storage import InMemoryStorage
 from src.models.code_entity import EntityType
@@ -56,6 +57,55 @@ class TestAnalysisPipeline:
         # Should have CFGs for function-like entities
         assert len(result.cfgs) > 0
 
+    def test_analyze_with_analysis_cache(self, sample_python_file, tmp_path) -> None:
+        db = str(tmp_path / "analysis.db")
+        cold = AnalysisPipeline(analysis_cache=AnalysisCache(db)).analyze_file(
+            str(sample_python_file)
+        )
+        warm = AnalysisPipeline(analysis_cache=AnalysisCache(db)).analyze_file(
+            str(sample_python_file)
+        )
+
+        uncached = AnalysisPipeline().analyze_file(str(sample_python_file))
+        assert set(cold.cfgs) == set(warm.cfgs) == set(uncached.cfgs)
+        for eid, cfg in warm.cfgs.items():
+            assert cfg.block_count == uncached.cfgs[eid].block_count
+            assert cfg.edge_count == uncached.cfgs[eid].edge_count
+        assert warm.entity_metrics == cold.entity_metrics == uncached.entity_metrics
+
+    def test_analysis_cache_reads_each_file_once(self, sample_python_file, monkeypatch) -> None:
+        import builtins
+
+        from src.analysis.cache import file_digest
+
+        opened = []
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            if str(file) == str(sample_python_file):
+                opened.append(file)
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+        pipeline = AnalysisPipeline(analysis_cache=AnalysisCache(":memory:"))
+        pipeline.analyze_file(str(sample_python_file))
+        assert len(opened) == 1
+        expected = file_digest(sample_python_file.read_bytes())
+        assert pipeline._file_digests[str(sample_python_file)] == expected
+
+    def test_build_file_cfgs_on_deep_ast(self) -> None:
+        from src.parsing.ast_nodes import ASTNode, NodeType
+
+        # Deeper than the default recursion limit
+        node = ASTNode(NodeType.FUNCTION, name="inner", start_line=2)
+        for _ in range(5000):
+            node = ASTNode(NodeType.BLOCK, children=[node])
+        outer = ASTNode(NodeType.FUNCTION, name="outer", start_line=1, children=[node])
+        pipeline = AnalysisPipeline()
+        pipeline._ast_map["deep.py"] = ASTNode(NodeType.MODULE, children=[outer])
+        cfgs = pipeline._build_file_cfgs("deep.py")
+        assert [cfgs[line].function_name for line in cfgs] == ["outer", "inner"]
+
     def test_analyze_with_storage(self, sample_python_file) -> None:
         storage = InMemoryStorage()
         pipeline = AnalysisPipeline(storage=storage)
@@ -86,6 +136,34 @@ class TestAnalysisPipeline:
         result = pipeline.analyze_file(str(txt_file))
         assert result.files_processed == 0
 
+    def test_parsers_created_once_per_language(self) -> None:
+        from src.parsing.java_parser import JavaParser
+        from src.parsing.javascript_parser import TypeScriptParser
+
+        pipeline = AnalysisPipeline()
+        parser = pipeline._select_parser("a.py")
+        assert parser is not None
+        assert pipeline._select_parser("pkg/b.py") is parser
+        assert isinstance(pipeline._select_parser("c.ts"), TypeScriptParser)
+        assert isinstance(pipeline._select_parser("D.java"), JavaParser)
+        assert pipeline._select_parser("e.txt") is None
+
+    def test_parser_unavailable_is_skipped(self, sample_python_file, monkeypatch) -> None:
+        from src.parsing import python_parser
+
+        def missing_backend(self) -> None:
+            raise ImportError("tree-sitter not installed")
+
+        monkeypatch.setattr(python_parser.PythonParser, "__init__", missing_backend)
+        pipeline = AnalysisPipeline()
+        result = pipeline.analyze_file(str(sample_python_file))
+        assert result.files_processed == 0
+        assert "python" not in pipeline._parsers
+
+        # Not cached as missing: a later call can still create the parser
+        monkeypatch.undo()
+        assert pipeline._select_parser("a.py") is not None
+
 
 class TestPipelineIncremental:
 
@@ -106,3 +184,37 @@ class TestPipelineIncremental:
 
         result2 = pipeline.update_file(str(temp_file), result1)
         assert result2.entities_found >= original_count
+
+    def test_update_file_with_analysis_cache(self, sample_python_file, tmp_path) -> None:
+        import shutil
+
+        temp_file = tmp_path / "sample.py"
+        shutil.copy(sample_python_file, temp_file)
+
+        pipeline = AnalysisPipeline(analysis_cache=AnalysisCache(":memory:"))
+        result = pipeline.analyze_file(str(temp_file))
+        with open(temp_file, "a") as f:
+            f.write("\n\ndef new_function():\n    return 42\n")
+        result = pipeline.update_file(str(temp_file), result)
+
+        # The changed file gets a new digest, so its metrics are recomputed
+        new_ids = [e.id for e in result.graph.entities.values() if e.name == "new_function"]
+        assert len(new_ids) == 1
+        assert result.entity_metrics[new_ids[0]].return_count == 1
+
+    def test_find_ast_node_reindexes_changed_file(self, tmp_path) -> None:
+        from src.parsing.ast_nodes import NodeType
+
+        path = tmp_path / "mod.py"
+        path.write_text("def first():\n    return 1\n")
+        pipeline = AnalysisPipeline()
+        pipeline.analyze_file(str(path))
+        node = pipeline._find_ast_node(str(path), 1)
+        assert node is not None and node.node_type == NodeType.FUNCTION
+        assert pipeline._find_ast_node(str(path), 2) is None
+
+        path.write_text("x = 1\n\ndef second():\n    return 2\n")
+        result = pipeline.analyze_file(str(path))
+        assert pipeline._find_ast_node(str(path), 1) is None
+        assert pipeline._find_ast_node(str(path), 3).name == "second"
+        assert len(result.cfgs) == 1